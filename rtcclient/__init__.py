@@ -26,3 +26,4 @@ except ImportError:  # pragma no cover
         OrderedDict = dict
 
 from rtcclient.client import RTCClient  # noqa: F401
+from rtcclient.async_client import AsyncRTCClient  # noqa: F401
@@ -0,0 +1,889 @@
+import asyncio
+import collections
+import copy
+import logging
+
+import six
+
+try:
+    import aiohttp
+except ImportError:  # pragma no cover
+    aiohttp = None
+
+from rtcclient import exception
+from rtcclient import urlparse, urlquote
+from rtcclient.base import RTCBase, get_local_link_title
+from rtcclient.cache import TTLCache
+from rtcclient.client import RTCClient
+from rtcclient.models import Comment
+from rtcclient.parser import get_parser
+from rtcclient.project_area import index_projectareas
+from rtcclient.template import Templater
+from rtcclient.utils import is_token_expired, _is_login_request
+from rtcclient.workitem import Workitem
+
+_UNRESOLVED = object()
+
+_Response = collections.namedtuple("_Response",
+                                   ["url", "status_code", "headers", "content"])
+
+# the keywords which are rendered with the url of the resource
+# titled with the input value
+_KEYWORD_RESOURCES = {
+    "severity": "Severity",
+    "priority": "Priority",
+    "plannedFor": "PlannedFor",
+    "filedAgainst": "FiledAgainst",
+    "foundIn": "FoundIn",
+    "teamArea": "TeamArea"
+}
+
+
+class AsyncRTCClient(RTCBase):
+    """An asyncio-native client to perform the core operations of
+    :class:`rtcclient.client.RTCClient` concurrently in a single thread
+
+    All the operations are coroutines sharing one connection-pooled HTTP
+    session, and the number of the requests in flight is bounded. It
+    returns the same resource objects (e.g.
+    :class:`rtcclient.workitem.Workitem`) as
+    :class:`rtcclient.client.RTCClient`, with all the linked fields
+    resolved. They are bound to :attr:`sync_client`, which shares the
+    cookies and the resource cache, so that their methods (e.g.
+    :meth:`rtcclient.workitem.Workitem.getComments`) are the blocking calls
+    of :class:`rtcclient.client.RTCClient`.
+
+    It requires the `aiohttp` package, which can be installed with
+    `pip install rtcclient[async]`.
+
+    Usage::
+
+        async with AsyncRTCClient(url, username, password) as myclient:
+            workitem = await myclient.getWorkitem(123456)
+
+    :param url: the rtc url (e.g. https://your_domain:9443/jazz)
+    :param username: the rtc username
+    :param password: the rtc password
+    :param proxies: (optional) Dictionary mapping protocol to the URL of
+            the proxy.
+    :param searchpath: (optional) the folder to store your templates.
+        If `None`, the default search path
+        (/your/site-packages/rtcclient/templates) will be loaded.
+    :param ends_with_jazz: (optional but important) Set to `True` (default) if
+        the url ends with 'jazz', otherwise to `False` if with 'ccm'
+        (Refer to issue #68 for details)
+    :type ends_with_jazz: bool
+    :param pool_maxsize: (optional) the maximum number of connections
+        opened to the RTC server. Default is 10
+    :param max_concurrency: (optional) the maximum number of requests in
+        flight at the same time. If `None`, it is set to `pool_maxsize`
+    :param cache_size: (optional) the maximum number of the linked resources
+        whose titles are cached. Set to `0` to disable the cache.
+        Default is 1024
+    :param cache_ttl: (optional) the seconds a cached title stays valid.
+        Set to `None` to never expire. Default is 600
+    :param timeout: (optional) the seconds to wait for each request.
+        Default is 60
+    :param projectarea_ttl: (optional) the seconds the fetched project areas
+        are kept to look up their ids and names. Set to `None` to keep them
+        until :meth:`refreshProjectAreas` is called, or to `0` to always
+        fetch them from the server. Default is 600
+    :param xml_parser: (optional) the backend to parse the XML responses:
+        `xmltodict` (default) or `lxml`, which is faster on the large
+        collections. An object that has a `parse` method returning the same
+        trees as :func:`xmltodict.parse` is also accepted
+    """
+
+    log = logging.getLogger("async_client.AsyncRTCClient")
+
+    # the parts independent of the I/O are shared with RTCClient
+    _get_headers = RTCClient._get_headers
+    _add_filter_rule = RTCClient._add_filter_rule
+    _validate_workitem_id = RTCClient._validate_workitem_id
+    _validate_returned_properties = RTCClient._validate_returned_properties
+    _findMissingParams = RTCClient._findMissingParams
+    _get_paged_resources_url = RTCClient._get_paged_resources_url
+    _get_resource_entry_handler = RTCClient._get_resource_entry_handler
+    _get_page_entries = RTCClient._get_page_entries
+    _handle_rdf_raw = RTCClient._handle_rdf_raw
+    _handle_rdf_entry = RTCClient._handle_rdf_entry
+
+    def __init__(self,
+                 url,
+                 username,
+                 password,
+                 proxies=None,
+                 searchpath=None,
+                 ends_with_jazz=True,
+                 pool_maxsize=10,
+                 max_concurrency=None,
+                 cache_size=1024,
+                 cache_ttl=600,
+                 timeout=60,
+                 xml_parser=None,
+                 projectarea_ttl=600):
+        """Initialization
+
+        See params above. No request is sent until :meth:`login` is
+        awaited.
+        """
+
+        if aiohttp is None:
+            excp_msg = ("Please install aiohttp to use AsyncRTCClient: "
+                        "pip install rtcclient[async]")
+            self.log.error(excp_msg)
+            raise exception.RTCException(excp_msg)
+
+        self.username = username
+        self.password = password
+        self.proxies = proxies
+        RTCBase.__init__(self, url)
+
+        if not isinstance(ends_with_jazz, bool):
+            raise exception.BadValue("ends_with_jazz is not boolean")
+
+        self.jazz = ends_with_jazz
+        self.parser = get_parser(xml_parser)
+        self.pool_maxsize = pool_maxsize
+        self.max_concurrency = (pool_maxsize
+                                if max_concurrency is None else max_concurrency)
+        self.timeout = timeout
+        self.resource_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        # one snapshot for the archived and the unarchived project areas,
+        # like rtcclient.project_area.ProjectAreaRegistry
+        self._projectarea_snapshots = TTLCache(
+            maxsize=2 if projectarea_ttl != 0 else 0, ttl=projectarea_ttl)
+        self.headers = self._get_headers()
+        self.cookies = None
+        self.searchpath = searchpath
+        self.templater = Templater(self, searchpath=self.searchpath)
+        # the asyncio objects are created in the running event loop
+        self._session = None
+        self._semaphore = None
+        self._relogin_lock = None
+        self._resolving_titles = dict()
+        self._loading_projectareas = dict()
+        self._sync_client = None
+
+    def __str__(self):
+        return "RTC Server at %s" % self.url
+
+    def get_rtc_obj(self):
+        return self
+
+    @property
+    def sync_client(self):
+        """The :class:`rtcclient.client.RTCClient` bound to the returned
+        objects, which is created on the first use without another login
+
+        It shares the cookies, the XML parser and the resource cache of
+        this client. Its methods are blocking, so they should not be called
+        in the running event loop.
+        """
+
+        if self._sync_client is None:
+            self.log.debug("Create the sync client for %s", self.url)
+            sync_client = RTCClient(
+                self.url,
+                self.username,
+                self.password,
+                proxies=self.proxies,
+                searchpath=self.searchpath,
+                ends_with_jazz=self.jazz,
+                pool_maxsize=self.pool_maxsize,
+                xml_parser=self.parser,
+                cookies=dict() if self.cookies is None else self.cookies)
+            sync_client.resource_cache = self.resource_cache
+            self._sync_client = sync_client
+        return self._sync_client
+
+    def _raise_sync_only(self, name):
+        excp_msg = ("AsyncRTCClient.%s is not a coroutine. Please call it on "
+                    "AsyncRTCClient.sync_client instead" % name)
+        self.log.error(excp_msg)
+        raise exception.RTCException(excp_msg)
+
+    # the blocking requests of RTCBase are only sent by the sync client
+    def get(self, *args, **kwargs):
+        self._raise_sync_only("get")
+
+    def post(self, *args, **kwargs):
+        self._raise_sync_only("post")
+
+    def put(self, *args, **kwargs):
+        self._raise_sync_only("put")
+
+    def delete(self, *args, **kwargs):
+        self._raise_sync_only("delete")
+
+    def _handle_resource_entry(self, resource_name, entry, **kwargs):
+        # the objects are bound to the sync client, whose methods they call
+        return RTCClient._handle_resource_entry(self.sync_client,
+                                                resource_name, entry,
+                                                **kwargs)
+
+    async def __aenter__(self):
+        await self.login()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _get_http_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_maxsize, ssl=False)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._relogin_lock = asyncio.Lock()
+        return self._session
+
+    async def close(self):
+        """Close the HTTP session and release all the pooled connections
+
+        """
+
+        if self._session is not None:
+            self.log.debug("Close the session to %s", self.url)
+            await self._session.close()
+            self._session = None
+        if self._sync_client is not None:
+            self._sync_client.close()
+
+    def _get_proxy(self, url):
+        if not self.proxies:
+            return None
+        return self.proxies.get(urlparse.urlparse(url).scheme)
+
+    async def _send(self,
+                    method,
+                    url,
+                    headers=None,
+                    data=None,
+                    auth=None,
+                    allow_redirects=True):
+        self._get_http_session()
+        async with self._semaphore:
+            return await self._fetch(method,
+                                     url,
+                                     headers=headers,
+                                     data=data,
+                                     auth=auth,
+                                     allow_redirects=allow_redirects)
+
+    async def _fetch(self,
+                     method,
+                     url,
+                     headers=None,
+                     data=None,
+                     auth=None,
+                     allow_redirects=True):
+        session = self._get_http_session()
+        async with session.request(method,
+                                   url,
+                                   headers=headers,
+                                   data=data,
+                                   auth=auth,
+                                   allow_redirects=allow_redirects,
+                                   proxy=self._get_proxy(url)) as resp:
+            content = await resp.read()
+            return _Response(url=url,
+                             status_code=resp.status,
+                             headers=resp.headers,
+                             content=content)
+
+    async def _request(self,
+                       method,
+                       url,
+                       headers=None,
+                       data=None,
+                       auth=None,
+                       allow_redirects=True,
+                       check_status=True):
+        """Send the request and relogin once if the cookie expires
+
+        :return: the response with `url`, `status_code`, `headers` and
+            `content`
+        """
+
+        self.log.debug("Send a %s request to %s", method, url)
+        expired_cookies = self.cookies
+        resp = await self._send(method,
+                                url,
+                                headers=headers,
+                                data=data,
+                                auth=auth,
+                                allow_redirects=allow_redirects)
+
+        expired = resp.status_code == 401 or is_token_expired(resp)
+        if (expired and expired_cookies is not None and
+                not _is_login_request(url)):
+            try:
+                await self._renew_cookies(expired_cookies)
+            except exception.RTCException:
+                raise exception.RTCException("Relogin Failed: "
+                                             "Invalid username or password")
+            resp = await self._send(method,
+                                    url,
+                                    headers=headers,
+                                    data=data,
+                                    auth=auth,
+                                    allow_redirects=allow_redirects)
+
+        if check_status and resp.status_code not in [200, 201]:
+            self.log.error("Failed %s request at <%s> with response: %s",
+                           method, url, resp.content)
+            raise exception.RTCException(
+                "Failed %s request at <%s> with status code %s" %
+                (method, url, resp.status_code))
+        return resp
+
+    async def login(self):
+        """Login the RTC Server/Jazz
+
+        """
+
+        self._get_http_session()
+        self.cookies = await self._get_cookies()
+        self._share_cookies()
+
+    def _share_cookies(self):
+        if self._sync_client is not None:
+            self._sync_client.cookies = self.cookies
+
+    async def _get_cookies(self):
+        # the cookies are kept in the cookie jar of the session, even if
+        # the redirects are not allowed (issue #68)
+        auth = aiohttp.BasicAuth(self.username, self.password)
+        identity_url = self.url + "/authenticated/identity"
+
+        resp = await self._request("GET",
+                                   identity_url,
+                                   auth=auth,
+                                   allow_redirects=self.jazz)
+        self._check_auth_failed(resp)
+
+        resp = await self._request("GET",
+                                   identity_url,
+                                   auth=auth,
+                                   allow_redirects=self.jazz)
+
+        # For Form Challenge
+        auth_msg = resp.headers.get("X-com-ibm-team-repository-web-auth-msg")
+        if auth_msg == "authrequired":
+            post_data = {
+                'j_username': self.username,
+                'j_password': self.password
+            }
+            temp_headers = {"Content-Type": self.CONTENT_URL_ENCODED}
+            resp = await self._request("POST",
+                                       self.url +
+                                       "/authenticated/j_security_check",
+                                       data=post_data,
+                                       headers=temp_headers,
+                                       check_status=False)
+            self._check_auth_failed(resp)
+            if resp.status_code != 200:
+                raise exception.RTCException("Authentication Failed: "
+                                             "Invalid username or password")
+
+        return dict((cookie.key, cookie.value)
+                    for cookie in self._get_http_session().cookie_jar)
+
+    def _check_auth_failed(self, resp):
+        authfailed = resp.headers.get("x-com-ibm-team-repository-web-auth-msg")
+        authfailedloc = resp.headers.get("Location")
+        if (authfailed == "authfailed" or
+            (authfailedloc is not None and
+             authfailedloc.endswith("authfailed"))):
+            self.log.error("Failed to login with user %s", self.username)
+            raise exception.RTCException("Authentication Failed: "
+                                         "Invalid username or password")
+
+    async def relogin(self):
+        """Relogin the RTC Server/Jazz when the token expires
+
+        """
+
+        self.log.info("Cookie expires. Relogin to get a new cookie.")
+        self._get_http_session().cookie_jar.clear()
+        self.headers = self._get_headers()
+        self.cookies = await self._get_cookies()
+        self._share_cookies()
+        self.log.debug("Successfully relogin.")
+
+    async def _renew_cookies(self, expired_cookies):
+        """Relogin only once when several coroutines find the same cookie
+        expired at the same time
+
+        :param expired_cookies: the cookies sent with the expired request
+        """
+
+        async with self._relogin_lock:
+            if expired_cookies is not self.cookies:
+                self.log.debug("The cookie has already been renewed")
+                return
+            await self.relogin()
+
+    async def _get_xml(self, url):
+        resp = await self._request("GET", url, headers=self.headers)
+        return self.parser.parse(resp.content)
+
+    async def _pre_get_resource(self,
+                                projectarea_id=None,
+                                projectarea_name=None):
+        if projectarea_id is None:
+            if projectarea_name is not None:
+                return await self.getProjectAreaID(projectarea_name)
+            return None
+        else:
+            if not await self.checkProjectAreaID(projectarea_id):
+                raise exception.BadValue("Invalid ProjectArea id")
+            return projectarea_id
+
+    async def getProjectAreaID(self, projectarea_name, archived=False):
+        """Get :class:`rtcclient.project_area.ProjectArea` id by its name
+
+        :param projectarea_name: the project area name
+        :param archived: (default is False) whether the project area
+            is archived
+        :return: the :class:`string` object
+        :rtype: string
+        """
+
+        if not isinstance(projectarea_name,
+                          six.string_types) or not projectarea_name:
+            excp_msg = "Please specify a valid ProjectArea name"
+            self.log.error(excp_msg)
+            raise exception.BadValue(excp_msg)
+
+        snapshot = await self._get_projectarea_snapshot(archived=archived)
+        proj_area = snapshot[2].get(projectarea_name)
+        if proj_area is not None:
+            return proj_area.id
+
+        self.log.error("No ProjectArea named %s", projectarea_name)
+        raise exception.NotFound("No ProjectArea named %s" % projectarea_name)
+
+    async def checkProjectAreaID(self, projectarea_id, archived=False):
+        """Check the validity of :class:`rtcclient.project_area.ProjectArea` id
+
+        :param projectarea_id: the :class:`rtcclient.project_area.ProjectArea`
+            id
+        :param archived: (default is False) whether the project area is
+            archived
+        :return: `True` or `False`
+        :rtype: bool
+        """
+
+        snapshot = await self._get_projectarea_snapshot(archived=archived)
+        if projectarea_id in snapshot[1]:
+            return True
+
+        self.log.error("No ProjectArea whose id is: %s", projectarea_id)
+        return False
+
+    def refreshProjectAreas(self):
+        """Fetch the project areas from the server again on the next lookup
+
+        The project areas are kept for `projectarea_ttl` seconds to look up
+        their ids and names. Call it when some project areas are created,
+        renamed or archived in the meantime.
+        """
+
+        self._projectarea_snapshots.invalidate()
+
+    async def _get_projectarea_snapshot(self, archived=False):
+        """Get the project areas indexed by their ids and names, which are
+        fetched with a single scan shared by the concurrent lookups
+        """
+
+        snapshot = self._projectarea_snapshots.get(archived)
+        if snapshot is not None:
+            return snapshot
+
+        task = self._loading_projectareas.get(archived)
+        if task is None:
+            task = asyncio.ensure_future(self._load_projectareas(archived))
+            self._loading_projectareas[archived] = task
+            task.add_done_callback(
+                lambda _: self._loading_projectareas.pop(archived, None))
+        # the shared scan is not cancelled with one of its waiters
+        return await asyncio.shield(task)
+
+    async def _load_projectareas(self, archived=False):
+        self.log.debug("Load all the ProjectAreas [archived=%s]", archived)
+        proj_areas = await self._get_paged_resources(
+            "ProjectArea", page_size="100", archived=archived) or []
+        snapshot = index_projectareas(proj_areas)
+        self._projectarea_snapshots.set(archived, snapshot)
+        return snapshot
+
+    async def getWorkitem(self, workitem_id, returned_properties=None):
+        """Get :class:`rtcclient.workitem.Workitem` object by its id/number
+
+        :param workitem_id: the workitem id/number
+            (integer or equivalent string)
+        :param returned_properties: the returned properties that you want.
+            Refer to :class:`rtcclient.client.RTCClient` for more explanations
+        :return: the :class:`rtcclient.workitem.Workitem` object
+        :rtype: rtcclient.workitem.Workitem
+        """
+
+        workitem_id = self._validate_workitem_id(workitem_id)
+        workitem_url = "/".join([self.url, "oslc/workitems/%s" % workitem_id])
+        rp = self._validate_returned_properties(returned_properties)
+        if rp is not None:
+            req_url = "".join(
+                [workitem_url, "?oslc_cm.properties=",
+                 urlquote(rp)])
+        else:
+            req_url = workitem_url
+
+        try:
+            raw_data = await self._get_xml(req_url)
+            workitem = Workitem(workitem_url,
+                                self.sync_client,
+                                workitem_id=workitem_id,
+                                raw_data=raw_data["oslc_cm:ChangeRequest"],
+                                lazy=True)
+        except Exception as excp:
+            self.log.error(excp)
+            raise exception.NotFound("Not found <Workitem %s>" % workitem_id)
+
+        await self._resolve_links([workitem])
+        return workitem
+
+    async def queryWorkitems(self,
+                             query_str,
+                             projectarea_id=None,
+                             projectarea_name=None,
+                             returned_properties=None,
+                             archived=False):
+        """Query workitems with the query string in a certain project area
+
+        At least either of `projectarea_id` and `projectarea_name` is given
+
+        :param query_str: a valid query string
+        :param projectarea_id: the :class:`rtcclient.project_area.ProjectArea`
+            id
+        :param projectarea_name: the project area name
+        :param returned_properties: the returned properties that you want.
+            Refer to :class:`rtcclient.client.RTCClient` for more explanations
+        :param archived: (default is False) whether the workitems are archived
+        :return: a :class:`list` that contains the queried
+            :class:`rtcclient.workitem.Workitem` objects
+        :rtype: list
+        """
+
+        pa_id = await self._pre_get_resource(projectarea_id=projectarea_id,
+                                             projectarea_name=projectarea_name)
+
+        self.log.info("Start to query workitems with query string: %s",
+                      query_str)
+        return await self._get_paged_resources(
+            "Query",
+            projectarea_id=pa_id,
+            customized_attr=urlquote(query_str),
+            page_size="100",
+            returned_properties=returned_properties,
+            archived=archived)
+
+    async def createWorkitem(self,
+                             item_type,
+                             title,
+                             description=None,
+                             projectarea_id=None,
+                             projectarea_name=None,
+                             template=None,
+                             **kwargs):
+        """Create a workitem from the template
+
+        More details, please refer to
+        :class:`rtcclient.client.RTCClient.createWorkitem`. Copying from an
+        existing workitem is not supported.
+
+        :return: the :class:`rtcclient.workitem.Workitem` object
+        :rtype: rtcclient.workitem.Workitem
+        """
+
+        if not template:
+            self.log.error("Please specify the template")
+            raise exception.EmptyAttrib("No template is specified")
+
+        if not isinstance(projectarea_id,
+                          six.string_types) or not projectarea_id:
+            projectarea_id = await self.getProjectAreaID(projectarea_name)
+
+        ftype_rule = ("dc:title", None, item_type)
+        itemtypes = await self._get_paged_resources(
+            "ItemType",
+            projectarea_id=projectarea_id,
+            page_size="10",
+            filter_rule=[ftype_rule])
+        if itemtypes is None:
+            excp_msg = "No itemtype's name is %s" % item_type
+            self.log.error(excp_msg)
+            raise exception.NotFound(excp_msg)
+
+        parameters = self.templater.listFields(template)
+        self._findMissingParams(parameters, **kwargs)
+        kwargs = await self._retrieveValidInfo(projectarea_id, **kwargs)
+        wi_raw = self.templater.render(template,
+                                       title=title,
+                                       description=description,
+                                       **kwargs)
+
+        self.log.info("Start to create a new <%s> with raw data: %s", item_type,
+                      wi_raw)
+
+        wi_url_post = "/".join([
+            self.url, "oslc/contexts", projectarea_id,
+            "workitems/%s" % itemtypes[0].identifier
+        ])
+        headers = copy.deepcopy(self.headers)
+        headers['Content-Type'] = self.OSLC_CR_XML
+        resp = await self._request("POST",
+                                   wi_url_post,
+                                   headers=headers,
+                                   data=wi_raw)
+
+        raw_data = self.parser.parse(resp.content)
+        workitem_raw = raw_data["oslc_cm:ChangeRequest"]
+        workitem_id = workitem_raw["dc:identifier"]
+        workitem_url = "/".join([self.url, "oslc/workitems/%s" % workitem_id])
+        new_wi = Workitem(workitem_url,
+                          self.sync_client,
+                          workitem_id=workitem_id,
+                          raw_data=workitem_raw,
+                          lazy=True)
+        await self._resolve_links([new_wi])
+
+        self.log.info("Successfully create <Workitem %s>" % new_wi)
+        return new_wi
+
+    async def _retrieveValidInfo(self, projectarea_id, **kwargs):
+        # get rdf:resource by keywords
+        for keyword, value in kwargs.items():
+            if keyword == "ownedBy":
+                parse_result = urlparse.urlparse(self.url)
+                kwargs[keyword] = urlparse.urlunparse(
+                    parse_result._replace(path="/".join(
+                        ["/jts/users", urlquote(value)])))
+                continue
+
+            resource_name = _KEYWORD_RESOURCES.get(keyword)
+            if resource_name is None:
+                continue
+            ftitle_rule = ("dc:title", None, value)
+            try:
+                resources = await self._get_paged_resources(
+                    resource_name,
+                    projectarea_id=projectarea_id,
+                    filter_rule=[ftitle_rule])
+            except Exception as excp:
+                self.log.error(excp)
+                continue
+            if resources is None:
+                self.log.error("No %s named %s", resource_name, value)
+                continue
+            kwargs[keyword] = resources[0].url
+        return kwargs
+
+    async def addComment(self, workitem_id, msg=None):
+        """Add a comment to the workitem
+
+        More details, please refer to
+        :class:`rtcclient.workitem.Workitem.addComment`
+
+        :param workitem_id: the workitem id/number
+        :param msg: comment message
+        :return: the :class:`rtcclient.models.Comment` object
+        :rtype: rtcclient.models.Comment
+        """
+
+        comments_url = "/".join(
+            [self.url,
+             "oslc/workitems/%s" % workitem_id, "rtc_cm:comments"])
+        headers = copy.deepcopy(self.headers)
+        resp = await self._request("GET", comments_url, headers=headers)
+
+        raw_data = self.parser.parse(resp.content)
+        total_cnt = raw_data["oslc_cm:Collection"]["@oslc_cm:totalCount"]
+        comment_url = "/".join([comments_url, total_cnt])
+        comment_msg = Workitem.COMMENT_TEMPLATE.format(comment_url, msg)
+
+        headers["Content-Type"] = Workitem.OSLC_CR_RDF
+        headers["Accept"] = Workitem.OSLC_CR_RDF
+        headers["OSLC-Core-Version"] = "2.0"
+        headers["If-Match"] = resp.headers.get("etag")
+        req_url = "/".join([comments_url, "oslc:comment"])
+        resp = await self._request("POST",
+                                   req_url,
+                                   headers=headers,
+                                   data=comment_msg)
+        self.log.info("Successfully add comment: [%s] for <Workitem %s>", msg,
+                      workitem_id)
+
+        raw_data = self.parser.parse(resp.content)
+        comment = Comment(comment_url,
+                          self.sync_client,
+                          raw_data=raw_data["rdf:RDF"]["rdf:Description"],
+                          lazy=True)
+        await self._resolve_links([comment])
+        return comment
+
+    async def _get_paged_resources(self,
+                                   resource_name,
+                                   projectarea_id=None,
+                                   workitem_id=None,
+                                   customized_attr=None,
+                                   page_size="100",
+                                   archived=False,
+                                   returned_properties=None,
+                                   filter_rule=None):
+        resources_list = list()
+        async for resource in self._iter_paged_resources(
+                resource_name,
+                projectarea_id=projectarea_id,
+                workitem_id=workitem_id,
+                customized_attr=customized_attr,
+                page_size=page_size,
+                archived=archived,
+                returned_properties=returned_properties,
+                filter_rule=filter_rule):
+            resources_list.append(resource)
+
+        if not resources_list:
+            self.log.warning(
+                "No %ss are found with [ProjectArea ID: %s] "
+                "and [archived=%s]", resource_name,
+                projectarea_id if projectarea_id else "not specified", archived)
+            return None
+        return resources_list
+
+    async def _iter_paged_resources(self,
+                                    resource_name,
+                                    projectarea_id=None,
+                                    workitem_id=None,
+                                    customized_attr=None,
+                                    page_size="100",
+                                    archived=False,
+                                    returned_properties=None,
+                                    filter_rule=None):
+        """Iterate the paged resources page by page
+
+        The next page is requested while the current page is being
+        processed.
+
+        :return: an asynchronous generator that yields the resource objects
+        """
+
+        resource_url, entry_tag = self._get_paged_resources_url(
+            resource_name,
+            projectarea_id=projectarea_id,
+            workitem_id=workitem_id,
+            customized_attr=customized_attr,
+            page_size=page_size,
+            returned_properties=returned_properties)
+        handle_entry = self._get_resource_entry_handler(
+            resource_name,
+            projectarea_id=projectarea_id,
+            archived=archived,
+            filter_rule=filter_rule)
+
+        next_page = asyncio.ensure_future(self._get_xml(resource_url))
+        try:
+            while next_page is not None:
+                raw_data = await next_page
+                next_page = None
+                collection = raw_data.get("oslc_cm:Collection")
+                if collection.get("@oslc_cm:totalCount") == "0":
+                    self.log.warning("No %ss are found", resource_name)
+                    return
+
+                url_next = collection.get("@oslc_cm:next")
+                if url_next:
+                    next_page = asyncio.ensure_future(self._get_xml(url_next))
+
+                entries = self._get_page_entries(raw_data, entry_tag)
+                page_resources = list(filter(None, map(handle_entry, entries)))
+                await self._resolve_links(page_resources)
+                for resource in page_resources:
+                    yield resource
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def _resolve_links(self, resources):
+        """Resolve the pending linked fields of a group of objects
+
+        :param resources: a :class:`list` that contains the
+            :class:`rtcclient.base.FieldBase` objects
+        """
+
+        rdf_urls = set()
+        for resource in resources:
+            rdf_urls.update(resource._pending_links.values())
+        if not rdf_urls:
+            return
+
+        rdf_titles = await self._get_rdf_resource_titles(rdf_urls)
+        for resource in resources:
+            resource._set_link_titles(rdf_titles)
+
+    async def _get_rdf_resource_titles(self, rdf_urls):
+        """Get the titles of the linked resources (rdf:resource)
+
+        Each distinct uncached url is only requested once, even if several
+        coroutines are resolving it at the same time.
+
+        :param rdf_urls: an iterable that contains the rdf:resource urls
+        :return: a :class:`dict` mapping each url to its title
+        :rtype: dict
+        """
+
+        rdf_titles = dict()
+        uncached_urls = list()
+        for rdf_url in set(rdf_urls):
+            local_title = get_local_link_title(rdf_url)
+            if local_title is not None:
+                rdf_titles[rdf_url] = local_title
+                continue
+            title = self.resource_cache.get(rdf_url, _UNRESOLVED)
+            if title is _UNRESOLVED:
+                uncached_urls.append(rdf_url)
+            else:
+                rdf_titles[rdf_url] = title
+
+        if uncached_urls:
+            titles = await asyncio.gather(*[
+                self._get_rdf_resource_title(rdf_url)
+                for rdf_url in uncached_urls
+            ])
+            rdf_titles.update(zip(uncached_urls, titles))
+        return rdf_titles
+
+    async def _get_rdf_resource_title(self, rdf_url):
+        task = self._resolving_titles.get(rdf_url)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._request_rdf_resource_title(rdf_url))
+            self._resolving_titles[rdf_url] = task
+            task.add_done_callback(
+                lambda _: self._resolving_titles.pop(rdf_url, None))
+        # the shared request is not cancelled with one of its waiters
+        return await asyncio.shield(task)
+
+    async def _request_rdf_resource_title(self, rdf_url):
+        try:
+            raw_data = await self._get_xml(rdf_url)
+            title = self._handle_rdf_raw(raw_data)
+        except (exception.RTCException, Exception):
+            self.log.error("Unable to handle %s", rdf_url)
+            return rdf_url
+
+        self.resource_cache.set(rdf_url, title)
+        return title
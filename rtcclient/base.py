@@ -1,10 +1,7 @@
-from multiprocessing.pool import ThreadPool as Pool
 import abc
 import logging
 from rtcclient import requests
-import xmltodict
 from rtcclient import urlunquote, OrderedDict
-from rtcclient import exception
 from rtcclient.utils import token_expire_handler
 
 
@@ -40,17 +37,33 @@ class RTCBase(object):
 
     def getattr(self, attr):
         try:
-            return self.__getattribute__(attr)
+            return getattr(self, attr)
         except Exception:
             return None
 
     def __getitem__(self, key):
-        return self.__getattribute__(key)
+        return getattr(self, key)
 
     @abc.abstractmethod
     def get_rtc_obj(self):
         pass
 
+    def _get_session(self):
+        """Get the connection-pooled session shared by the client
+
+        If no session is available (e.g. the client is still being
+        initialized), fall back to the module-level functions of
+        :mod:`requests`.
+
+        :return: the :class:`requests.Session` object or the
+            :mod:`requests` module
+        """
+
+        session = getattr(self.get_rtc_obj(), "session", None)
+        if session is None:
+            return requests
+        return session
+
     @token_expire_handler
     def get(self,
             url,
@@ -81,13 +94,13 @@ class RTCBase(object):
         """
 
         self.log.debug("Get response from %s", url)
-        response = requests.get(url,
-                                verify=verify,
-                                headers=headers,
-                                cookies=cookies,
-                                proxies=proxies,
-                                timeout=timeout,
-                                **kwargs)
+        response = self._get_session().get(url,
+                                           verify=verify,
+                                           headers=headers,
+                                           cookies=cookies,
+                                           proxies=proxies,
+                                           timeout=timeout,
+                                           **kwargs)
         if response.status_code != 200:
             self.log.error("Failed GET request at <%s> with response: %s", url,
                            response.content)
@@ -131,15 +144,15 @@ class RTCBase(object):
 
         self.log.debug("Post a request to %s with data: %s and json: %s", url,
                        data, json)
-        response = requests.post(url,
-                                 data=data,
-                                 json=json,
-                                 verify=verify,
-                                 headers=headers,
-                                 cookies=cookies,
-                                 proxies=proxies,
-                                 timeout=timeout,
-                                 **kwargs)
+        response = self._get_session().post(url,
+                                            data=data,
+                                            json=json,
+                                            verify=verify,
+                                            headers=headers,
+                                            cookies=cookies,
+                                            proxies=proxies,
+                                            timeout=timeout,
+                                            **kwargs)
 
         if response.status_code not in [200, 201]:
             self.log.error("Failed POST request at <%s> with response: %s", url,
@@ -181,14 +194,14 @@ class RTCBase(object):
         """
 
         self.log.debug("Put a request to %s with data: %s", url, data)
-        response = requests.put(url,
-                                data=data,
-                                verify=verify,
-                                headers=headers,
-                                cookies=cookies,
-                                proxies=proxies,
-                                timeout=timeout,
-                                **kwargs)
+        response = self._get_session().put(url,
+                                           data=data,
+                                           verify=verify,
+                                           headers=headers,
+                                           cookies=cookies,
+                                           proxies=proxies,
+                                           timeout=timeout,
+                                           **kwargs)
         if response.status_code not in [200, 201]:
             self.log.error("Failed PUT request at <%s> with response: %s", url,
                            response.content)
@@ -225,13 +238,13 @@ class RTCBase(object):
         """
 
         self.log.debug("Delete a request to %s", url)
-        response = requests.delete(url,
-                                   headers=headers,
-                                   cookies=cookies,
-                                   verify=verify,
-                                   proxies=proxies,
-                                   timeout=timeout,
-                                   **kwargs)
+        response = self._get_session().delete(url,
+                                              headers=headers,
+                                              cookies=cookies,
+                                              verify=verify,
+                                              proxies=proxies,
+                                              timeout=timeout,
+                                              **kwargs)
         if response.status_code not in [200, 201]:
             self.log.error("Failed DELETE request at <%s> with response: %s",
                            url, response.content)
@@ -260,11 +273,16 @@ class FieldBase(RTCBase):
     __metaclass__ = abc.ABCMeta
     log = logging.getLogger("base.FieldBase")
 
-    def __init__(self, url, rtc_obj, raw_data=None):
+    def __init__(self, url, rtc_obj, raw_data=None, lazy=False):
         RTCBase.__init__(self, url)
         self.field_alias = dict()
         self.rtc_obj = rtc_obj
         self.raw_data = raw_data
+        self.lazy = lazy
+        # the rdf:resource urls of the linked attributes
+        self._link_urls = dict()
+        # the linked attributes whose titles are not resolved yet
+        self._pending_links = dict()
         if raw_data is not None:
             self.__initializeFromRaw()
         elif self.url:
@@ -274,6 +292,16 @@ class FieldBase(RTCBase):
     def __str__(self):
         pass
 
+    def __getattr__(self, name):
+        # only called when the attribute is not found, e.g. the linked
+        # field which has not been resolved in the lazy mode
+        pending_links = self.__dict__.get("_pending_links")
+        if pending_links and name in pending_links:
+            self.resolveLink(name)
+            return self.__dict__.get(name)
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (self.__class__.__name__, name))
+
     def get_rtc_obj(self):
         return self.rtc_obj
 
@@ -295,113 +323,151 @@ class FieldBase(RTCBase):
     def __initialize(self, resp):
         """Initialize from the response"""
 
-        raw_data = xmltodict.parse(resp.content)
+        raw_data = self.rtc_obj.parser.parse(resp.content)
         root_key = list(raw_data.keys())[0]
         self.raw_data = raw_data.get(root_key)
         self.__initializeFromRaw()
 
     def __initializeFromRaw(self):
-        """Initialze from raw data (OrderedDict)"""
-
-        with Pool() as pool:
-            for processed in pool.map(self.__process_items,
-                                      self.raw_data.items()):
-                if processed is None:
-                    continue
-                key, attr, value = processed
-                self.field_alias[attr] = key
+        """Initialze from raw data (OrderedDict)
+
+        The linked fields are collected in `_pending_links` and resolved
+        altogether unless `lazy` is set.
+        """
+
+        for item in self.raw_data.items():
+            processed = self.__process_items(item)
+            if processed is None:
+                continue
+            key, attr, value, rdf_url = processed
+            self.field_alias[attr] = key
+            if rdf_url is not None:
+                self._link_urls[attr] = rdf_url
+                self._pending_links[attr] = rdf_url
+            else:
                 self.setattr(attr, value)
 
+        if not self.lazy:
+            self.resolveLinks()
+
     def __process_items(self, item):
         """Process a single work item element"""
-        key, value = item
-        if key.startswith("@"):
-            # be compatible with IncludedInBuild
-            if "@oslc_cm:label" != key:
-                return None
-
-        attr = key.split(":")[-1].replace("-", "_")
-        attr_list = attr.split(".")
-
-        # ignore long attributes
-        if len(attr_list) > 1:
-            # attr = "_".join([attr_list[-2],
-            #                  attr_list[-1]])
-            return None
+        return parse_raw_item(item)
 
-        if isinstance(value, OrderedDict):
-            value_text = value.get("#text")
-            if value_text is not None:
-                value = value_text
-            else:
-                # request detailed info using rdf:resource
-                value = list(value.values())[0]
+    def resolveLinks(self):
+        """Resolve all the pending linked fields (rdf:resource) of this
+        object with their titles
 
-                try:
-                    value = self.__get_rdf_resource_title(value)
-                except (exception.RTCException, Exception):
-                    self.log.error("Unable to handle %s", value)
-        return key, attr, value
+        The linked resources are fetched concurrently.
+        """
 
-    def __get_rdf_resource_title(self, rdf_url):
-        # handle for /jts/users
-        if "/jts/users" in rdf_url:
-            return urlunquote(rdf_url.split("/")[-1])
+        if not self._pending_links:
+            return
+        rdf_titles = self.rtc_obj._get_rdf_resource_titles(
+            self._pending_links.values())
+        self._set_link_titles(rdf_titles)
 
-        # keep query result url
-        if rdf_url.endswith("rtc_cm:results"):
-            return rdf_url
+    def resolveLink(self, attr):
+        """Resolve the pending linked field (rdf:resource) with its title
 
-        # keep attachment url
-        if "/resource/content/" in rdf_url:
-            return rdf_url
+        In the lazy mode, it is called the first time the linked field is
+        accessed. The title is cached by the client, so that the other
+        objects linked to the same resource will not request it again.
 
-        resp = self.get(
-            rdf_url,
-            verify=False,
-            proxies=self.rtc_obj.proxies,
-            headers=self.rtc_obj.headers,
-            cookies=self.rtc_obj.cookies,
-        )
-        raw_data = xmltodict.parse(resp.content)
+        :param attr: the attribute name of the linked field
+            (e.g. ownedBy, severity)
+        """
 
-        root_key = list(raw_data.keys())[0]
-        total_count = raw_data[root_key].get("@oslc_cm:totalCount")
-        if total_count is None:
-            # no total count
-            # only single resource
-            # compatible with IncludedInBuild
-            return raw_data[root_key].get("dc:title") or raw_data[root_key].get(
-                "foaf:nick")
-        else:
-            # multiple resource
-            result_list = list()
-            entry_keys = [
-                entry_key for entry_key in raw_data[root_key].keys()
-                if not entry_key.startswith("@")
-            ]
-            for entry_key in entry_keys:
-                entries = raw_data[root_key][entry_key]
-                if isinstance(entries, OrderedDict):
-                    entry_result = self.__handle_rdf_entry(entries)
-                    result_list.append(entry_result)
-                else:
-                    for entry in entries:
-                        entry_result = self.__handle_rdf_entry(entry)
-                        result_list.append(entry_result)
-
-            if not result_list:
-                return None
-            return result_list
-
-    def __handle_rdf_entry(self, entry):
-        # only return useful info instead of the whole object
-        return_fields = ["rtc_cm:userId", "dc:title", "dc:description"]
-        subkeys = entry.keys()
-        for return_field in return_fields:
-            if return_field in subkeys:
-                return entry.get(return_field)
-        raise exception.RTCException()
+        rdf_url = self._pending_links.get(attr)
+        if rdf_url is None:
+            return
+        self.log.debug("Resolve the linked field %s of <%s %s>", attr,
+                       self.__class__.__name__, self)
+        rdf_titles = self.rtc_obj._get_rdf_resource_titles([rdf_url])
+        self._set_link_titles(rdf_titles)
+
+    def getLinkURL(self, attr):
+        """Get the rdf:resource url of the linked field without resolving it
+
+        :param attr: the attribute name of the linked field
+            (e.g. ownedBy, severity)
+        :return: the rdf:resource url, or `None` if it is not a linked field
+        """
+
+        return self._link_urls.get(attr)
+
+    def _set_link_titles(self, rdf_titles):
+        """Fill the pending linked fields with the resolved titles
+
+        :param rdf_titles: a :class:`dict` mapping the rdf:resource url
+            to its title
+        """
+
+        for attr, rdf_url in list(self._pending_links.items()):
+            if rdf_url in rdf_titles:
+                self.setattr(attr, rdf_titles[rdf_url])
+                self._pending_links.pop(attr, None)
 
     def setattr(self, attr, value):
         self.__setattr__(attr, value)
+
+
+def parse_raw_item(item):
+    """Parse a single element of the raw data into an attribute
+
+    :param item: the `(key, value)` of the element in the raw data
+    :return: a :class:`tuple` of the key, the attribute name, the value
+        and the rdf:resource url whose title is to be requested (or `None`),
+        or `None` if the element is ignored
+    :rtype: tuple
+    """
+
+    key, value = item
+    if key.startswith("@"):
+        # be compatible with IncludedInBuild
+        if "@oslc_cm:label" != key:
+            return None
+
+    attr = key.split(":")[-1].replace("-", "_")
+    attr_list = attr.split(".")
+
+    # ignore long attributes
+    if len(attr_list) > 1:
+        # attr = "_".join([attr_list[-2],
+        #                  attr_list[-1]])
+        return None
+
+    if isinstance(value, OrderedDict):
+        value_text = value.get("#text")
+        if value_text is not None:
+            value = value_text
+        else:
+            # request detailed info using rdf:resource
+            value = list(value.values())[0]
+            local_title = get_local_link_title(value)
+            if local_title is None:
+                return key, attr, None, value
+            value = local_title
+    return key, attr, value, None
+
+
+def get_local_link_title(rdf_url):
+    """Get the title of the rdf:resource url without any request
+
+    :param rdf_url: the rdf:resource url
+    :return: the title, or `None` if the resource has to be requested
+    """
+
+    # handle for /jts/users
+    if "/jts/users" in rdf_url:
+        return urlunquote(rdf_url.split("/")[-1])
+
+    # keep query result url
+    if rdf_url.endswith("rtc_cm:results"):
+        return rdf_url
+
+    # keep attachment url
+    if "/resource/content/" in rdf_url:
+        return rdf_url
+
+    return None
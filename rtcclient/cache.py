@@ -0,0 +1,160 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from rtcclient import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache(object):
+    """A thread-safe LRU cache whose entries expire after a while
+
+    :param maxsize: (default is 1024) the maximum number of entries. The
+        least recently used entry is evicted when it is full. Set to `0`
+        to disable the cache
+    :param ttl: (default is 600) the seconds an entry stays valid after it
+        is stored. Set to `None` to keep the entries until evicted
+    """
+
+    log = logging.getLogger("cache.TTLCache")
+
+    def __init__(self, maxsize=1024, ttl=600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        # the futures of the values being loaded by key
+        self._loading = dict()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key, default=None, count=True):
+        """Get the cached value
+
+        :param key: the cache key
+        :param default: the value to return if the key is not cached or
+            has expired
+        :param count: (default is `True`) whether to record the lookup in
+            the hit/miss counters
+        :return: the cached value or `default`
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    if count:
+                        self.hits += 1
+                    return value
+                self._entries.pop(key)
+            if count:
+                self.misses += 1
+            return default
+
+    def set(self, key, value):
+        """Store the value
+
+        :param key: the cache key
+        :param value: the value to cache
+        """
+
+        if not self.maxsize:
+            return
+
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def load(self, key, loader, wait=True):
+        """Get the cached value, or load and store it
+
+        The value of each key is loaded only once at the same time. The
+        lock is not held while loading, so that the loader can wait for the
+        other threads.
+
+        :param key: the cache key
+        :param loader: the callable without arguments to load the value
+        :param wait: (default is `True`) whether to wait for the value being
+            loaded by the other thread. If `False`, the value is loaded again
+            in this thread instead, e.g. in a worker thread that the other
+            loader may be waiting for
+        :return: the cached or loaded value
+        """
+
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            value = self.get(key, _MISSING, count=False)
+            if value is not _MISSING:
+                return value
+            future = self._loading.get(key)
+            is_loader = future is None
+            if is_loader:
+                future = Future()
+                self._loading[key] = future
+
+        if not is_loader and wait:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as excp:
+            if is_loader:
+                with self._lock:
+                    self._loading.pop(key, None)
+                future.set_exception(excp)
+            raise
+
+        if is_loader:
+            with self._lock:
+                self.set(key, value)
+                self._loading.pop(key, None)
+            future.set_result(value)
+        return value
+
+    def invalidate(self, key=None):
+        """Invalidate the cached value
+
+        :param key: the cache key. If `None`, all the entries are
+            invalidated
+        """
+
+        with self._lock:
+            if key is None:
+                self.log.debug("Invalidate all the cached entries")
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self):
+        """Get the statistics of the cache
+
+        :return: a :class:`dict` that contains `hits`, `misses`, `size`,
+            `maxsize` and `ttl`
+        :rtype: dict
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl
+            }
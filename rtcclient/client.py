@@ -1,24 +1,58 @@
+import collections
 import copy
+import datetime
+import functools
+import itertools
 import logging
-from multiprocessing.pool import ThreadPool as Pool
+import re
+import threading
 
 import six
-import xmltodict
 
 from rtcclient import exception
+from rtcclient import requests
 from rtcclient import urlparse, urlquote, OrderedDict
-from rtcclient.base import RTCBase
+from rtcclient.base import RTCBase, get_local_link_title
+from rtcclient.cache import TTLCache
+from rtcclient.executor import Executor
 from rtcclient.models import FiledAgainst, FoundIn, Comment, Action, State  # noqa: F401
 from rtcclient.models import IncludedInBuild, ChangeSet, Attachment  # noqa: F401
 from rtcclient.models import Severity, Priority, ItemType, SavedQuery  # noqa: F401
 from rtcclient.models import TeamArea, Member, Administrator, PlannedFor  # noqa: F401
-from rtcclient.project_area import ProjectArea  # noqa: F401
+from rtcclient.models import EnumerationRegistry
+from rtcclient.project_area import ProjectArea, ProjectAreaRegistry  # noqa: F401
+from rtcclient.parser import CollectionStream, get_parser
 from rtcclient.query import Query
+from rtcclient.record import WorkitemRecord
+from rtcclient.registry import RESOURCE_TYPES
 from rtcclient.template import Templater
-from rtcclient.utils import capitalize
+from rtcclient.utils import capitalize, format_rtc_time, parse_rtc_time
 from rtcclient.workitem import Workitem  # noqa: F401
 
 
+_UNRESOLVED = object()
+_START_INDEX_PATTERN = re.compile(r"([?&]_startIndex=)(\d+)")
+# the maximum length of the ids in a query string, whose url should stay
+# within the limit of the servers and proxies
+_MAX_QUERY_LENGTH = 2000
+# the length of the quoted separator (",") between the ids
+_QUOTED_SEPARATOR_LENGTH = len(urlquote(","))
+# the size of the chunks fed to the parser when streaming the pages
+_STREAM_CHUNK_SIZE = 64 * 1024
+# only the latest 1000 workitems of a query can be fetched
+_MAX_QUERY_RESULTS = 1000
+# the time windows of the modified workitems are split until the precision
+# of the timestamps
+_MIN_TIME_WINDOW = datetime.timedelta(milliseconds=1)
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _truncate_rtc_time(value):
+    """Truncate the time to the milliseconds used in the queries"""
+
+    return parse_rtc_time(format_rtc_time(value))
+
+
 class RTCClient(RTCBase):
     """A wrapped class for :class:`RTC Client` to perform all related
     operations
@@ -35,6 +69,53 @@ class RTCClient(RTCBase):
         the url ends with 'jazz', otherwise to `False` if with 'ccm'
         (Refer to issue #68 for details)
     :type ends_with_jazz: bool
+    :param pool_connections: (optional) the number of connection pools
+        (one per host) to cache in the shared session. Default is 10
+    :param pool_maxsize: (optional) the maximum number of connections to
+        keep alive in each pool. Set it to the number of your concurrent
+        workers. Default is 10
+    :param max_retries: (optional) the maximum number of retries for each
+        connection, or a :class:`urllib3.util.retry.Retry` object for
+        fine-grained control. Default is 0
+    :param keep_alive: (optional) whether to reuse the connections to
+        the RTC server. Default is `True`
+    :type keep_alive: bool
+    :param cache_size: (optional) the maximum number of the linked resources
+        (e.g. categories, iterations, severities and users) whose titles are
+        cached. Set to `0` to disable the cache. Default is 1024
+    :param cache_ttl: (optional) the seconds a cached title stays valid.
+        Set to `None` to never expire. Default is 600
+    :param max_workers: (optional) the maximum number of threads shared by
+        all the concurrent operations (e.g. processing the paged entries and
+        resolving the linked resources). If `None`, it is set to
+        `min(32, cpu_count + 4)`
+    :param page_concurrency: (optional) the maximum number of pages to be
+        requested in parallel when paging through a collection whose total
+        count is known. Default is 1, which only requests the next page
+        while the current page is being processed
+    :param projectarea_ttl: (optional) the seconds the fetched project areas
+        are kept to look up their ids and names. Set to `None` to keep them
+        until :meth:`refreshProjectAreas` is called, or to `0` to always
+        fetch them from the server. Default is 600
+    :param enumeration_ttl: (optional) the seconds the fetched enumerations
+        (e.g. severities, priorities, iterations, categories, deliverables,
+        team areas and workitem types) of each project area are kept to look
+        them up by their titles. Set to `None` to keep them until
+        :meth:`refreshEnumerations` is called, or to `0` to always fetch
+        them from the server. Default is 600
+    :param template_ttl: (optional) the seconds the to-be-copied workitems
+        and the templates derived from them are kept to create or copy the
+        workitems. They are also refreshed when the workitems are changed by
+        this client. Set to `None` to keep them until
+        :meth:`refreshTemplates` is called, or to `0` to always fetch them
+        from the server. Default is 600
+    :param xml_parser: (optional) the backend to parse the XML responses:
+        `xmltodict` (default) or `lxml`, which is faster on the large
+        collections. An object that has a `parse` method returning the same
+        trees as :func:`xmltodict.parse` is also accepted
+    :param cookies: (optional) the cookies of an authenticated session (e.g.
+        the one of :class:`rtcclient.async_client.AsyncRTCClient`). If
+        specified, no login is performed until they expire
 
     Tips: You can also customize your preferred properties to be returned
     by specified `returned_properties` when the called methods have
@@ -55,7 +136,20 @@ class RTCClient(RTCBase):
                  password,
                  proxies=None,
                  searchpath=None,
-                 ends_with_jazz=True):
+                 ends_with_jazz=True,
+                 pool_connections=10,
+                 pool_maxsize=10,
+                 max_retries=0,
+                 keep_alive=True,
+                 cache_size=1024,
+                 cache_ttl=600,
+                 max_workers=None,
+                 page_concurrency=1,
+                 projectarea_ttl=600,
+                 enumeration_ttl=600,
+                 template_ttl=600,
+                 xml_parser=None,
+                 cookies=None):
         """Initialization
 
         See params above
@@ -70,10 +164,27 @@ class RTCClient(RTCBase):
             raise exception.BadValue("ends_with_jazz is not boolean")
 
         self.jazz = ends_with_jazz
+        self.parser = get_parser(xml_parser)
+        self._relogin_lock = threading.Lock()
+        self.session = self._create_session(pool_connections=pool_connections,
+                                            pool_maxsize=pool_maxsize,
+                                            max_retries=max_retries,
+                                            keep_alive=keep_alive)
+        self.resource_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self.executor = Executor(max_workers=max_workers)
+        self.page_concurrency = page_concurrency
+        self.projectarea_registry = ProjectAreaRegistry(self,
+                                                        ttl=projectarea_ttl)
+        self.enumeration_registry = EnumerationRegistry(self,
+                                                        ttl=enumeration_ttl)
+        # the resources that failed to be filtered on the server
+        self._unfilterable_resources = set()
         self.headers = self._get_headers()
-        self.cookies = self._get_cookies()
+        self.cookies = self._get_cookies() if cookies is None else cookies
         self.searchpath = searchpath
-        self.templater = Templater(self, searchpath=self.searchpath)
+        self.templater = Templater(self,
+                                   searchpath=self.searchpath,
+                                   ttl=template_ttl)
         self.query = Query(self)
 
     def __str__(self):
@@ -82,6 +193,92 @@ class RTCClient(RTCBase):
     def get_rtc_obj(self):
         return self
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the shared session and release all the pooled connections
+        and threads
+
+        """
+
+        self.log.debug("Close the session to %s", self.url)
+        self.session.close()
+        self.executor.shutdown()
+
+    def _create_session(self,
+                        pool_connections=10,
+                        pool_maxsize=10,
+                        max_retries=0,
+                        keep_alive=True):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def getPoolStats(self):
+        """Get the statistics of the connection pools in the shared session
+
+        It can be used to size `pool_maxsize` for your worker count: if
+        `num_connections` keeps growing beyond `maxsize`, the connections
+        are being discarded instead of reused.
+
+        :return: a :class:`dict` keyed by the pool url (e.g.
+            https://your_domain:9443), whose value is a :class:`dict`
+            that contains `num_connections` (total connections created),
+            `num_requests` (total requests sent), `idle_connections`
+            (connections kept alive for reuse) and `maxsize`
+        :rtype: dict
+        """
+
+        pool_stats = dict()
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for pool_key in pools.keys():
+                pool = pools.get(pool_key)
+                if pool is None:
+                    continue
+                pool_url = "%s://%s:%s" % (pool.scheme, pool.host, pool.port)
+                idle_conns = [
+                    conn for conn in list(pool.pool.queue) if conn is not None
+                ] if pool.pool is not None else []
+                pool_stats[pool_url] = {
+                    "num_connections": pool.num_connections,
+                    "num_requests": pool.num_requests,
+                    "idle_connections": len(idle_conns),
+                    "maxsize": pool.pool.maxsize if pool.pool else 0
+                }
+        return pool_stats
+
+    def getResourceCacheStats(self):
+        """Get the statistics of the cache for the linked resource titles
+
+        :return: a :class:`dict` that contains `hits`, `misses`, `size`,
+            `maxsize` and `ttl`
+        :rtype: dict
+        """
+
+        return self.resource_cache.stats()
+
+    def invalidateResourceCache(self, rdf_url=None):
+        """Invalidate the cached title of the linked resource
+
+        :param rdf_url: the rdf:resource url (e.g.
+            https://your_domain:9443/jazz/oslc/iterations/_0O1M0GOPEd6mcI).
+            If `None`, all the cached titles are invalidated
+        """
+
+        self.resource_cache.invalidate(rdf_url)
+
     def _get_headers(self):
         _headers = {}
         _headers["Content-Type"] = self.CONTENT_XML
@@ -178,11 +375,26 @@ class RTCClient(RTCBase):
         """
 
         self.log.info("Cookie expires. Relogin to get a new cookie.")
+        self.session.cookies.clear()
         self.headers = None
         self.headers = self._get_headers()
         self.cookies = self._get_cookies()
         self.log.debug("Successfully relogin.")
 
+    def _renew_cookies(self, expired_cookies):
+        """Relogin only once when several requests find the same cookie
+        expired at the same time
+
+        :param expired_cookies: the cookies sent with the expired request
+        """
+
+        with self._relogin_lock:
+            if expired_cookies is not None and \
+                    expired_cookies is not self.cookies:
+                self.log.debug("The cookie has already been renewed")
+                return
+            self.relogin()
+
     def getProjectAreas(self, archived=False, returned_properties=None):
         """Get all :class:`rtcclient.project_area.ProjectArea` objects
 
@@ -242,6 +454,10 @@ class RTCClient(RTCBase):
                          projectarea_name=None,
                          projectarea_id=None):
         rp = returned_properties
+        if rp is None:
+            return self._lookupProjectAreas(archived=archived,
+                                            projectarea_name=projectarea_name,
+                                            projectarea_id=projectarea_id)
 
         filter_rule = None
         if projectarea_name is not None:
@@ -257,7 +473,35 @@ class RTCClient(RTCBase):
                                          page_size="10",
                                          archived=archived,
                                          returned_properties=rp,
-                                         filter_rule=filter_rule)
+                                         filter_rule=filter_rule,
+                                         limit=1 if filter_rule else None)
+
+    def _lookupProjectAreas(self,
+                            archived=False,
+                            projectarea_name=None,
+                            projectarea_id=None):
+        registry = self.projectarea_registry
+        if projectarea_id is not None:
+            proj_area = registry.getByID(projectarea_id, archived=archived)
+        elif projectarea_name is not None:
+            proj_area = registry.getByName(projectarea_name, archived=archived)
+        else:
+            return registry.getAll(archived=archived)
+
+        if proj_area is None or (projectarea_name is not None and
+                                 proj_area.title != projectarea_name):
+            return None
+        return [proj_area]
+
+    def refreshProjectAreas(self):
+        """Fetch the project areas from the server again on the next lookup
+
+        The project areas are kept for `projectarea_ttl` seconds to look up
+        their ids and names. Call it when some project areas are created,
+        renamed or archived in the meantime.
+        """
+
+        self.projectarea_registry.refresh()
 
     def _add_filter_rule(self, filter_rule, added_rule):
         if filter_rule is None:
@@ -462,17 +706,76 @@ class RTCClient(RTCBase):
                                              projectarea_name=projectarea_name)
         rp = returned_properties
 
-        filter_rule = None
-        if teamarea_name is not None:
-            ftaname_rule = ("dc:title", None, teamarea_name)
-            filter_rule = self._add_filter_rule(filter_rule, ftaname_rule)
+        return self._get_enumerations("TeamArea",
+                                      projectarea_id=projarea_id,
+                                      page_size="100",
+                                      archived=archived,
+                                      returned_properties=rp,
+                                      title=teamarea_name)
 
-        return self._get_paged_resources("TeamArea",
-                                         projectarea_id=projarea_id,
-                                         page_size="100",
-                                         archived=archived,
-                                         returned_properties=rp,
-                                         filter_rule=filter_rule)
+    def _get_enumerations(self,
+                          resource_name,
+                          projectarea_id=None,
+                          page_size="100",
+                          archived=False,
+                          returned_properties=None,
+                          title=None):
+        """Get the objects of the enumeration from the enumeration registry
+
+        If `returned_properties` is specified, the objects are always
+        requested from the server.
+
+        :param title: the title of the wanted object. If `None`, all the
+            objects are returned
+        :return: a :class:`list` that contains the objects, or `None` if
+            no objects are found
+        :rtype: list
+        """
+
+        if returned_properties is not None:
+            filter_rule = None
+            if title is not None:
+                ftitle_rule = ("dc:title", None, title)
+                filter_rule = self._add_filter_rule(filter_rule, ftitle_rule)
+            return self._get_paged_resources(
+                resource_name,
+                projectarea_id=projectarea_id,
+                page_size=page_size,
+                archived=archived,
+                returned_properties=returned_properties,
+                filter_rule=filter_rule,
+                limit=1 if filter_rule else None)
+
+        registry = self.enumeration_registry
+        if title is None:
+            return registry.getAll(resource_name,
+                                   projectarea_id=projectarea_id,
+                                   archived=archived)
+        resource = registry.getByTitle(resource_name,
+                                       title,
+                                       projectarea_id=projectarea_id,
+                                       archived=archived)
+        if resource is None:
+            self.log.warning("No %s is titled with %s", resource_name, title)
+            return None
+        return [resource]
+
+    def refreshEnumerations(self, resource_name=None, projectarea_id=None):
+        """Fetch the enumerations (e.g. Severity, Priority, PlannedFor,
+        FiledAgainst, FoundIn, TeamArea and ItemType) from the server again
+        on the next lookup
+
+        The enumerations are kept for `enumeration_ttl` seconds. Call it
+        when some of them are changed in the meantime.
+
+        :param resource_name: the resource name (e.g. Severity). If `None`,
+            all the enumerations are refreshed
+        :param projectarea_id: the :class:`rtcclient.project_area.ProjectArea`
+            id of the enumeration
+        """
+
+        self.enumeration_registry.refresh(resource_name=resource_name,
+                                          projectarea_id=projectarea_id)
 
     def getOwnedBy(self, email, projectarea_id=None, projectarea_name=None):
 
@@ -574,18 +877,13 @@ class RTCClient(RTCBase):
         projarea_id = self._pre_get_resource(projectarea_id=projectarea_id,
                                              projectarea_name=projectarea_name)
 
-        filter_rule = None
-        if plannedfor_name is not None:
-            fpfname_rule = ("dc:title", None, plannedfor_name)
-            filter_rule = self._add_filter_rule(filter_rule, fpfname_rule)
-
         rp = returned_properties
-        return self._get_paged_resources("PlannedFor",
-                                         projectarea_id=projarea_id,
-                                         page_size="100",
-                                         archived=archived,
-                                         returned_properties=rp,
-                                         filter_rule=filter_rule)
+        return self._get_enumerations("PlannedFor",
+                                      projectarea_id=projarea_id,
+                                      page_size="100",
+                                      archived=archived,
+                                      returned_properties=rp,
+                                      title=plannedfor_name)
 
     def getSeverity(self,
                     severity_name,
@@ -653,15 +951,10 @@ class RTCClient(RTCBase):
             raise exception.EmptyAttrib("At least input either-or between "
                                         "projectarea_id and projectarea_name")
 
-        filter_rule = None
-        if severity_name is not None:
-            fsname_rule = ("dc:title", None, severity_name)
-            filter_rule = self._add_filter_rule(filter_rule, fsname_rule)
-
-        return self._get_paged_resources("Severity",
-                                         projectarea_id=projarea_id,
-                                         page_size="10",
-                                         filter_rule=filter_rule)
+        return self._get_enumerations("Severity",
+                                      projectarea_id=projarea_id,
+                                      page_size="10",
+                                      title=severity_name)
 
     def getPriority(self,
                     priority_name,
@@ -729,15 +1022,10 @@ class RTCClient(RTCBase):
             raise exception.EmptyAttrib("At least input either-or between "
                                         "projectarea_id and projectarea_name")
 
-        filter_rule = None
-        if priority_name is not None:
-            fpname_rule = ("dc:title", None, priority_name)
-            filter_rule = self._add_filter_rule(filter_rule, fpname_rule)
-
-        return self._get_paged_resources("Priority",
-                                         projectarea_id=projarea_id,
-                                         page_size="10",
-                                         filter_rule=filter_rule)
+        return self._get_enumerations("Priority",
+                                      projectarea_id=projarea_id,
+                                      page_size="10",
+                                      title=priority_name)
 
     def getFoundIn(self,
                    foundin_name,
@@ -808,15 +1096,11 @@ class RTCClient(RTCBase):
         projarea_id = self._pre_get_resource(projectarea_id=projectarea_id,
                                              projectarea_name=projectarea_name)
 
-        filter_rule = None
-        if foundin_name is not None:
-            ffname_rule = ("dc:title", None, foundin_name)
-            filter_rule = self._add_filter_rule(filter_rule, ffname_rule)
-        return self._get_paged_resources("FoundIn",
-                                         projectarea_id=projarea_id,
-                                         page_size="100",
-                                         archived=archived,
-                                         filter_rule=filter_rule)
+        return self._get_enumerations("FoundIn",
+                                      projectarea_id=projarea_id,
+                                      page_size="100",
+                                      archived=archived,
+                                      title=foundin_name)
 
     def getFiledAgainst(self,
                         filedagainst_name,
@@ -891,15 +1175,11 @@ class RTCClient(RTCBase):
         projarea_id = self._pre_get_resource(projectarea_id=projectarea_id,
                                              projectarea_name=projectarea_name)
 
-        filter_rule = None
-        if filedagainst_name is not None:
-            ffaname_rule = ("dc:title", None, filedagainst_name)
-            filter_rule = self._add_filter_rule(filter_rule, ffaname_rule)
-        return self._get_paged_resources("FiledAgainst",
-                                         projectarea_id=projarea_id,
-                                         page_size="100",
-                                         archived=archived,
-                                         filter_rule=filter_rule)
+        return self._get_enumerations("FiledAgainst",
+                                      projectarea_id=projarea_id,
+                                      page_size="100",
+                                      archived=archived,
+                                      title=filedagainst_name)
 
     def getTemplate(self,
                     copied_from,
@@ -939,6 +1219,20 @@ class RTCClient(RTCBase):
                                     keep=keep,
                                     encoding=encoding)
 
+    def refreshTemplates(self, copied_from=None):
+        """Fetch the to-be-copied workitems from the server again on the
+        next use
+
+        The to-be-copied workitems and the templates derived from them are
+        kept for `template_ttl` seconds, unless they are changed by this
+        client. Call it when they are changed elsewhere in the meantime.
+
+        :param copied_from: the to-be-copied workitem id. If `None`, all the
+            workitems are refreshed
+        """
+
+        self.templater.refresh(copied_from=copied_from)
+
     def listFields(self, template):
         """List all the attributes to be rendered from the template file
 
@@ -965,25 +1259,21 @@ class RTCClient(RTCBase):
 
         return self.templater.listFieldsFromWorkitem(copied_from, keep=keep)
 
-    def getWorkitem(self, workitem_id, returned_properties=None):
+    def getWorkitem(self, workitem_id, returned_properties=None, lazy=False):
         """Get :class:`rtcclient.workitem.Workitem` object by its id/number
 
         :param workitem_id: the workitem id/number
             (integer or equivalent string)
         :param returned_properties: the returned properties that you want.
             Refer to :class:`rtcclient.client.RTCClient` for more explanations
+        :param lazy: (default is False) If `True`, the linked fields
+            (e.g. ownedBy, severity) are only resolved when accessed
         :return: the :class:`rtcclient.workitem.Workitem` object
         :rtype: rtcclient.workitem.Workitem
         """
 
+        workitem_id = self._validate_workitem_id(workitem_id)
         try:
-            if isinstance(workitem_id, bool):
-                raise ValueError("Invalid Workitem id")
-            if isinstance(workitem_id, six.string_types):
-                workitem_id = int(workitem_id)
-            if not isinstance(workitem_id, int):
-                raise ValueError("Invalid Workitem id")
-
             workitem_url = "/".join(
                 [self.url, "oslc/workitems/%s" % workitem_id])
 
@@ -999,32 +1289,203 @@ class RTCClient(RTCBase):
                             proxies=self.proxies,
                             headers=self.headers,
                             cookies=self.cookies)
-            raw_data = xmltodict.parse(resp.content)
+            raw_data = self.parser.parse(resp.content)
             workitem_raw = raw_data["oslc_cm:ChangeRequest"]
 
             return Workitem(workitem_url,
                             self,
                             workitem_id=workitem_id,
-                            raw_data=workitem_raw)
+                            raw_data=workitem_raw,
+                            lazy=lazy)
 
+        except Exception as excp:
+            self.log.error(excp)
+            raise exception.NotFound("Not found <Workitem %s>" % workitem_id)
+
+    def getWorkitemsByIDs(self,
+                          workitem_ids,
+                          returned_properties=None,
+                          projectarea_id=None,
+                          projectarea_name=None,
+                          lazy=False):
+        """Get many :class:`rtcclient.workitem.Workitem` objects by their
+        ids/numbers concurrently
+
+        If either of `projectarea_id` and `projectarea_name` is given, the
+        workitems are fetched with the OSLC queries on `dc:identifier`,
+        each of which covers as many ids as the url length allows.
+        Otherwise, each workitem is requested separately. The number of
+        the concurrent requests is bounded by `max_workers` of
+        :class:`rtcclient.client.RTCClient`.
+
+        The failure of some ids does not abort the others: the exception
+        (e.g. :class:`rtcclient.exception.NotFound` or
+        :class:`rtcclient.exception.BadValue`) is returned in their place.
+
+        :param workitem_ids: an iterable that contains the workitem
+            ids/numbers (integer or equivalent string)
+        :param returned_properties: the returned properties that you want.
+            Refer to :class:`rtcclient.client.RTCClient` for more explanations
+        :param projectarea_id: the :class:`rtcclient.project_area.ProjectArea`
+            id
+        :param projectarea_name: the project area name
+        :param lazy: (default is False) If `True`, the linked fields
+            (e.g. ownedBy, severity) are only resolved when accessed
+        :return: a :class:`list` that contains the
+            :class:`rtcclient.workitem.Workitem` object or the exception
+            for each id in the input order
+        :rtype: list
+        """
+
+        validated_ids = list()
+        for workitem_id in workitem_ids:
+            try:
+                validated_ids.append(self._validate_workitem_id(workitem_id))
+            except exception.BadValue as excp:
+                validated_ids.append(excp)
+        # each id is only fetched once
+        valid_ids = list(
+            OrderedDict.fromkeys(
+                validated_id for validated_id in validated_ids
+                if not isinstance(validated_id, exception.RTCException)))
+
+        results = dict()
+        pa_id = self._pre_get_resource(projectarea_id=projectarea_id,
+                                       projectarea_name=projectarea_name)
+        if pa_id is None:
+            fetched = self.executor.map(
+                functools.partial(self._get_workitem_or_error,
+                                  returned_properties=returned_properties,
+                                  lazy=lazy),
+                valid_ids)
+            results.update(zip(valid_ids, fetched))
+        else:
+            chunks = self._chunk_workitem_ids(valid_ids)
+            self.log.debug("Query %s workitems with %s queries",
+                           len(valid_ids), len(chunks))
+            for fetched in self.executor.map(
+                    functools.partial(self._query_workitems_by_ids,
+                                      pa_id,
+                                      returned_properties=returned_properties,
+                                      lazy=lazy),
+                    chunks):
+                results.update(fetched)
+
+        return [
+            validated_id if isinstance(validated_id, exception.RTCException)
+            else results[validated_id] for validated_id in validated_ids
+        ]
+
+    def _validate_workitem_id(self, workitem_id):
+        try:
+            if isinstance(workitem_id, bool):
+                raise ValueError("Invalid Workitem id")
+            if isinstance(workitem_id, six.string_types):
+                workitem_id = int(workitem_id)
+            if not isinstance(workitem_id, int):
+                raise ValueError("Invalid Workitem id")
         except ValueError:
             excp_msg = "Please input a valid workitem id"
             self.log.error(excp_msg)
             raise exception.BadValue(excp_msg)
+        return workitem_id
+
+    def _get_workitem_or_error(self,
+                               workitem_id,
+                               returned_properties=None,
+                               lazy=False):
+        try:
+            return self.getWorkitem(workitem_id,
+                                    returned_properties=returned_properties,
+                                    lazy=lazy)
+        except exception.RTCException as excp:
+            return excp
+
+    def _chunk_workitem_ids(self, workitem_ids):
+        """Split the ids so that each query string fits in the url"""
+
+        chunks = list()
+        chunk = list()
+        chunk_length = 0
+        for workitem_id in workitem_ids:
+            id_length = len(str(workitem_id)) + _QUOTED_SEPARATOR_LENGTH
+            if chunk and chunk_length + id_length > _MAX_QUERY_LENGTH:
+                chunks.append(chunk)
+                chunk = list()
+                chunk_length = 0
+            chunk.append(workitem_id)
+            chunk_length += id_length
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _query_workitems_by_ids(self,
+                                projectarea_id,
+                                workitem_ids,
+                                returned_properties=None,
+                                lazy=False):
+        rp = self._validate_returned_properties(returned_properties)
+        if rp is not None and "dc:identifier" not in rp:
+            rp += ",dc:identifier"
+        query_str = "dc:identifier in [%s]" % ",".join(
+            str(workitem_id) for workitem_id in workitem_ids)
+
+        try:
+            workitems = self._get_paged_resources(
+                "Query",
+                projectarea_id=projectarea_id,
+                customized_attr=urlquote(query_str),
+                page_size="100",
+                archived=None,
+                returned_properties=rp,
+                lazy=lazy) or []
         except Exception as excp:
-            self.log.error(excp)
-            raise exception.NotFound("Not found <Workitem %s>" % workitem_id)
+            self.log.error("Failed to query the workitems %s: %s",
+                           workitem_ids, excp)
+            # request the workitems one by one instead
+            return dict(
+                (workitem_id,
+                 self._get_workitem_or_error(workitem_id,
+                                             returned_properties=rp,
+                                             lazy=lazy))
+                for workitem_id in workitem_ids)
+
+        fetched = dict(
+            (str(workitem.identifier), workitem) for workitem in workitems)
+        results = dict()
+        for workitem_id in workitem_ids:
+            workitem = fetched.get(str(workitem_id))
+            if workitem is None:
+                excp_msg = "Not found <Workitem %s>" % workitem_id
+                self.log.error(excp_msg)
+                workitem = exception.NotFound(excp_msg)
+            results[workitem_id] = workitem
+        return results
 
     def getWorkitems(self,
                      projectarea_id=None,
                      projectarea_name=None,
                      returned_properties=None,
-                     archived=False):
+                     archived=False,
+                     lazy=False,
+                     compact=False,
+                     keep_raw=False,
+                     partitioned=False,
+                     max_workers=None,
+                     by_projectarea=False):
         """Get all :class:`rtcclient.workitem.Workitem` objects by
         project area id or name
 
         If both `projectarea_id` and `projectarea_name` are `None`,
-        all the workitems in all project areas will be returned.
+        all the workitems in all project areas will be returned. The
+        project areas are fetched concurrently, and at most `max_workers`
+        of them at the same time.
+
+        Only the latest 1000 workitems of a project area can be fetched at
+        once. If `partitioned` is set, the workitems are split into the
+        disjoint windows of `dc:created`, each of which contains less than
+        1000 workitems, and the windows are fetched concurrently, so that
+        all the workitems are returned.
 
         If no :class:`rtcclient.workitem.Workitem` objects are retrieved,
         `None` is returned.
@@ -1038,12 +1499,464 @@ class RTCClient(RTCBase):
         :param returned_properties: the returned properties that you want.
             Refer to :class:`rtcclient.client.RTCClient` for more explanations
         :param archived: (default is False) whether the workitems are archived
+        :param lazy: (default is False) If `True`, the linked fields
+            (e.g. ownedBy, severity) are only resolved when accessed
+        :param compact: (default is False) If `True`, the workitems are
+            returned as the compact and read-only
+            :class:`rtcclient.record.WorkitemRecord` objects, which take
+            much less memory for the bulk reads
+        :param keep_raw: (default is False) whether the compact records
+            retain the raw data, which saves the request when converting
+            them to the full workitems
+        :param partitioned: (default is False) whether to fetch the
+            workitems by the windows of `dc:created` to get more than 1000
+            workitems of a project area
+        :param max_workers: (optional) the maximum number of the project
+            areas fetched at the same time, which is bounded by
+            `max_workers` of :class:`rtcclient.client.RTCClient`
+        :param by_projectarea: (default is False) If `True`, an
+            :class:`OrderedDict` that maps each project area id to the
+            :class:`list` of its workitems is returned instead
         :return: a :class:`list` that contains all the
             :class:`rtcclient.workitem.Workitem` objects
         :rtype: list
         """
 
+        projectarea_ids = self._get_workitems_projectarea_ids(
+            projectarea_id=projectarea_id,
+            projectarea_name=projectarea_name,
+            warn_limit=not partitioned)
+        if projectarea_ids is None:
+            return None
+
+        fetched = dict(
+            self._iter_projectarea_workitems(
+                projectarea_ids,
+                returned_properties=returned_properties,
+                archived=archived,
+                lazy=lazy,
+                compact=compact,
+                keep_raw=keep_raw,
+                partitioned=partitioned,
+                max_workers=max_workers))
+        if by_projectarea:
+            return OrderedDict(
+                (projarea_id, fetched[projarea_id])
+                for projarea_id in projectarea_ids)
+
         workitems_list = list()
+        for projarea_id in projectarea_ids:
+            workitems_list.extend(fetched[projarea_id])
+
+        if not workitems_list:
+            self.log.warning("Cannot find a workitem in the ProjectAreas "
+                             "with ids: %s" % projectarea_ids)
+            return None
+        return workitems_list
+
+    def iterProjectAreaWorkitems(self,
+                                 projectarea_id=None,
+                                 projectarea_name=None,
+                                 returned_properties=None,
+                                 archived=False,
+                                 lazy=False,
+                                 compact=False,
+                                 keep_raw=False,
+                                 partitioned=False,
+                                 max_workers=None):
+        """Get the :class:`rtcclient.workitem.Workitem` objects of the
+        project areas concurrently, and yield them as soon as each project
+        area is completed
+
+        It works like :class:`rtcclient.client.RTCClient.getWorkitems`,
+        except that the workitems of each project area are yielded in the
+        order of completion. Closing the generator cancels the project
+        areas not started yet.
+
+        :param max_workers: (optional) the maximum number of the project
+            areas fetched at the same time, which is bounded by
+            `max_workers` of :class:`rtcclient.client.RTCClient`
+        :return: a generator that yields the project area id and the
+            :class:`list` of its workitems
+        :rtype: generator
+        """
+
+        projectarea_ids = self._get_workitems_projectarea_ids(
+            projectarea_id=projectarea_id,
+            projectarea_name=projectarea_name,
+            warn_limit=not partitioned)
+        if projectarea_ids is None:
+            return
+
+        fetched = self._iter_projectarea_workitems(
+            projectarea_ids,
+            returned_properties=returned_properties,
+            archived=archived,
+            lazy=lazy,
+            compact=compact,
+            keep_raw=keep_raw,
+            partitioned=partitioned,
+            max_workers=max_workers)
+        try:
+            for projarea_id, workitems in fetched:
+                yield projarea_id, workitems
+        finally:
+            fetched.close()
+
+    def _iter_projectarea_workitems(self,
+                                    projectarea_ids,
+                                    returned_properties=None,
+                                    archived=False,
+                                    lazy=False,
+                                    compact=False,
+                                    keep_raw=False,
+                                    partitioned=False,
+                                    max_workers=None):
+        """Fetch the workitems of the project areas concurrently
+
+        :return: a generator that yields the project area id and the
+            :class:`list` of its workitems in the order of completion
+        """
+
+        self._validate_max_workers(max_workers)
+        fetch = functools.partial(
+            self._get_projectarea_workitems,
+            returned_properties=self._validate_returned_properties(
+                returned_properties),
+            archived=archived,
+            lazy=lazy,
+            resource_builder=self._get_workitem_builder(compact=compact,
+                                                        keep_raw=keep_raw),
+            partitioned=partitioned)
+        completed = self.executor.imap_unordered(fetch,
+                                                 projectarea_ids,
+                                                 limit=max_workers)
+        try:
+            for projarea_id, future in completed:
+                workitems = future.result()
+                self.log.debug("Fetched %s workitems of <ProjectArea %s>",
+                               len(workitems), projarea_id)
+                yield projarea_id, workitems
+        finally:
+            completed.close()
+
+    def _validate_max_workers(self, max_workers):
+        if max_workers is not None and (not isinstance(max_workers, int) or
+                                        max_workers <= 0):
+            excp_msg = "Invalid max_workers: %s" % max_workers
+            self.log.error(excp_msg)
+            raise exception.BadValue(excp_msg)
+
+    def _get_projectarea_workitems(self,
+                                   projectarea_id,
+                                   returned_properties=None,
+                                   archived=False,
+                                   lazy=False,
+                                   resource_builder=None,
+                                   partitioned=False):
+        if partitioned:
+            query_strs = self._get_window_queries(projectarea_id,
+                                                  "dc:created")
+            workitems = self._get_window_workitems(
+                projectarea_id,
+                query_strs,
+                returned_properties=returned_properties,
+                archived=archived,
+                lazy=lazy,
+                resource_builder=resource_builder)
+            return list(workitems.values())
+
+        workitems = self._get_paged_resources(
+            "Workitem",
+            projectarea_id=projectarea_id,
+            page_size="100",
+            returned_properties=returned_properties,
+            archived=archived,
+            lazy=lazy,
+            resource_builder=resource_builder)
+        return workitems or list()
+
+    def iterWorkitems(self,
+                      projectarea_id=None,
+                      projectarea_name=None,
+                      returned_properties=None,
+                      archived=False,
+                      lazy=False,
+                      stream=False,
+                      compact=False,
+                      keep_raw=False):
+        """Iterate all :class:`rtcclient.workitem.Workitem` objects by
+        project area id or name
+
+        It works like :class:`rtcclient.client.RTCClient.getWorkitems`,
+        except that the workitems are yielded page by page as soon as they
+        are fetched instead of being returned altogether. Only one page is
+        kept in memory, and closing the generator stops fetching the
+        further pages.
+
+        If `stream` is set, each page is parsed while it is downloaded,
+        and every workitem is yielded as soon as its entry is received, so
+        that only one entry is kept in memory. The pages are then always
+        parsed with :mod:`lxml` and requested one after another.
+
+        :param projectarea_id: the :class:`rtcclient.project_area.ProjectArea`
+            id
+        :param projectarea_name: the project area name
+        :param returned_properties: the returned properties that you want.
+            Refer to :class:`rtcclient.client.RTCClient` for more explanations
+        :param archived: (default is False) whether the workitems are archived
+        :param lazy: (default is False) If `True`, the linked fields
+            (e.g. ownedBy, severity) are only resolved when accessed
+        :param stream: (default is False) whether to parse the pages
+            incrementally
+        :param compact: (default is False) If `True`, the workitems are
+            returned as the compact and read-only
+            :class:`rtcclient.record.WorkitemRecord` objects, which take
+            much less memory for the bulk reads
+        :param keep_raw: (default is False) whether the compact records
+            retain the raw data, which saves the request when converting
+            them to the full workitems
+        :return: a generator that yields the
+            :class:`rtcclient.workitem.Workitem` objects
+        :rtype: generator
+        """
+
+        projectarea_ids = self._get_workitems_projectarea_ids(
+            projectarea_id=projectarea_id, projectarea_name=projectarea_name)
+        if projectarea_ids is None:
+            return
+
+        rp = self._validate_returned_properties(returned_properties)
+        builder = self._get_workitem_builder(compact=compact,
+                                             keep_raw=keep_raw)
+        for projarea_id in projectarea_ids:
+            workitems = self._iter_paged_resources("Workitem",
+                                                   projectarea_id=projarea_id,
+                                                   page_size="100",
+                                                   returned_properties=rp,
+                                                   archived=archived,
+                                                   lazy=lazy,
+                                                   stream=stream,
+                                                   resource_builder=builder)
+            for workitem in workitems:
+                yield workitem
+
+    def syncWorkitems(self,
+                      watermark=None,
+                      projectarea_id=None,
+                      projectarea_name=None,
+                      returned_properties=None,
+                      archived=False,
+                      lazy=False,
+                      compact=False,
+                      keep_raw=False):
+        """Get the :class:`rtcclient.workitem.Workitem` objects modified
+        since the watermark, which is the latest `dc:modified` seen by the
+        last sync
+
+        Only the workitems whose `dc:modified` is later than the watermark
+        are queried. Since only the latest 1000 workitems of a query can be
+        fetched, the period is split into the time windows, each of which
+        contains less than 1000 workitems according to the total count
+        reported by the server.
+
+        If both `projectarea_id` and `projectarea_name` are `None`, the
+        workitems in all project areas are synchronized.
+
+        :param watermark: (optional) the watermark returned by the last
+            sync, as the RTC timestamp (e.g. "2010-02-16T16:04:00.244Z") or
+            a :class:`datetime.datetime` object in UTC. If `None`, all the
+            workitems are fetched
+        :param projectarea_id: the :class:`rtcclient.project_area.ProjectArea`
+            id
+        :param projectarea_name: the project area name
+        :param returned_properties: the returned properties that you want,
+            which always include `dc:modified`. Refer to
+            :class:`rtcclient.client.RTCClient` for more explanations
+        :param archived: (default is False) whether the workitems are archived
+        :param lazy: (default is False) If `True`, the linked fields
+            (e.g. ownedBy, severity) are only resolved when accessed
+        :param compact: (default is False) If `True`, the workitems are
+            returned as the compact and read-only
+            :class:`rtcclient.record.WorkitemRecord` objects
+        :param keep_raw: (default is False) whether the compact records
+            retain the raw data
+        :return: a :class:`tuple` of the :class:`list` of the modified
+            workitems, and the new watermark to store for the next sync,
+            which is the given one if no workitems are modified
+        :rtype: tuple
+        """
+
+        since = parse_rtc_time(watermark) if watermark is not None else None
+        projectarea_ids = self._get_workitems_projectarea_ids(
+            projectarea_id=projectarea_id,
+            projectarea_name=projectarea_name,
+            warn_limit=False)
+        if projectarea_ids is None:
+            return list(), watermark
+
+        rp = self._validate_returned_properties(returned_properties)
+        if rp is not None and "dc:modified" not in rp:
+            rp += ",dc:modified"
+        builder = self._get_workitem_builder(compact=compact,
+                                             keep_raw=keep_raw)
+
+        # the workitems modified during the sync may be found twice
+        workitems = OrderedDict()
+        for projarea_id in projectarea_ids:
+            query_strs = self._get_window_queries(projarea_id,
+                                                  "dc:modified",
+                                                  since=since)
+            workitems.update(
+                self._get_window_workitems(projarea_id,
+                                           query_strs,
+                                           returned_properties=rp,
+                                           archived=archived,
+                                           lazy=lazy,
+                                           resource_builder=builder))
+
+        modified_times = [
+            parse_rtc_time(workitem.modified)
+            for workitem in workitems.values()
+            if getattr(workitem, "modified", None)
+        ]
+        if modified_times:
+            new_watermark = format_rtc_time(max(modified_times))
+        elif watermark is not None:
+            new_watermark = format_rtc_time(watermark)
+        else:
+            new_watermark = None
+
+        self.log.info("Found %s workitems modified since %s",
+                      len(workitems), watermark)
+        return list(workitems.values()), new_watermark
+
+    def _get_window_queries(self, projectarea_id, time_attr, since=None):
+        """Split the period since the time into the disjoint time windows,
+        each of which is small enough to fetch all its workitems
+
+        The windows are probed for their total counts, and the ones that
+        reach the limit of the server are split into halves, until the
+        precision of the timestamps. The windows of the same level are
+        probed concurrently.
+
+        The current time of the client is only used to choose where the
+        period is split, and the latest window is never bounded above, so
+        that the workitems with the later timestamps (e.g. because of the
+        clock skew) are still fetched.
+
+        :param time_attr: the timestamp of the workitems (e.g.
+            `dc:modified` or `dc:created`)
+        :param since: the naive :class:`datetime.datetime` object in UTC,
+            after which the timestamps are
+        :return: a :class:`list` of the query strings of the windows in
+            the order of time
+        :rtype: list
+        """
+
+        query_str = self._get_window_query(time_attr, since, None)
+        total_count = self._count_query_results(projectarea_id, query_str)
+        if total_count < _MAX_QUERY_RESULTS:
+            return [query_str] if total_count else []
+
+        now = _truncate_rtc_time(datetime.datetime.now(datetime.timezone.utc))
+        windows = [(_truncate_rtc_time(since or _EPOCH), None)]
+        found_windows = list()
+        while windows:
+            query_strs = [
+                self._get_window_query(time_attr, start, end)
+                for start, end in windows
+            ]
+            total_counts = self.executor.map(
+                functools.partial(self._count_query_results, projectarea_id),
+                query_strs)
+
+            split_windows = list()
+            for (start, end), query_str, total_count in zip(
+                    windows, query_strs, total_counts):
+                split_end = now if end is None else end
+                if total_count >= _MAX_QUERY_RESULTS:
+                    if split_end - start > _MIN_TIME_WINDOW:
+                        middle = _truncate_rtc_time(start +
+                                                    (split_end - start) // 2)
+                        split_windows.extend([(start, middle), (middle, end)])
+                        continue
+                    self.log.warning(
+                        "Only the latest %s workitems with %s between %s and "
+                        "%s can be fetched", _MAX_QUERY_RESULTS, time_attr,
+                        start, end or "now")
+                if total_count:
+                    self.log.debug("Found %s workitems with %s between %s "
+                                   "and %s", total_count, time_attr, start,
+                                   end or "now")
+                    found_windows.append((start, query_str))
+            windows = split_windows
+
+        self.log.debug("Split the workitems into %s windows of %s",
+                       len(found_windows), time_attr)
+        return [query_str for _, query_str in sorted(found_windows)]
+
+    def _get_window_query(self, time_attr, start=None, end=None):
+        clauses = ['%s>"%s"' % (time_attr, format_rtc_time(start or _EPOCH))]
+        if end is not None:
+            clauses.append('%s<="%s"' % (time_attr, format_rtc_time(end)))
+        return " and ".join(clauses)
+
+    def _get_window_workitems(self,
+                              projectarea_id,
+                              query_strs,
+                              returned_properties=None,
+                              archived=False,
+                              lazy=False,
+                              resource_builder=None):
+        """Fetch the workitems of the time windows concurrently
+
+        :return: an :class:`OrderedDict` of the workitems keyed by their
+            urls in the order of the windows, without the duplicates
+        :rtype: OrderedDict
+        """
+
+        def fetch_window(query_str):
+            return self._get_paged_resources(
+                "Query",
+                projectarea_id=projectarea_id,
+                customized_attr=urlquote(query_str),
+                page_size="100",
+                returned_properties=returned_properties,
+                archived=archived,
+                lazy=lazy,
+                resource_builder=resource_builder)
+
+        windows = self.executor.map(fetch_window, query_strs)
+
+        workitems = OrderedDict()
+        for found in windows:
+            for workitem in found or []:
+                workitems[workitem.url] = workitem
+        return workitems
+
+    def _count_query_results(self, projectarea_id, query_str):
+        """Get the total count of the queried workitems from the first page
+        of a single entry
+
+        :rtype: int
+        """
+
+        resource_url, _ = self._get_paged_resources_url(
+            "Query",
+            projectarea_id=projectarea_id,
+            customized_attr=urlquote(query_str),
+            page_size="1",
+            returned_properties="dc:identifier")
+        raw_data = self._get_collection_page(resource_url)
+        total_count = raw_data.get("oslc_cm:Collection").get(
+            "@oslc_cm:totalCount")
+        return int(total_count) if total_count is not None else 0
+
+    def _get_workitems_projectarea_ids(self,
+                                       projectarea_id=None,
+                                       projectarea_name=None,
+                                       warn_limit=True):
         projectarea_ids = list()
         if not isinstance(projectarea_id,
                           six.string_types) or not projectarea_id:
@@ -1060,25 +1973,22 @@ class RTCClient(RTCBase):
                 raise exception.BadValue("Invalid ProjectAred ID: "
                                          "%s" % projectarea_id)
 
-        self.log.warning("For a single ProjectArea, only latest 1000 "
-                         "workitems can be fetched. "
-                         "This may be a bug of Rational Team Concert")
+        if warn_limit:
+            self.log.warning("For a single ProjectArea, only latest 1000 "
+                             "workitems can be fetched. "
+                             "This may be a bug of Rational Team Concert")
+        return projectarea_ids
 
-        rp = self._validate_returned_properties(returned_properties)
-        for projarea_id in projectarea_ids:
-            workitems = self._get_paged_resources("Workitem",
-                                                  projectarea_id=projarea_id,
-                                                  page_size="100",
-                                                  returned_properties=rp,
-                                                  archived=archived)
-            if workitems is not None:
-                workitems_list.extend(workitems)
+    def _get_workitem_builder(self, compact=False, keep_raw=False):
+        """Get the callable to build the workitems from the entries
 
-        if not workitems_list:
-            self.log.warning("Cannot find a workitem in the ProjectAreas "
-                             "with ids: %s" % projectarea_ids)
+        :return: the builder of the compact records, or `None` to build the
+            :class:`rtcclient.workitem.Workitem` objects
+        """
+
+        if not compact:
             return None
-        return workitems_list
+        return functools.partial(WorkitemRecord.fromRaw, keep_raw=keep_raw)
 
     def _validate_returned_properties(self, returned_properties=None):
         if returned_properties is not None:
@@ -1124,13 +2034,9 @@ class RTCClient(RTCBase):
         :rtype: rtcclient.workitem.Workitem
         """
 
-        if not isinstance(projectarea_id,
-                          six.string_types) or not projectarea_id:
-            projectarea = self.getProjectArea(projectarea_name)
-            projectarea_id = projectarea.id
-        else:
-            projectarea = self.getProjectAreaByID(projectarea_id)
-
+        projectarea = self._get_create_projectarea(projectarea_id,
+                                                   projectarea_name)
+        projectarea_id = projectarea.id
         itemtype = projectarea.getItemType(item_type)
 
         if not template:
@@ -1168,6 +2074,125 @@ class RTCClient(RTCBase):
         ])
         return self._createWorkitem(wi_url_post, wi_raw)
 
+    def createWorkitems(self,
+                        records,
+                        projectarea_id=None,
+                        projectarea_name=None,
+                        template=None,
+                        copied_from=None,
+                        keep=False,
+                        max_workers=None):
+        """Create many workitems in one project area
+
+        Unlike calling :class:`rtcclient.client.RTCClient.createWorkitem`
+        for each workitem, the project area, the workitem types, the
+        template and the keywords (e.g. ownedBy, severity) shared by the
+        workitems are only looked up once. All the workitems are rendered
+        before any of them is posted, and then posted concurrently.
+
+        :param records: an iterable that contains the
+            `(item_type, title, description, kwargs)` tuples of the
+            workitems, where `description` and `kwargs` (a :class:`dict`
+            of the optional/mandatory arguments) can be omitted
+        :param projectarea_id: the :class:`rtcclient.project_area.ProjectArea`
+            id
+        :param projectarea_name: the project area name
+        :param template: The template to render. Refer to `template` in
+            :class:`rtcclient.client.RTCClient.createWorkitem`
+        :param copied_from: the to-be-copied workitem id
+        :param keep: refer to `keep` in
+            :class:`rtcclient.template.Templater.getTemplate`. Only works when
+            `template` is not specified
+        :param max_workers: (optional) the maximum number of the workitems
+            posted at the same time, which is bounded by `max_workers` of
+            :class:`rtcclient.client.RTCClient`
+        :return: a :class:`list` that contains, in the order of `records`,
+            the new :class:`rtcclient.workitem.Workitem` object or the
+            exception raised when creating each workitem
+        :rtype: list
+        """
+
+        records = list(records)
+        if not template and not copied_from:
+            self.log.error("Please choose either-or between "
+                           "template and copied_from")
+            raise exception.EmptyAttrib("At least choose either-or "
+                                        "between template and copied_from")
+        self._validate_max_workers(max_workers)
+
+        projectarea = self._get_create_projectarea(projectarea_id,
+                                                   projectarea_name)
+        if template:
+            parameters = self.listFields(template)
+            render = functools.partial(self.templater.render, template)
+        else:
+            temp_source = self.templater.getTemplate(copied_from,
+                                                     keep=keep,
+                                                     encoding="UTF-8")
+            parameters = self.templater.listFieldsFromSource(temp_source)
+            render = functools.partial(self.templater.renderFromSource,
+                                       temp_source)
+
+        results = [None] * len(records)
+        parsed = list()
+        for index, record in enumerate(records):
+            try:
+                item_type, title, description, kwargs = (
+                    self._parse_create_record(record))
+                self._findMissingParams(set(parameters), **kwargs)
+            except Exception as excp:
+                results[index] = excp
+                continue
+            parsed.append((index, item_type, title, description, kwargs))
+
+        itemtypes = self._get_create_itemtypes(
+            projectarea, set(item[1] for item in parsed))
+        resolved = self._get_create_urls(projectarea.id,
+                                         [item[4] for item in parsed])
+
+        posted = list()
+        for index, item_type, title, description, kwargs in parsed:
+            try:
+                itemtype = itemtypes[item_type]
+                if isinstance(itemtype, Exception):
+                    raise itemtype
+                for keyword, value in kwargs.items():
+                    if isinstance(value, six.string_types):
+                        kwargs[keyword] = resolved[(keyword, value)]
+                    else:
+                        kwargs[keyword] = self._retrieveValidURL(
+                            projectarea.id, keyword, value)
+                wi_raw = render(title=title, description=description, **kwargs)
+            except Exception as excp:
+                self.log.error("Unable to render the workitem %s: %s", index,
+                               excp)
+                results[index] = excp
+                continue
+            wi_url_post = "/".join([
+                self.url, "oslc/contexts", projectarea.id,
+                "workitems/%s" % itemtype.identifier
+            ])
+            posted.append((index, wi_url_post, wi_raw))
+
+        self.log.info("Start to create %s new <Workitem>s in %s", len(posted),
+                      projectarea)
+        completed = self.executor.imap_unordered(
+            lambda item: self._createWorkitem(item[1], item[2]),
+            posted,
+            limit=max_workers)
+        for item, future in completed:
+            try:
+                results[item[0]] = future.result()
+            except Exception as excp:
+                self.log.error("Unable to create the workitem %s: %s",
+                               item[0], excp)
+                results[item[0]] = excp
+
+        self.log.info("Successfully create %s of %s workitems",
+                      sum(1 for result in results
+                          if isinstance(result, Workitem)), len(records))
+        return results
+
     def copyWorkitem(self,
                      copied_from,
                      title=None,
@@ -1186,7 +2211,7 @@ class RTCClient(RTCBase):
         :rtype: rtcclient.workitem.Workitem
         """
 
-        copied_wi = self.getWorkitem(copied_from)
+        copied_wi = self._get_copied_workitem(copied_from)
         if title is None:
             title = copied_wi.title
             if prefix is not None:
@@ -1216,6 +2241,25 @@ class RTCClient(RTCBase):
                                                    description=description)
         return self._createWorkitem(wi_url_post, wi_raw)
 
+    def _get_copied_workitem(self, copied_from):
+        """Get the to-be-copied workitem from the raw data cached by the
+        templater, which is shared with the templates derived from it
+        """
+
+        workitem_id = self._validate_workitem_id(copied_from)
+        try:
+            raw_data = self.templater.getWorkitemRaw(workitem_id)
+            workitem_url = "/".join(
+                [self.url, "oslc/workitems/%s" % workitem_id])
+            return Workitem(workitem_url,
+                            self,
+                            workitem_id=workitem_id,
+                            raw_data=raw_data["oslc_cm:ChangeRequest"],
+                            lazy=True)
+        except Exception as excp:
+            self.log.error(excp)
+            raise exception.NotFound("Not found <Workitem %s>" % workitem_id)
+
     def _createWorkitem(self, url_post, workitem_raw):
         headers = copy.deepcopy(self.headers)
         headers['Content-Type'] = self.OSLC_CR_XML
@@ -1227,7 +2271,7 @@ class RTCClient(RTCBase):
                          proxies=self.proxies,
                          data=workitem_raw)
 
-        raw_data = xmltodict.parse(resp.content)
+        raw_data = self.parser.parse(resp.content)
         workitem_raw = raw_data["oslc_cm:ChangeRequest"]
         workitem_id = workitem_raw["dc:identifier"]
         workitem_url = "/".join([self.url, "oslc/workitems/%s" % workitem_id])
@@ -1239,6 +2283,67 @@ class RTCClient(RTCBase):
         self.log.info("Successfully create <Workitem %s>" % new_wi)
         return new_wi
 
+    def _get_create_projectarea(self, projectarea_id=None,
+                                projectarea_name=None):
+        if not isinstance(projectarea_id,
+                          six.string_types) or not projectarea_id:
+            return self.getProjectArea(projectarea_name)
+        return self.getProjectAreaByID(projectarea_id)
+
+    def _parse_create_record(self, record):
+        """Parse the `(item_type, title, description, kwargs)` tuple, whose
+        `description` and `kwargs` can be omitted
+        """
+
+        if (not isinstance(record, (tuple, list)) or
+                not 2 <= len(record) <= 4):
+            excp_msg = "Invalid workitem record: %s" % (record,)
+            self.log.error(excp_msg)
+            raise exception.BadValue(excp_msg)
+
+        item_type, title, description, kwargs = (tuple(record) +
+                                                 (None, None))[:4]
+        if kwargs is None:
+            kwargs = dict()
+        elif not isinstance(kwargs, dict):
+            excp_msg = "Invalid kwargs of the workitem record: %s" % (kwargs,)
+            self.log.error(excp_msg)
+            raise exception.BadValue(excp_msg)
+        return item_type, title, description, dict(kwargs)
+
+    def _get_create_itemtypes(self, projectarea, item_types):
+        """Get the workitem types, or the exceptions raised when getting
+        them
+
+        :return: a :class:`dict` mapping each workitem type to the
+            :class:`rtcclient.models.ItemType` object or the exception
+        """
+
+        itemtypes = dict()
+        for item_type in item_types:
+            try:
+                itemtypes[item_type] = projectarea.getItemType(item_type)
+            except Exception as excp:
+                itemtypes[item_type] = excp
+        return itemtypes
+
+    def _get_create_urls(self, projectarea_id, kwargs_list):
+        """Get the rdf:resource urls of all the distinct keywords (e.g.
+        ownedBy, severity) concurrently
+
+        :return: a :class:`dict` mapping each `(keyword, value)` to its url
+        """
+
+        keywords = list(
+            set((keyword, value)
+                for kwargs in kwargs_list
+                for keyword, value in kwargs.items()
+                if isinstance(value, six.string_types)))
+        urls = self.executor.map(
+            lambda item: self._retrieveValidURL(projectarea_id, *item),
+            keywords)
+        return dict(zip(keywords, urls))
+
     def _checkMissingParams(self, template, **kwargs):
         """Check the missing parameters for rendering from the template file
         """
@@ -1260,15 +2365,19 @@ class RTCClient(RTCBase):
     def _retrieveValidInfo(self, projectarea_id, **kwargs):
         # get rdf:resource by keywords
         for keyword in kwargs.keys():
-            try:
-                keyword_cls = eval("self.get" + capitalize(keyword))
-                keyword_obj = keyword_cls(kwargs[keyword],
-                                          projectarea_id=projectarea_id)
-                kwargs[keyword] = keyword_obj.url
-            except Exception as excp:
-                self.log.error(excp)
+            kwargs[keyword] = self._retrieveValidURL(projectarea_id, keyword,
+                                                     kwargs[keyword])
         return kwargs
 
+    def _retrieveValidURL(self, projectarea_id, keyword, value):
+        try:
+            keyword_cls = getattr(self, "get" + capitalize(keyword))
+            keyword_obj = keyword_cls(value, projectarea_id=projectarea_id)
+            return keyword_obj.url
+        except Exception as excp:
+            self.log.error(excp)
+            return value
+
     def _findMissingParams(self, parameters, **kwargs):
         known_parameters = ["title", "description"]
         for known_parameter in known_parameters:
@@ -1318,6 +2427,119 @@ class RTCClient(RTCBase):
                 raise exception.BadValue("Invalid ProjectArea id")
             return projectarea_id
 
+    def _get_rdf_resource_titles(self, rdf_urls):
+        """Get the titles of the linked resources (rdf:resource)
+
+        The titles are looked up in the resource cache first. Each distinct
+        uncached url is only requested once, and all of them are requested
+        concurrently.
+
+        :param rdf_urls: an iterable that contains the rdf:resource urls
+        :return: a :class:`dict` mapping each url to its title. If the
+            resource cannot be handled, the url itself is kept as the title
+        :rtype: dict
+        """
+
+        rdf_titles = dict()
+        uncached_urls = list()
+        for rdf_url in set(rdf_urls):
+            local_title = get_local_link_title(rdf_url)
+            if local_title is not None:
+                rdf_titles[rdf_url] = local_title
+                continue
+            title = self.resource_cache.get(rdf_url, _UNRESOLVED)
+            if title is _UNRESOLVED:
+                uncached_urls.append(rdf_url)
+            else:
+                rdf_titles[rdf_url] = title
+
+        if uncached_urls:
+            titles = self.executor.map(self._get_rdf_resource_title,
+                                       uncached_urls)
+            rdf_titles.update(zip(uncached_urls, titles))
+        return rdf_titles
+
+    def _get_rdf_resource_title(self, rdf_url):
+        local_title = get_local_link_title(rdf_url)
+        if local_title is not None:
+            return local_title
+
+        try:
+            resp = self.get(rdf_url,
+                            verify=False,
+                            proxies=self.proxies,
+                            headers=self.headers,
+                            cookies=self.cookies)
+            raw_data = self.parser.parse(resp.content)
+            title = self._handle_rdf_raw(raw_data)
+        except (exception.RTCException, Exception):
+            self.log.error("Unable to handle %s", rdf_url)
+            return rdf_url
+
+        self.resource_cache.set(rdf_url, title)
+        return title
+
+    def _handle_rdf_raw(self, raw_data):
+        root_key = list(raw_data.keys())[0]
+        total_count = raw_data[root_key].get("@oslc_cm:totalCount")
+        if total_count is None:
+            # no total count
+            # only single resource
+            # compatible with IncludedInBuild
+            return raw_data[root_key].get("dc:title") or raw_data[root_key].get(
+                "foaf:nick")
+
+        # multiple resource
+        result_list = list()
+        entry_keys = [
+            entry_key for entry_key in raw_data[root_key].keys()
+            if not entry_key.startswith("@")
+        ]
+        for entry_key in entry_keys:
+            entries = raw_data[root_key][entry_key]
+            if isinstance(entries, OrderedDict):
+                entry_result = self._handle_rdf_entry(entries)
+                result_list.append(entry_result)
+            else:
+                for entry in entries:
+                    entry_result = self._handle_rdf_entry(entry)
+                    result_list.append(entry_result)
+
+        if not result_list:
+            return None
+        return result_list
+
+    def _handle_rdf_entry(self, entry):
+        # only return useful info instead of the whole object
+        return_fields = ["rtc_cm:userId", "dc:title", "dc:description"]
+        subkeys = entry.keys()
+        for return_field in return_fields:
+            if return_field in subkeys:
+                return entry.get(return_field)
+        raise exception.RTCException()
+
+    def _resolve_links(self, resources):
+        """Resolve the pending linked fields of a group of objects
+
+        The rdf:resource urls are collected across all the objects and
+        de-duplicated, so that each linked resource is only requested once.
+
+        :param resources: a :class:`list` that contains the
+            :class:`rtcclient.base.FieldBase` objects
+        """
+
+        rdf_urls = set()
+        for resource in resources:
+            rdf_urls.update(resource._pending_links.values())
+        if not rdf_urls:
+            return
+
+        self.log.debug("Resolve %s linked resources for %s objects",
+                       len(rdf_urls), len(resources))
+        rdf_titles = self._get_rdf_resource_titles(rdf_urls)
+        for resource in resources:
+            resource._set_link_titles(rdf_titles)
+
     def _get_paged_resources(self,
                              resource_name,
                              projectarea_id=None,
@@ -1326,132 +2548,163 @@ class RTCClient(RTCBase):
                              page_size="100",
                              archived=False,
                              returned_properties=None,
-                             filter_rule=None):
+                             filter_rule=None,
+                             lazy=False,
+                             limit=None,
+                             resource_builder=None):
+
+        resources_list = list(
+            self._iter_paged_resources(resource_name,
+                                       projectarea_id=projectarea_id,
+                                       workitem_id=workitem_id,
+                                       customized_attr=customized_attr,
+                                       page_size=page_size,
+                                       archived=archived,
+                                       returned_properties=returned_properties,
+                                       filter_rule=filter_rule,
+                                       lazy=lazy,
+                                       limit=limit,
+                                       resource_builder=resource_builder))
+
+        if not resources_list:
+            self.log.warning(
+                "No %ss are found with [ProjectArea ID: %s] "
+                "and [archived=%s]", resource_name,
+                projectarea_id if projectarea_id else "not specified", archived)
+            return None
+
+        self.log.debug("Successfully fetching all the paged resources")
+        return resources_list
+
+    def _iter_paged_resources(self,
+                              resource_name,
+                              projectarea_id=None,
+                              workitem_id=None,
+                              customized_attr=None,
+                              page_size="100",
+                              archived=False,
+                              returned_properties=None,
+                              filter_rule=None,
+                              lazy=False,
+                              limit=None,
+                              stream=False,
+                              resource_builder=None):
+        """Iterate the paged resources page by page
+
+        The parameters are validated immediately, while the pages are only
+        requested when the returned generator is consumed.
+
+        The linked fields of each page are resolved altogether unless
+        `lazy` is set, in which case they are only resolved when accessed.
+
+        :param limit: the maximum number of the resources to return. If
+            specified, no more pages are requested and no more objects are
+            built once enough matched resources are found
+        :param stream: whether to parse each page while it is downloaded
+            and yield the resources entry by entry
+        :param resource_builder: the callable to build the resource objects
+            with the url, the client and the entry, instead of the class of
+            the resource type
+        :return: a generator that yields the resource objects
+        """
 
         self.log.debug(
             "Start to fetch all %ss with [ProjectArea ID: %s] "
             "and [archived=%s]", resource_name,
             projectarea_id if projectarea_id else "not specified", archived)
 
-        projectarea_required = [
-            "Workitem", "Severity", "Priority", "Member", "Administrator",
-            "ItemType", "Action", "Query", "State"
-        ]
-        workitem_required = [
-            "Comment", "Subscriber", "IncludedInBuild", "Parent", "Children",
-            "ChangeSet", "Attachment"
-        ]
-        customized_required = [
-            "Action", "Query", "State", "RunQuery", "IncludedInBuild", "Parent",
-            "Children", "ChangeSet", "Attachment"
-        ]
+        resource_url, entry_tag = self._get_paged_resources_url(
+            resource_name,
+            projectarea_id=projectarea_id,
+            workitem_id=workitem_id,
+            customized_attr=customized_attr,
+            page_size=page_size,
+            returned_properties=returned_properties)
+        handle_entry = self._get_resource_entry_handler(
+            resource_name,
+            projectarea_id=projectarea_id,
+            archived=archived,
+            filter_rule=filter_rule,
+            resource_builder=resource_builder)
+        filtered_url = self._get_filtered_resources_url(resource_url,
+                                                        resource_name,
+                                                        filter_rule)
+        return self._iter_resource_pages(resource_url,
+                                         resource_name,
+                                         entry_tag,
+                                         handle_entry,
+                                         lazy=lazy,
+                                         filtered_url=filtered_url,
+                                         limit=limit,
+                                         stream=stream)
+
+    def _is_filterable(self, resource_name):
+        """Identify whether the resources can be filtered on the server
+
+        :rtype: bool
+        """
+
+        resource_type = RESOURCE_TYPES.get(resource_name)
+        return (resource_type is not None and resource_type.queryable and
+                resource_name not in self._unfilterable_resources)
+
+    def _get_filtered_resources_url(self, resource_url, resource_name,
+                                    filter_rule):
+        """Push the filter rules down to the server as the OSLC query
+
+        The rules on the urls of the entries themselves cannot be
+        expressed in the query, and are only checked on the client side.
+
+        :return: the url of the first page that only contains the
+            matched entries, or `None` if the resource or the rules
+            are not supported by the server
+        """
 
-        if resource_name in projectarea_required and not projectarea_id:
-            self.log.error("No ProjectArea ID is specified")
-            raise exception.EmptyAttrib("No ProjectArea ID")
-
-        if resource_name in workitem_required and not workitem_id:
-            self.log.error("No Workitem ID is specified")
-            raise exception.EmptyAttrib("No Workitem ID")
-
-        if resource_name in customized_required and not customized_attr:
-            self.log.error("No customized value is specified")
-            raise exception.EmptyAttrib("No customized value")
-
-        res_map = {
-            "TeamArea":
-                "teamareas",
-            "ProjectArea":
-                "projectareas",
-            "FiledAgainst":
-                "categories",
-            "FoundIn":
-                "deliverables",
-            "PlannedFor":
-                "iterations",
-            "ItemType":
-                "types/%s" % projectarea_id,
-            "Member":
-                "projectareas/%s/rtc_cm:members" % projectarea_id,
-            "Administrator":
-                "/".join([
-                    "projectareas",
-                    "%s" % projectarea_id, "rtc_cm:administrators"
-                ]),
-            "Workitem":
-                "contexts/%s/workitems" % projectarea_id,
-            "Severity":
-                "enumerations/%s/severity" % projectarea_id,
-            "Priority":
-                "enumerations/%s/priority" % projectarea_id,
-            "Comment":
-                "workitems/%s/rtc_cm:comments" % workitem_id,
-            "Subscriber":
-                "/".join(
-                    ["workitems",
-                     "%s" % workitem_id, "rtc_cm:subscribers"]),
-            "Action":
-                "workflows/%s/actions/%s" % (projectarea_id, customized_attr),
-            "Query":
-                "".join([
-                    "contexts/%s/workitems" % projectarea_id,
-                    "?oslc_cm.query=%s" % customized_attr
-                ]),
-            "State":
-                "workflows/%s/states/%s" % (projectarea_id, customized_attr),
-            "SavedQuery":
-                "queries",
-            "RunQuery":
-                "queries/%s/rtc_cm:results" % customized_attr,
-            "IncludedInBuild":
-                "workitems/%s/%s" % (workitem_id, customized_attr),
-            "Parent":
-                "workitems/%s/%s" % (workitem_id, customized_attr),
-            "Children":
-                "workitems/%s/%s" % (workitem_id, customized_attr),
-            "ChangeSet":
-                "workitems/%s/%s" % (workitem_id, customized_attr),
-            "Attachment":
-                "workitems/%s/%s" % (workitem_id, customized_attr),
-        }
-
-        entry_map = {
-            "TeamArea": "rtc_cm:Team",
-            "ProjectArea": "rtc_cm:Project",
-            "FiledAgainst": "rtc_cm:Category",
-            "FoundIn": "rtc_cm:Deliverable",
-            "PlannedFor": "rtc_cm:Iteration",
-            "ItemType": "rtc_cm:Type",
-            "Member": "rtc_cm:User",
-            "Administrator": "rtc_cm:User",
-            "Workitem": "oslc_cm:ChangeRequest",
-            "Severity": "rtc_cm:Literal",
-            "Priority": "rtc_cm:Literal",
-            "Comment": "rtc_cm:Comment",
-            "Subscriber": "rtc_cm:User",
-            "Action": "rtc_cm:Action",
-            "Query": "oslc_cm:ChangeRequest",
-            "State": "rtc_cm:Status",
-            "SavedQuery": "rtc_cm:Query",
-            "RunQuery": "oslc_cm:ChangeRequest",
-            "IncludedInBuild": "oslc_auto:AutomationResult",
-            "Parent": "oslc_cm:ChangeRequest",
-            "Children": "oslc_cm:ChangeRequest",
-            "ChangeSet": "rtc_cm:Reference",
-            "Attachment": "rtc_cm:Attachment"
-        }
-
-        if resource_name not in res_map:
+        if filter_rule is None or not self._is_filterable(resource_name):
+            return None
+
+        clauses = list()
+        for (key, attr, val) in filter_rule:
+            if key.startswith("@") or val is None:
+                continue
+            if attr is None:
+                clauses.append('%s="%s"' % (key, val.replace('"', '\\"')))
+            elif attr == "@rdf:resource":
+                clauses.append("%s=<%s>" % (key, val))
+
+        if not clauses:
+            return None
+        return "&oslc_cm.query=".join(
+            [resource_url, urlquote(" and ".join(clauses))])
+
+    def _get_paged_resources_url(self,
+                                 resource_name,
+                                 projectarea_id=None,
+                                 workitem_id=None,
+                                 customized_attr=None,
+                                 page_size="100",
+                                 returned_properties=None):
+        """Validate the parameters and build the url of the first page
+
+        :return: a :class:`tuple` of the first page url and the tag of the
+            entries in the collection
+        :rtype: tuple
+        """
+
+        resource_type = RESOURCE_TYPES.get(resource_name)
+        if resource_type is None:
             self.log.error("Unsupported resource name")
             raise exception.BadValue("Unsupported resource name")
 
+        resource_path = resource_type.getPath(projectarea_id=projectarea_id,
+                                              workitem_id=workitem_id,
+                                              customized_attr=customized_attr)
         resource_url = "".join([
-            self.url, "/oslc/{0}", "?" if resource_name != "Query" else "&",
-            "oslc_cm.pageSize={1}&_startIndex=0"
+            self.url, "/oslc/", resource_path,
+            "&" if "?" in resource_path else "?",
+            "oslc_cm.pageSize=%s&_startIndex=0" % page_size
         ])
 
-        resource_url = resource_url.format(res_map[resource_name], page_size)
-
         if returned_properties is not None:
             if not isinstance(returned_properties, six.string_types):
                 raise exception.BadValue("returned_properties is not a"
@@ -1461,83 +2714,323 @@ class RTCClient(RTCBase):
                 urlquote(returned_properties)
             ])
 
+        return resource_url, resource_type.entry_tag
+
+    def _get_resource_entry_handler(self,
+                                    resource_name,
+                                    projectarea_id=None,
+                                    archived=False,
+                                    filter_rule=None,
+                                    resource_builder=None):
         pa_url = ("/".join([self.url, "oslc/projectareas", projectarea_id])
                   if projectarea_id else None)
+        return functools.partial(self._handle_resource_entry,
+                                 resource_name,
+                                 projectarea_url=pa_url,
+                                 archived=archived,
+                                 filter_rule=filter_rule,
+                                 resource_builder=resource_builder)
+
+    def _iter_resource_pages(self,
+                             resource_url,
+                             resource_name,
+                             entry_tag,
+                             handle_entry,
+                             lazy=False,
+                             filtered_url=None,
+                             limit=None,
+                             stream=False):
+        if stream:
+            resp = self._open_first_page(resource_url, resource_name,
+                                         filtered_url, self._open_stream_page)
+            resources = self._iter_streamed_resources(resp,
+                                                      resource_name,
+                                                      entry_tag,
+                                                      handle_entry,
+                                                      lazy=lazy,
+                                                      limit=limit)
+        else:
+            raw_data = self._open_first_page(resource_url, resource_name,
+                                             filtered_url,
+                                             self._get_collection_page)
+            resources = self._iter_parsed_resources(raw_data,
+                                                    resource_name,
+                                                    entry_tag,
+                                                    handle_entry,
+                                                    lazy=lazy,
+                                                    limit=limit)
+        try:
+            for resource in resources:
+                yield resource
+        finally:
+            resources.close()
+
+    def _open_first_page(self, resource_url, resource_name, filtered_url,
+                         open_page):
+        """Request the first page, which is filtered on the server if
+        possible
+
+        :param open_page: the callable to request the page by its url
+        :return: the first page returned by `open_page`
+        """
 
-        resp = self.get(resource_url,
-                        verify=False,
-                        proxies=self.proxies,
-                        headers=self.headers,
-                        cookies=self.cookies)
-        raw_data = xmltodict.parse(resp.content)
-
+        if filtered_url is not None:
+            try:
+                return open_page(filtered_url)
+            except requests.exceptions.HTTPError:
+                self.log.warning(
+                    "Failed to filter the %ss on the server. "
+                    "Fall back to filtering them locally", resource_name)
+                self._unfilterable_resources.add(resource_name)
+        return open_page(resource_url)
+
+    def _iter_parsed_resources(self,
+                               raw_data,
+                               resource_name,
+                               entry_tag,
+                               handle_entry,
+                               lazy=False,
+                               limit=None):
         try:
             total_count = int(
                 raw_data.get("oslc_cm:Collection").get("@oslc_cm:totalCount"))
             if total_count == 0:
                 self.log.warning("No %ss are found", resource_name)
-                return None
+                return
         except Exception:
             pass
 
-        resources_list = []
+        remaining = limit
 
-        while True:
-            entries = (raw_data.get("oslc_cm:Collection").get(
-                entry_map[resource_name]))
+        def prefetch(page):
+            # the next page is not needed if the limit may be reached in
+            # this page
+            return remaining is None or len(
+                self._get_page_entries(page, entry_tag)) < remaining
 
-            if entries is None:
-                break
+        pages = self._iter_collection_pages(raw_data, prefetch=prefetch)
+        try:
+            for raw_data in pages:
+                entries = self._get_page_entries(raw_data, entry_tag)
+                if not entries:
+                    continue
+
+                if remaining is None:
+                    # iterate all the entries
+                    page_resources = list(
+                        filter(None, self.executor.map(handle_entry, entries)))
+                else:
+                    # only build the objects until enough are matched
+                    page_resources = list(
+                        itertools.islice(
+                            filter(None, map(handle_entry, entries)),
+                            remaining))
+                    remaining -= len(page_resources)
+
+                if not lazy:
+                    # resolve the linked resources of the whole page
+                    # altogether
+                    self._resolve_links(page_resources)
+                for resource in page_resources:
+                    yield resource
+
+                if remaining is not None and remaining <= 0:
+                    self.log.debug("Found the first %s %ss", limit,
+                                   resource_name)
+                    return
+        finally:
+            # stop requesting the further pages
+            pages.close()
+
+    def _open_stream_page(self, page_url):
+        return self.get(page_url,
+                        verify=False,
+                        proxies=self.proxies,
+                        headers=self.headers,
+                        cookies=self.cookies,
+                        stream=True)
+
+    def _iter_streamed_resources(self,
+                                 resp,
+                                 resource_name,
+                                 entry_tag,
+                                 handle_entry,
+                                 lazy=False,
+                                 limit=None):
+        """Iterate the resources entry by entry while the pages are
+        downloaded
+
+        Each entry is parsed and handled as soon as it is received, and the
+        next page is requested after the current one is consumed. Closing
+        the generator closes the current response.
+
+        :param resp: the streamed response of the first page
+        :return: a generator that yields the resource objects
+        """
 
-            # for the last single entry
-            if isinstance(entries, OrderedDict):
-                resource = self._handle_resource_entry(resource_name,
-                                                       entries,
-                                                       projectarea_url=pa_url,
-                                                       archived=archived,
-                                                       filter_rule=filter_rule)
-                if resource is not None:
-                    resources_list.append(resource)
-                break
-
-            # iterate all the entries
-            with Pool() as p:
-                resources_list.extend(
-                    list(
-                        filter(
-                            None,
-                            p.starmap(self._handle_resource_entry,
-                                      [(resource_name, entry, pa_url, archived,
-                                        filter_rule) for entry in entries]))))
-
-            # find the next page
-            url_next = raw_data.get('oslc_cm:Collection').get('@oslc_cm:next')
-            if url_next:
-                resp = self.get(url_next,
-                                verify=False,
-                                proxies=self.proxies,
-                                headers=self.headers,
-                                cookies=self.cookies)
-                raw_data = xmltodict.parse(resp.content)
-            else:
-                break
+        remaining = limit
+        while resp is not None:
+            try:
+                entries = CollectionStream(
+                    resp.iter_content(chunk_size=_STREAM_CHUNK_SIZE),
+                    entry_tag)
+                for entry in entries:
+                    resource = handle_entry(entry)
+                    if resource is None:
+                        continue
+                    if not lazy:
+                        self._resolve_links([resource])
+                    yield resource
+
+                    if remaining is not None:
+                        remaining -= 1
+                        if remaining <= 0:
+                            self.log.debug("Found the first %s %ss", limit,
+                                           resource_name)
+                            return
+                url_next = entries.collection.get("@oslc_cm:next")
+            finally:
+                resp.close()
+
+            resp = self._open_stream_page(url_next) if url_next else None
+
+    def _get_page_entries(self, raw_data, entry_tag):
+        entries = raw_data.get("oslc_cm:Collection").get(entry_tag)
+        if entries is None:
+            return []
+
+        # for the single entry
+        if isinstance(entries, OrderedDict):
+            entries = [entries]
+        return entries
+
+    def _get_collection_page(self, page_url):
+        resp = self.get(page_url,
+                        verify=False,
+                        proxies=self.proxies,
+                        headers=self.headers,
+                        cookies=self.cookies)
+        return self.parser.parse(resp.content)
 
-        if not resources_list:
-            self.log.warning(
-                "No %ss are found with [ProjectArea ID: %s] "
-                "and [archived=%s]", resource_name,
-                projectarea_id if projectarea_id else "not specified", archived)
+    def _iter_collection_pages(self, raw_data, prefetch=None):
+        """Iterate all the pages of the OSLC collection
+
+        The next page is requested before the current page is yielded, so
+        that the network latency overlaps with the processing of the
+        current page. If the collection reports its total count and the
+        next page is addressed by `_startIndex`, up to `page_concurrency`
+        pages are requested in parallel.
+
+        The pages are only requested when they are needed if iterated in
+        one of the executor workers, where the requests would not be run
+        in parallel, or if `prefetch` returns `False` for the current page.
+
+        Closing the generator cancels the pages not requested yet.
+
+        :param raw_data: the parsed first page
+        :param prefetch: (optional) a callable that tells whether the pages
+            after the given parsed page may be needed
+        :return: a generator that yields the parsed pages in order
+        """
+
+        def should_prefetch(page):
+            if self.executor.in_worker():
+                return False
+            return prefetch is None or prefetch(page)
+
+        collection = raw_data.get("oslc_cm:Collection")
+        url_next = collection.get("@oslc_cm:next")
+        if not url_next:
+            yield raw_data
+            return
+
+        page_urls = self._get_indexed_page_urls(
+            url_next, collection.get("@oslc_cm:totalCount"))
+        if page_urls is None:
+            pages = self._iter_linked_pages(raw_data, should_prefetch)
+        else:
+            self.log.debug("Fetch %s pages with concurrency %s",
+                           len(page_urls) + 1, self.page_concurrency)
+            pages = self._iter_indexed_pages(raw_data, page_urls,
+                                             should_prefetch)
+
+        try:
+            for raw_data in pages:
+                yield raw_data
+        finally:
+            pages.close()
+
+    def _get_indexed_page_urls(self, url_next, total_count):
+        if self.page_concurrency <= 1 or total_count is None:
             return None
 
-        self.log.debug("Successfully fetching all the paged resources")
-        return resources_list
+        matched = _START_INDEX_PATTERN.search(url_next)
+        if matched is None:
+            return None
+
+        # the second page starts right after the first page
+        page_size = int(matched.group(2))
+        if page_size <= 0:
+            return None
+
+        return [
+            "".join([
+                url_next[:matched.start(2)],
+                str(start_index), url_next[matched.end(2):]
+            ]) for start_index in range(page_size, int(total_count), page_size)
+        ]
+
+    def _iter_linked_pages(self, raw_data, should_prefetch):
+        future = None
+        try:
+            while raw_data is not None:
+                url_next = (raw_data.get("oslc_cm:Collection").get(
+                    "@oslc_cm:next"))
+                if url_next and should_prefetch(raw_data):
+                    future = self.executor.submit(self._get_collection_page,
+                                                  url_next)
+                yield raw_data
+
+                if future is not None:
+                    raw_data, future = future.result(), None
+                elif url_next:
+                    raw_data = self._get_collection_page(url_next)
+                else:
+                    raw_data = None
+        finally:
+            if future is not None:
+                future.cancel()
+
+    def _iter_indexed_pages(self, raw_data, page_urls, should_prefetch):
+        page_urls = iter(page_urls)
+        futures = collections.deque()
+        try:
+            while raw_data is not None:
+                if should_prefetch(raw_data):
+                    futures.extend(
+                        self.executor.submit(self._get_collection_page,
+                                             page_url)
+                        for page_url in itertools.islice(
+                            page_urls, self.page_concurrency - len(futures)))
+                yield raw_data
+
+                if futures:
+                    raw_data = futures.popleft().result()
+                else:
+                    page_url = next(page_urls, None)
+                    raw_data = (None if page_url is None else
+                                self._get_collection_page(page_url))
+        finally:
+            for future in futures:
+                future.cancel()
 
     def _handle_resource_entry(self,
                                resource_name,
                                entry,
                                projectarea_url=None,
                                archived=False,
-                               filter_rule=None):
+                               filter_rule=None,
+                               resource_builder=None):
         """
         :param filter_rule: a list of filter rules
             e.g. filter_rule = [("dc:creator", "@rdf:resource",
@@ -1546,6 +3039,10 @@ class RTCClient(RTCBase):
                                  "2013-08-28T02:06:26.516Z")
                                 ]
             only the entry matches all the rules will be kept
+        :param archived: whether the entry is archived. If `None`, the
+            entries are kept no matter whether they are archived
+        :param resource_builder: (optional) the callable to build the
+            resource object with the url, the client and the entry
         """
 
         if projectarea_url is not None:
@@ -1571,29 +3068,26 @@ class RTCClient(RTCBase):
                 except AttributeError:
                     pass
 
+        resource_type = RESOURCE_TYPES[resource_name]
         entry_archived = entry.get("rtc_cm:archived")
-        if (entry_archived is not None and
-                eval(entry_archived.capitalize()) != archived):
+        if (archived is not None and entry_archived is not None and
+                resource_type.archived_parser(entry_archived) != archived):
             return None
 
-        if resource_name == "Subscriber":
-            resource_cls = Member
-        elif resource_name in ["Query", "RunQuery", "Parent", "Children"]:
-            resource_cls = Workitem
-        else:
-            resource_cls = eval(resource_name)
-
-        if resource_name in [
-                "Workitem", "Query", "RunQuery", "Parent", "Children"
-        ]:
-            resource_url = entry.get("@rdf:resource")
+        resource_url = entry.get("@rdf:resource")
+        if resource_type.workitem_url:
             resource_url = "/".join(
                 [self.url, "oslc/workitems",
                  resource_url.split("/")[-1]])
-        else:
-            resource_url = entry.get("@rdf:resource")
 
-        resource = resource_cls(resource_url, self, raw_data=entry)
+        if resource_builder is not None:
+            return resource_builder(resource_url, self, entry)
+
+        # the linked resources will be resolved by the whole page
+        resource = resource_type.resource_cls(resource_url,
+                                              self,
+                                              raw_data=entry,
+                                              lazy=True)
         return resource
 
     def queryWorkitems(self,
@@ -1601,7 +3095,10 @@ class RTCClient(RTCBase):
                        projectarea_id=None,
                        projectarea_name=None,
                        returned_properties=None,
-                       archived=False):
+                       archived=False,
+                       lazy=False,
+                       compact=False,
+                       keep_raw=False):
         """Query workitems with the query string in a certain project area
 
         At least either of `projectarea_id` and `projectarea_name` is given
@@ -1613,6 +3110,8 @@ class RTCClient(RTCBase):
         :param returned_properties: the returned properties that you want.
             Refer to :class:`rtcclient.client.RTCClient` for more explanations
         :param archived: (default is False) whether the workitems are archived
+        :param lazy: (default is False) If `True`, the linked fields
+            (e.g. ownedBy, severity) are only resolved when accessed
         :return: a :class:`list` that contains the queried
             :class:`rtcclient.workitem.Workitem` objects
         :rtype: list
@@ -1623,4 +3122,98 @@ class RTCClient(RTCBase):
                                          projectarea_id=projectarea_id,
                                          projectarea_name=projectarea_name,
                                          returned_properties=rp,
-                                         archived=archived)
+                                         archived=archived,
+                                         lazy=lazy,
+                                         compact=compact,
+                                         keep_raw=keep_raw)
+
+    def iterQueryWorkitems(self,
+                           query_str,
+                           projectarea_id=None,
+                           projectarea_name=None,
+                           returned_properties=None,
+                           archived=False,
+                           lazy=False,
+                           stream=False,
+                           compact=False,
+                           keep_raw=False):
+        """Iterate the workitems queried with the query string in a certain
+        project area page by page
+
+        More details, please refer to
+        :class:`rtcclient.query.Query.iterQueryWorkitems`
+        """
+
+        rp = returned_properties
+        return self.query.iterQueryWorkitems(query_str=query_str,
+                                             projectarea_id=projectarea_id,
+                                             projectarea_name=projectarea_name,
+                                             returned_properties=rp,
+                                             archived=archived,
+                                             lazy=lazy,
+                                             stream=stream,
+                                             compact=compact,
+                                             keep_raw=keep_raw)
+
+    def queryWorkitemsColumns(self,
+                              query_str,
+                              projectarea_id=None,
+                              projectarea_name=None,
+                              returned_properties=None,
+                              archived=False,
+                              output="columns",
+                              resolve_links=True):
+        """Query workitems with the query string in a certain project area,
+        and return them as a table of columns
+
+        More details, please refer to
+        :class:`rtcclient.query.Query.queryWorkitemsColumns`
+        """
+
+        rp = returned_properties
+        return self.query.queryWorkitemsColumns(
+            query_str=query_str,
+            projectarea_id=projectarea_id,
+            projectarea_name=projectarea_name,
+            returned_properties=rp,
+            archived=archived,
+            output=output,
+            resolve_links=resolve_links)
+
+    def iterQueryWorkitemsColumns(self,
+                                  query_str,
+                                  projectarea_id=None,
+                                  projectarea_name=None,
+                                  returned_properties=None,
+                                  archived=False,
+                                  output="columns",
+                                  resolve_links=True,
+                                  batch_size=1000):
+        """Query workitems with the query string in a certain project area,
+        and iterate them as the batches of columns
+
+        More details, please refer to
+        :class:`rtcclient.query.Query.iterQueryWorkitemsColumns`
+        """
+
+        rp = returned_properties
+        return self.query.iterQueryWorkitemsColumns(
+            query_str=query_str,
+            projectarea_id=projectarea_id,
+            projectarea_name=projectarea_name,
+            returned_properties=rp,
+            archived=archived,
+            output=output,
+            resolve_links=resolve_links,
+            batch_size=batch_size)
+
+    def iterSavedQueryResults(self, saved_query_id, returned_properties=None):
+        """Iterate the workitems queried with the saved query id page by page
+
+        More details, please refer to
+        :class:`rtcclient.query.Query.iterSavedQueryResults`
+        """
+
+        rp = returned_properties
+        return self.query.iterSavedQueryResults(saved_query_id,
+                                                returned_properties=rp)
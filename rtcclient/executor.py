@@ -0,0 +1,154 @@
+import concurrent.futures
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class Executor(object):
+    """A bounded thread pool shared by all the operations of the client
+
+    The worker threads are only started when needed and are reused
+    afterwards.
+
+    Tasks submitted from one of its own worker threads are run directly in
+    that worker instead of being queued, so that nested submissions (e.g.
+    resolving the linked resources while processing the entries of a page)
+    never wait for a worker that will not be released.
+
+    :param max_workers: (default is `None`) the maximum number of worker
+        threads. If `None`, it is set to `min(32, cpu_count + 4)`
+    """
+
+    log = logging.getLogger("executor.Executor")
+
+    def __init__(self, max_workers=None):
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self.max_workers = max_workers
+        self._pool = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self.log.debug("Start the thread pool with %s workers",
+                               self.max_workers)
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="rtcclient")
+            return self._pool
+
+    def in_worker(self):
+        """Identify whether the current thread is one of the workers
+
+        :rtype: bool
+        """
+
+        return getattr(self._local, "is_worker", False)
+
+    def _run_in_worker(self, func, *args, **kwargs):
+        self._local.is_worker = True
+        return func(*args, **kwargs)
+
+    def submit(self, func, *args, **kwargs):
+        """Schedule the callable to be executed by the workers
+
+        If called from a worker thread, the callable is executed
+        immediately in the calling thread.
+
+        :return: the :class:`concurrent.futures.Future` object
+        """
+
+        if self.in_worker():
+            future = Future()
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as excp:
+                future.set_exception(excp)
+            return future
+        return self._get_pool().submit(self._run_in_worker, func, *args,
+                                       **kwargs)
+
+    def map(self, func, *iterables):
+        """Apply the callable to every item of the iterables concurrently
+
+        If called from a worker thread, the items are processed one by one
+        in the calling thread.
+
+        :return: a :class:`list` that contains the results in order
+        :rtype: list
+        """
+
+        args_list = list(zip(*iterables))
+        if self.in_worker() or len(args_list) <= 1:
+            return [func(*args) for args in args_list]
+        futures = [self.submit(func, *args) for args in args_list]
+        return [future.result() for future in futures]
+
+    def imap_unordered(self, func, iterable, limit=None):
+        """Apply the callable to every item concurrently, and yield the
+        results as soon as they are completed
+
+        At most `limit` items are processed at the same time. If called
+        from a worker thread, or with a single item, the items are
+        processed one by one in the calling thread.
+
+        :param limit: (default is `None`) the maximum number of the items
+            processed at the same time. If `None`, it is `max_workers`
+        :return: a generator that yields the item and the completed
+            :class:`concurrent.futures.Future` object in the order of
+            completion
+        """
+
+        items = list(iterable)
+        if limit is None:
+            limit = self.max_workers
+        if limit <= 0:
+            raise ValueError("limit must be greater than 0")
+
+        if self.in_worker() or len(items) <= 1 or limit == 1:
+            for item in items:
+                future = Future()
+                try:
+                    future.set_result(func(item))
+                except Exception as excp:
+                    future.set_exception(excp)
+                yield item, future
+            return
+
+        items = iter(items)
+        running = dict()
+        try:
+            while True:
+                for item in items:
+                    running[self.submit(func, item)] = item
+                    if len(running) >= limit:
+                        break
+                if not running:
+                    return
+                done, _ = concurrent.futures.wait(
+                    list(running),
+                    return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    yield running.pop(future), future
+        finally:
+            for future in running:
+                future.cancel()
+
+    def shutdown(self, wait=True):
+        """Stop all the worker threads
+
+        The workers will be started again if more tasks are submitted.
+
+        :param wait: (default is `True`) whether to wait for the pending
+            tasks to finish
+        """
+
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
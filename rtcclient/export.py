@@ -0,0 +1,256 @@
+import logging
+
+import six
+
+try:
+    import pandas
+except ImportError:  # pragma no cover
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma no cover
+    pyarrow = None
+
+from rtcclient import exception, OrderedDict
+from rtcclient.base import parse_raw_item
+
+OUTPUT_FORMATS = ("columns", "pandas", "arrow")
+
+
+def parse_properties(returned_properties):
+    """Parse the returned properties into the keys in the raw data
+
+    :param returned_properties: the returned properties (e.g.
+        "dc:title,rtc_cm:state")
+    :return: a :class:`list` of the keys, or `None` if all the properties
+        are returned
+    :rtype: list
+    """
+
+    if returned_properties is None:
+        return None
+    if not isinstance(returned_properties, six.string_types):
+        raise exception.BadValue("returned_properties is not a "
+                                 "valid string")
+    keys = list()
+    for key in returned_properties.split(","):
+        key = key.strip()
+        if key and key not in keys:
+            keys.append(key)
+    return keys
+
+
+class ColumnBuilder(object):
+    """Build the columns of the workitems directly from the entries of the
+    query results, without building any :class:`rtcclient.workitem.Workitem`
+    objects
+
+    The columns are named after the attributes of the workitems (e.g.
+    `title` for `dc:title`), and led by `identifier`. If the returned
+    properties are specified, only their columns are built in the same
+    order. Otherwise, the columns are added in the order they are found in
+    the rows, and the missing values are filled with `None`.
+
+    The rows can be built concurrently, since :meth:`buildRow` does not
+    change the builder. The columns are only added when the rows are
+    converted.
+
+    :param rtc_obj: a reference to the
+        :class:`rtcclient.client.RTCClient` object
+    :param returned_properties: (optional) the returned properties, which
+        select the columns
+    :param output: (default is `columns`) the format of the batches:
+        `columns` for an :class:`OrderedDict` of the per-field lists,
+        `pandas` for the :class:`pandas.DataFrame`, and `arrow` for the
+        :class:`pyarrow.RecordBatch`
+    :param resolve_links: (default is `True`) whether the linked fields
+        (e.g. ownedBy, severity) are filled with the titles instead of the
+        rdf:resource urls
+    """
+
+    log = logging.getLogger("export.ColumnBuilder")
+
+    def __init__(self,
+                 rtc_obj,
+                 returned_properties=None,
+                 output="columns",
+                 resolve_links=True):
+        if output not in OUTPUT_FORMATS:
+            self.log.error("Unsupported output format: %s", output)
+            raise exception.BadValue("Unsupported output format: %s" % output)
+        if output == "pandas" and pandas is None:
+            excp_msg = ("Please install pandas to export the pandas "
+                        "DataFrame: pip install pandas")
+            self.log.error(excp_msg)
+            raise exception.RTCException(excp_msg)
+        if output == "arrow" and pyarrow is None:
+            excp_msg = ("Please install pyarrow to export the Arrow "
+                        "batches: pip install pyarrow")
+            self.log.error(excp_msg)
+            raise exception.RTCException(excp_msg)
+
+        self.rtc_obj = rtc_obj
+        self.output = output
+        self.resolve_links = resolve_links
+        self.keys = parse_properties(returned_properties)
+        self.columns = ["identifier"]
+        if self.keys is not None:
+            for key in self.keys:
+                self._add_column(key.split(":")[-1].replace("-", "_"))
+
+    def _add_column(self, attr):
+        if attr not in self.columns:
+            self.columns.append(attr)
+
+    def _add_row_columns(self, rows):
+        known = set(self.columns)
+        for values, _ in rows:
+            for attr in values:
+                if attr not in known:
+                    known.add(attr)
+                    self.columns.append(attr)
+
+    def buildRow(self, url, rtc_obj, entry):
+        """Build the row from the entry, which works as the
+        `resource_builder` of the paged resources
+
+        :param url: the workitem url
+        :param rtc_obj: a reference to the
+            :class:`rtcclient.client.RTCClient` object
+        :param entry: the raw data ( OrderedDict ) of the workitem
+        :return: a :class:`tuple` of the values keyed by the columns in the
+            order of the entry and the columns of the linked fields
+        :rtype: tuple
+        """
+
+        values = OrderedDict([("identifier", url.split("/")[-1])])
+        links = list()
+        for item in entry.items():
+            if self.keys is not None and item[0] not in self.keys:
+                continue
+            processed = parse_raw_item(item)
+            if processed is None:
+                continue
+            _, attr, value, rdf_url = processed
+            if rdf_url is not None:
+                links.append(attr)
+                value = rdf_url
+            values[attr] = value
+        return values, links
+
+    def toColumns(self, rows):
+        """Convert the rows to the per-field lists
+
+        :param rows: a :class:`list` of the rows built by :meth:`buildRow`
+        :return: an :class:`OrderedDict` of the per-field lists
+        """
+
+        if self.keys is None:
+            self._add_row_columns(rows)
+        if self.resolve_links:
+            self._resolve_links(rows)
+        return OrderedDict((column, [values.get(column)
+                                     for values, _ in rows])
+                           for column in self.columns)
+
+    def toBatch(self, rows):
+        """Convert the rows to a batch of columns in the output format
+
+        :param rows: a :class:`list` of the rows built by :meth:`buildRow`
+        """
+
+        return self.convert(self.toColumns(rows))
+
+    def iterBatches(self, rows, batch_size=1000):
+        """Group the rows into the batches of columns
+
+        :param rows: an iterable that yields the rows built by
+            :meth:`buildRow`
+        :param batch_size: (default is 1000) the maximum number of the rows
+            in each batch
+        :return: a generator that yields the batches in the output format
+        """
+
+        for batch in _group_rows(rows, batch_size):
+            yield self.toBatch(batch)
+
+    def collect(self, rows, batch_size=1000):
+        """Collect all the rows into a single table of columns
+
+        The rows are converted batch by batch, so that they are released
+        as soon as their columns are built.
+
+        :param rows: an iterable that yields the rows built by
+            :meth:`buildRow`
+        :param batch_size: (default is 1000) the number of the rows
+            converted at once
+        :return: the per-field lists, the :class:`pandas.DataFrame` or the
+            :class:`pyarrow.Table` according to the output format
+        """
+
+        batches = [
+            self.toColumns(batch) for batch in _group_rows(rows, batch_size)
+        ]
+        columns = _merge_columns(batches, self.columns)
+        if self.output == "arrow":
+            return pyarrow.Table.from_batches([self.convert(columns)])
+        return self.convert(columns)
+
+    def convert(self, columns):
+        """Convert the per-field lists to the output format
+
+        :param columns: an :class:`OrderedDict` of the per-field lists
+        :return: the columns in the output format
+        """
+
+        if self.output == "pandas":
+            return pandas.DataFrame(columns, columns=list(columns.keys()))
+        if self.output == "arrow":
+            return pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array(values) for values in columns.values()],
+                names=list(columns.keys()))
+        return columns
+
+    def _resolve_links(self, rows):
+        rdf_urls = set()
+        for values, links in rows:
+            rdf_urls.update(values[attr] for attr in links)
+        if not rdf_urls:
+            return
+
+        self.log.debug("Resolve %s linked resources for %s rows",
+                       len(rdf_urls), len(rows))
+        rdf_titles = self.rtc_obj._get_rdf_resource_titles(rdf_urls)
+        for values, links in rows:
+            for attr in links:
+                values[attr] = rdf_titles.get(values[attr], values[attr])
+
+
+def _group_rows(rows, batch_size):
+    batch = list()
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = list()
+    if batch:
+        yield batch
+
+
+def _merge_columns(batches, columns):
+    """Merge the batches of per-field lists, whose missing columns are
+    filled with `None`
+
+    :param batches: a :class:`list` of the :class:`OrderedDict` of the
+        per-field lists
+    :param columns: all the columns in order
+    :return: an :class:`OrderedDict` of the per-field lists
+    """
+
+    merged = OrderedDict((column, list()) for column in columns)
+    for batch in batches:
+        size = len(batch["identifier"])
+        for column, values in merged.items():
+            values.extend(batch.get(column) or [None] * size)
+    return merged
@@ -2,10 +2,9 @@ import logging
 import os
 import re
 
-import xmltodict
-
 from rtcclient import urlunquote, OrderedDict
 from rtcclient.base import FieldBase
+from rtcclient.cache import TTLCache
 
 
 class Role(FieldBase):
@@ -22,8 +21,8 @@ class Member(FieldBase):
 
     log = logging.getLogger("models.Member")
 
-    def __init__(self, url, rtc_obj, raw_data=None):
-        FieldBase.__init__(self, url, rtc_obj, raw_data=raw_data)
+    def __init__(self, url, rtc_obj, raw_data=None, lazy=False):
+        FieldBase.__init__(self, url, rtc_obj, raw_data=raw_data, lazy=lazy)
         # add a new attribute mainly for the un-recorded member use
         self.email = urlunquote(self.url.split("/")[-1])
 
@@ -136,9 +135,9 @@ class Comment(FieldBase):
 
     log = logging.getLogger("models.Comment")
 
-    def __init__(self, url, rtc_obj, raw_data=None):
+    def __init__(self, url, rtc_obj, raw_data=None, lazy=False):
         self.id = url.split("/")[-1]
-        FieldBase.__init__(self, url, rtc_obj, raw_data)
+        FieldBase.__init__(self, url, rtc_obj, raw_data, lazy=lazy)
 
     def __str__(self):
         return self.id
@@ -149,9 +148,9 @@ class SavedQuery(FieldBase):
 
     log = logging.getLogger("models.SavedQuery")
 
-    def __init__(self, url, rtc_obj, raw_data=None):
+    def __init__(self, url, rtc_obj, raw_data=None, lazy=False):
         self.id = url.split("/")[-1]
-        FieldBase.__init__(self, url, rtc_obj, raw_data)
+        FieldBase.__init__(self, url, rtc_obj, raw_data, lazy=lazy)
 
     def __str__(self):
         return self.title
@@ -193,7 +192,7 @@ class ChangeSet(FieldBase):
                         proxies=self.rtc_obj.proxies,
                         headers=self.rtc_obj.headers,
                         cookies=self.rtc_obj.cookies)
-        raw_data = xmltodict.parse(resp.content).get("scm:ChangeSet")
+        raw_data = self.rtc_obj.parser.parse(resp.content).get("scm:ChangeSet")
         common_changes = dict()
         changes = raw_data.get("changes")
         for (key, value) in raw_data.items():
@@ -225,8 +224,8 @@ class Change(FieldBase):
 
     log = logging.getLogger("models.Change")
 
-    def __init__(self, url, rtc_obj, raw_data=None):
-        FieldBase.__init__(self, url, rtc_obj, raw_data)
+    def __init__(self, url, rtc_obj, raw_data=None, lazy=False):
+        FieldBase.__init__(self, url, rtc_obj, raw_data, lazy=lazy)
 
     def __str__(self):
         return self.internalId
@@ -316,8 +315,180 @@ class Attachment(FieldBase):
 
     log = logging.getLogger("models.Attachment")
 
-    def __init__(self, url, rtc_obj, raw_data=None):
-        FieldBase.__init__(self, url, rtc_obj, raw_data)
+    def __init__(self, url, rtc_obj, raw_data=None, lazy=False):
+        FieldBase.__init__(self, url, rtc_obj, raw_data, lazy=lazy)
 
     def __str__(self):
         return self.identifier + ": " + self.title
+
+
+class EnumerationRegistry(object):
+    """Index the enumerations (e.g. :class:`Severity`, :class:`Priority`,
+    :class:`PlannedFor`, :class:`FiledAgainst`, :class:`FoundIn`,
+    :class:`TeamArea` and :class:`ItemType`) of each project area by their
+    titles and urls
+
+    Each collection is fetched with a single scan the first time it is
+    looked up, and the later lookups are dictionary lookups until the
+    collection expires or is refreshed. If the collection has not been
+    fetched yet and the server can filter it, a lookup by title only
+    requests the matched objects, and only the found objects are kept. The
+    titles are also stored in the resource cache of the client, so that the
+    linked fields referring to them are resolved without any request.
+
+    :param rtc_obj: a reference to the
+        :class:`rtcclient.client.RTCClient` object
+    :param ttl: (default is 600) the seconds a collection stays valid. Set
+        to `None` to keep it until refreshed, or to `0` to always fetch it
+        from the server
+    :param maxsize: (default is 256) the maximum number of the collections
+        to keep
+    """
+
+    log = logging.getLogger("models.EnumerationRegistry")
+
+    def __init__(self, rtc_obj, ttl=600, maxsize=256):
+        self.rtc_obj = rtc_obj
+        self.ttl = ttl
+        self._collections = TTLCache(maxsize=maxsize if ttl != 0 else 0,
+                                     ttl=ttl)
+        # the objects found by title before the whole collection is
+        # fetched, while the missing titles are always looked up again
+        self._titled = TTLCache(maxsize=maxsize if ttl != 0 else 0, ttl=ttl)
+
+    def _get_collection(self, resource_name, projectarea_id=None,
+                        archived=False):
+        key = (resource_name, projectarea_id, archived)
+        # each collection is loaded on its own, and the executor workers do
+        # not wait for the other thread, whose pages may be queued behind
+        # them
+        return self._collections.load(
+            key,
+            lambda: self._load_collection(resource_name,
+                                          projectarea_id=projectarea_id,
+                                          archived=archived),
+            wait=not self.rtc_obj.executor.in_worker())
+
+    def _load_collection(self, resource_name, projectarea_id=None,
+                         archived=False):
+        self.log.debug(
+            "Load all the %ss with [ProjectArea ID: %s] "
+            "and [archived=%s]", resource_name, projectarea_id, archived)
+        resources = self.rtc_obj._get_paged_resources(
+            resource_name,
+            projectarea_id=projectarea_id,
+            page_size="100",
+            archived=archived) or []
+        by_title = dict()
+        by_url = dict()
+        for resource in resources:
+            by_title.setdefault(resource.title, resource)
+            by_url[resource.url] = resource
+            self.rtc_obj.resource_cache.set(resource.url, resource.title)
+        return resources, by_title, by_url
+
+    def getAll(self, resource_name, projectarea_id=None, archived=False):
+        """Get all the objects of the enumeration
+
+        :param resource_name: the resource name (e.g. Severity)
+        :param projectarea_id: the project area id. If `None`, the
+            resources in all the project areas are returned if the
+            resource is not specific to a project area
+        :param archived: (default is False) whether the resources are
+            archived
+        :return: a :class:`list` that contains the objects, or `None` if
+            there is no such resource
+        :rtype: list
+        """
+
+        resources = self._get_collection(resource_name,
+                                         projectarea_id=projectarea_id,
+                                         archived=archived)[0]
+        return list(resources) if resources else None
+
+    def getByTitle(self,
+                   resource_name,
+                   title,
+                   projectarea_id=None,
+                   archived=False):
+        """Get the object of the enumeration by its title
+
+        :param resource_name: the resource name (e.g. Severity)
+        :param title: the title of the resource
+        :param projectarea_id: the project area id
+        :param archived: (default is False) whether the resource is
+            archived
+        :return: the object, or `None` if not found
+        """
+
+        key = (resource_name, projectarea_id, archived)
+        collection = self._collections.get(key, count=False)
+        if collection is None and self.rtc_obj._is_filterable(resource_name):
+            return self._lookupTitle(key, title)
+
+        return self._get_collection(resource_name,
+                                    projectarea_id=projectarea_id,
+                                    archived=archived)[1].get(title)
+
+    def _lookupTitle(self, key, title):
+        titled_key = key + (title,)
+        resource = self._titled.get(titled_key)
+        if resource is not None:
+            return resource
+
+        resource_name, projectarea_id, archived = key
+        self.log.debug(
+            "Look up the %s titled with %s with [ProjectArea ID: %s] "
+            "and [archived=%s]", resource_name, title, projectarea_id, archived)
+        resources = self.rtc_obj._get_paged_resources(
+            resource_name,
+            projectarea_id=projectarea_id,
+            page_size="100",
+            archived=archived,
+            filter_rule=[("dc:title", None, title)],
+            limit=1)
+        if not resources:
+            # the resource may be created later
+            return None
+        resource = resources[0]
+        self.rtc_obj.resource_cache.set(resource.url, resource.title)
+        self._titled.set(titled_key, resource)
+        return resource
+
+    def getByURL(self, resource_name, url, projectarea_id=None,
+                 archived=False):
+        """Get the object of the enumeration by its url
+
+        :param resource_name: the resource name (e.g. Severity)
+        :param url: the url (rdf:resource) of the resource
+        :param projectarea_id: the project area id
+        :param archived: (default is False) whether the resource is
+            archived
+        :return: the object, or `None` if not found
+        """
+
+        return self._get_collection(resource_name,
+                                    projectarea_id=projectarea_id,
+                                    archived=archived)[2].get(url)
+
+    def refresh(self, resource_name=None, projectarea_id=None):
+        """Drop the collections so that they are fetched from the server
+        again on the next lookup
+
+        :param resource_name: the resource name (e.g. Severity). If `None`,
+            all the collections are dropped
+        :param projectarea_id: the project area id of the collection
+        """
+
+        # the objects looked up by title are few, and simply dropped
+        self._titled.invalidate()
+        if resource_name is None:
+            self.log.debug("Refresh all the enumerations")
+            self._collections.invalidate()
+            return
+
+        self.log.debug("Refresh the %ss with [ProjectArea ID: %s]",
+                       resource_name, projectarea_id)
+        for archived in (False, True):
+            self._collections.invalidate(
+                (resource_name, projectarea_id, archived))
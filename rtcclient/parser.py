@@ -0,0 +1,371 @@
+import io
+import re
+
+import six
+import xmltodict
+from lxml import etree
+
+from rtcclient import exception, OrderedDict
+
+_LXML_EVENTS = ("start-ns", "start", "end")
+_XMLNS_PATTERN = re.compile(br"xmlns(?::[^\s=]+)?\s*=")
+# the undeclared namespace prefixes are accepted like xmltodict does, and
+# kept as they are in the names
+_LXML_OPTIONS = {
+    "recover": True,
+    "remove_comments": True,
+    "remove_pis": True,
+    "resolve_entities": False,
+    "no_network": True,
+    "huge_tree": True
+}
+
+
+class XmltodictParser(object):
+    """Parse the responses with :mod:`xmltodict`"""
+
+    name = "xmltodict"
+
+    def parse(self, content):
+        """Parse the XML document into :class:`OrderedDict` trees
+
+        :param content: the XML document in bytes or string
+        :return: an :class:`OrderedDict` whose only key is the qualified
+            name of the root element
+        """
+
+        return xmltodict.parse(content)
+
+
+class LxmlParser(object):
+    """Parse the responses with the C-based :mod:`lxml` parser
+
+    The parsed trees are the same as the ones of :mod:`xmltodict`: the
+    elements are keyed by their qualified names (e.g. `rtc_cm:Team`), the
+    attributes by `@` and their qualified names (including the namespace
+    declarations, e.g. `@xmlns:dc`), the text by `#text` when the element
+    also has attributes or children, and the repeated elements are
+    collected in lists.
+
+    The document is parsed into an lxml tree and converted at once when
+    all the namespaces are declared on the root element, which is the
+    case of the RTC responses. Otherwise the namespace declarations are
+    tracked by the parsing events.
+    """
+
+    name = "lxml"
+
+    def parse(self, content):
+        """Parse the XML document into :class:`OrderedDict` trees
+
+        :param content: the XML document in bytes or string
+        :return: an :class:`OrderedDict` whose only key is the qualified
+            name of the root element
+        """
+
+        if isinstance(content, six.text_type):
+            content = content.encode("utf-8")
+
+        parser = etree.XMLParser(**_LXML_OPTIONS)
+        root = etree.fromstring(content, parser)
+        _check_errors(parser.error_log)
+        if root is None:
+            raise etree.XMLSyntaxError("Document is empty", 0, 1, 1)
+
+        nsmap = root.nsmap
+        if (_count_declarations(content) == len(nsmap) and
+                len(set(nsmap.values())) == len(nsmap)):
+            return _tree_to_dict(root)
+
+        builder = _DictBuilder()
+        events = etree.iterparse(io.BytesIO(content),
+                                 events=_LXML_EVENTS,
+                                 **_LXML_OPTIONS)
+        for event, obj in events:
+            builder.handle(event, obj)
+        return builder.result
+
+
+def _check_errors(error_log):
+    """Raise the first error other than the undeclared namespace prefixes,
+    which the recovering parser has skipped
+    """
+
+    for error in error_log:
+        if error.domain != etree.ErrorDomains.NAMESPACE:
+            raise etree.XMLSyntaxError(error.message, error.type, error.line,
+                                       error.column)
+
+
+def _count_declarations(content):
+    """Count the namespace declarations in the document
+
+    The text that looks like a declaration is also counted, which only
+    makes the exact but slower conversion taken.
+    """
+
+    return sum(1 for matched in _XMLNS_PATTERN.finditer(content)
+               if content[matched.start() - 1:matched.start()].isspace())
+
+
+def _tree_to_dict(root):
+    """Convert the lxml tree whose namespaces are all declared on the
+    root element, so that each namespace has a single prefix
+    """
+
+    nsmap = root.nsmap
+    qnames = _QualifiedNames(
+        dict((uri, prefix) for prefix, uri in nsmap.items()))
+
+    def convert(element):
+        node = OrderedDict()
+        attrib = element.attrib
+        if attrib:
+            for name, value in attrib.items():
+                node["@" + qnames[name]] = value
+
+        text = element.text
+        texts = [text] if text else []
+        for child in element:
+            # the same as _push, which is inlined for the speed
+            key = qnames[child.tag]
+            value = convert(child)
+            if key not in node:
+                node[key] = value
+            else:
+                existing = node[key]
+                if isinstance(existing, list):
+                    existing.append(value)
+                else:
+                    node[key] = [existing, value]
+            tail = child.tail
+            if tail:
+                texts.append(tail)
+
+        data = "".join(texts).strip() if texts else ""
+        if not node:
+            return data or None
+        if data:
+            node["#text"] = data
+        return node
+
+    value = convert(root)
+    if nsmap:
+        declared = OrderedDict(
+            ("@xmlns:%s" % prefix if prefix else "@xmlns", uri)
+            for prefix, uri in nsmap.items())
+        if isinstance(value, OrderedDict):
+            declared.update(value)
+        elif value is not None:
+            declared["#text"] = value
+        value = declared
+    return OrderedDict([(qnames[root.tag], value)])
+
+
+class _QualifiedNames(dict):
+    """Map the lxml names (e.g. `{uri}local`) to the qualified names
+    (e.g. `prefix:local`)
+
+    :param prefixes: the uri -> prefix mapping in the scope
+    """
+
+    def __init__(self, prefixes):
+        dict.__init__(self)
+        self.prefixes = prefixes
+
+    def __missing__(self, name):
+        qname = name
+        if name[0] == "{":
+            uri, local = name[1:].split("}", 1)
+            prefix = self.prefixes.get(uri)
+            qname = ":".join([prefix, local]) if prefix else local
+        self[name] = qname
+        return qname
+
+
+class _DictBuilder(object):
+    """Build the :mod:`xmltodict` compatible trees from the lxml parsing
+    events
+
+    The namespace declarations are tracked by the `start-ns` events, so
+    that the elements and attributes get the prefixes used in the
+    document. The processed elements are cleared to release the memory.
+
+    :param streamed: (optional) the qualified name of the children of the
+        root element that are not added to the tree but only returned by
+        :meth:`handle`, and then removed from the parsed document
+    """
+
+    def __init__(self, streamed=None):
+        self.result = None
+        self.streamed = streamed
+        # the qualified names in the current scope
+        self._qnames = _QualifiedNames(dict())
+        self._pending_ns = list()
+        # (qualified name, attributes and children, saved scope) of the
+        # elements being parsed
+        self._stack = list()
+
+    @property
+    def root(self):
+        """The attributes and the added children of the root element,
+        available once the root element is started
+        """
+
+        if self._stack:
+            return self._stack[0][1]
+        if self.result is not None:
+            return list(self.result.values())[0]
+        return None
+
+    def handle(self, event, obj):
+        """Handle one parsing event
+
+        :return: the finished `(depth, qualified name, value)` on the
+            `end` events, otherwise `None`
+        """
+
+        if event == "start":
+            self._start(obj)
+        elif event == "end":
+            return self._end(obj)
+        elif event == "start-ns":
+            self._pending_ns.append(obj)
+        return None
+
+    def _start(self, element):
+        node = OrderedDict()
+        saved_scope = None
+        if self._pending_ns:
+            saved_scope = self._qnames
+            prefixes = dict(saved_scope.prefixes)
+            for prefix, uri in self._pending_ns:
+                prefixes[uri] = prefix
+                node["@xmlns:%s" % prefix if prefix else "@xmlns"] = uri
+            self._qnames = _QualifiedNames(prefixes)
+            self._pending_ns = list()
+
+        qnames = self._qnames
+        for name, value in element.attrib.items():
+            node["@" + qnames[name]] = value
+        self._stack.append((qnames[element.tag], node, saved_scope))
+
+    def _end(self, element):
+        qname, node, saved_scope = self._stack.pop()
+
+        texts = [element.text] if element.text else []
+        texts.extend(child.tail for child in element if child.tail)
+        data = "".join(texts).strip() if texts else ""
+        if node:
+            if data:
+                node["#text"] = data
+            value = node
+        else:
+            value = data or None
+        # the parsed children are not needed any more
+        element.clear(keep_tail=True)
+
+        if saved_scope is not None:
+            self._qnames = saved_scope
+
+        depth = len(self._stack)
+        if depth == 1 and qname == self.streamed:
+            # drop the streamed elements, whose tails are not needed either
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+        elif self._stack:
+            _push(self._stack[-1][1], qname, value)
+        else:
+            self.result = OrderedDict([(qname, value)])
+        return depth, qname, value
+
+
+def _push(node, key, value):
+    existing = node.get(key)
+    if existing is None and key not in node:
+        node[key] = value
+    elif isinstance(existing, list):
+        existing.append(value)
+    else:
+        node[key] = [existing, value]
+
+
+class CollectionStream(object):
+    """Parse the page of an OSLC collection incrementally with the
+    :mod:`lxml` pull parser
+
+    Each entry is yielded as soon as it is parsed, while the rest of the
+    page is still being received, and dropped from the parsed document
+    afterwards. So only the entry being parsed is kept in memory.
+
+    Unlike :class:`LxmlParser`, the page is parsed strictly, so that a
+    truncated or malformed page raises :class:`lxml.etree.XMLSyntaxError`.
+
+    :param chunks: an iterable that yields the chunks of the page in bytes
+        (e.g. :meth:`requests.Response.iter_content`)
+    :param entry_tag: the qualified name of the entries (e.g.
+        `oslc_cm:ChangeRequest`)
+    """
+
+    def __init__(self, chunks, entry_tag):
+        self.chunks = chunks
+        self.entry_tag = entry_tag
+        self._builder = _DictBuilder(streamed=entry_tag)
+
+    @property
+    def collection(self):
+        """The attributes (e.g. `@oslc_cm:next`) and the other children of
+        the collection element, which are complete after all the entries
+        are iterated
+        """
+
+        return self._builder.root
+
+    def __iter__(self):
+        # the recovering parser closes a truncated page silently
+        parser = etree.XMLPullParser(events=_LXML_EVENTS,
+                                     **dict(_LXML_OPTIONS, recover=False))
+        for chunk in self.chunks:
+            if not chunk:
+                continue
+            parser.feed(chunk)
+            for entry in self._read_entries(parser):
+                yield entry
+
+        parser.close()
+        for entry in self._read_entries(parser):
+            yield entry
+
+    def _read_entries(self, parser):
+        for event, obj in parser.read_events():
+            finished = self._builder.handle(event, obj)
+            if (finished is not None and finished[0] == 1 and
+                    finished[1] == self.entry_tag):
+                yield finished[2]
+
+
+PARSERS = {
+    XmltodictParser.name: XmltodictParser,
+    LxmlParser.name: LxmlParser,
+}
+
+
+def get_parser(parser=None):
+    """Get the XML parser backend
+
+    :param parser: the name of the backend (`xmltodict` or `lxml`), or an
+        object that has a `parse` method. If `None`, the
+        :class:`XmltodictParser` is used
+    :return: the parser object
+    """
+
+    if parser is None:
+        return XmltodictParser()
+    if isinstance(parser, six.string_types):
+        try:
+            return PARSERS[parser]()
+        except KeyError:
+            raise exception.BadValue("Unsupported XML parser: %s" % parser)
+    if not callable(getattr(parser, "parse", None)):
+        raise exception.BadValue("The XML parser has no parse method")
+    return parser
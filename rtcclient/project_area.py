@@ -1,10 +1,10 @@
 import logging
 
 import six
-import xmltodict
 
 from rtcclient import exception
 from rtcclient.base import FieldBase
+from rtcclient.cache import TTLCache
 from rtcclient.models import Role
 
 
@@ -20,8 +20,8 @@ class ProjectArea(FieldBase):
 
     log = logging.getLogger("project_area.ProjectArea")
 
-    def __init__(self, url, rtc_obj, raw_data):
-        FieldBase.__init__(self, url, rtc_obj, raw_data)
+    def __init__(self, url, rtc_obj, raw_data, lazy=False):
+        FieldBase.__init__(self, url, rtc_obj, raw_data, lazy=lazy)
         self.id = self.url.split("/")[-1]
 
     def __str__(self):
@@ -58,7 +58,7 @@ class ProjectArea(FieldBase):
                         cookies=self.rtc_obj.cookies)
 
         roles_list = list()
-        raw_data = xmltodict.parse(resp.content)
+        raw_data = self.rtc_obj.parser.parse(resp.content)
         roles_raw = raw_data['jp06:roles']['jp06:role']
         if not roles_raw:
             self.log.warning("There are no roles in <ProjectArea %s>", self)
@@ -152,7 +152,8 @@ class ProjectArea(FieldBase):
                                                  projectarea_id=self.id,
                                                  page_size='100',
                                                  returned_properties=rp,
-                                                 filter_rule=filter_rule)
+                                                 filter_rule=filter_rule,
+                                                 limit=1 if email else None)
 
     def getItemTypes(self, returned_properties=None):
         """Get all the :class:`rtcclient.models.ItemType` objects
@@ -200,15 +201,11 @@ class ProjectArea(FieldBase):
 
     def _getItemTypes(self, returned_properties=None, title=None):
         rp = returned_properties
-        filter_rule = None
-        if title is not None:
-            fit_rule = ("dc:title", None, title)
-            filter_rule = self.rtc_obj._add_filter_rule(filter_rule, fit_rule)
-        return self.rtc_obj._get_paged_resources("ItemType",
-                                                 projectarea_id=self.id,
-                                                 page_size='10',
-                                                 returned_properties=rp,
-                                                 filter_rule=filter_rule)
+        return self.rtc_obj._get_enumerations("ItemType",
+                                              projectarea_id=self.id,
+                                              page_size='10',
+                                              returned_properties=rp,
+                                              title=title)
 
     def getAdministrators(self, returned_properties=None):
         """Get all the :class:`rtcclient.models.Administrator` objects in this
@@ -268,4 +265,112 @@ class ProjectArea(FieldBase):
                                                  projectarea_id=self.id,
                                                  page_size='10',
                                                  returned_properties=rp,
-                                                 filter_rule=filter_rule)
+                                                 filter_rule=filter_rule,
+                                                 limit=1 if email else None)
+
+
+def index_projectareas(proj_areas):
+    """Index the project areas by their ids and names
+
+    :param proj_areas: a :class:`list` that contains the
+        :class:`rtcclient.project_area.ProjectArea` objects
+    :return: a :class:`tuple` of the project areas, the :class:`dict` keyed
+        by the ids and the :class:`dict` keyed by the names, where the
+        first one wins
+    """
+
+    by_id = dict()
+    by_name = dict()
+    for proj_area in proj_areas:
+        by_id.setdefault(proj_area.id, proj_area)
+        by_name.setdefault(proj_area.title, proj_area)
+    return proj_areas, by_id, by_name
+
+
+class ProjectAreaRegistry(object):
+    """Index the :class:`rtcclient.project_area.ProjectArea` objects of the
+    server by their ids and names
+
+    All the project areas are fetched with a single scan the first time
+    they are looked up, and the later lookups are dictionary lookups until
+    the registry expires or is refreshed.
+
+    :param rtc_obj: a reference to the
+        :class:`rtcclient.client.RTCClient` object
+    :param ttl: (default is 600) the seconds the indexes stay valid. Set to
+        `None` to keep them until refreshed, or to `0` to always fetch the
+        project areas from the server
+    """
+
+    log = logging.getLogger("project_area.ProjectAreaRegistry")
+
+    def __init__(self, rtc_obj, ttl=600):
+        self.rtc_obj = rtc_obj
+        self.ttl = ttl
+        # one snapshot for the archived and the unarchived project areas
+        self._snapshots = TTLCache(maxsize=2 if ttl != 0 else 0, ttl=ttl)
+
+    def _get_snapshot(self, archived=False):
+        # the executor workers do not wait for the other thread, whose
+        # pages may be queued behind them
+        return self._snapshots.load(
+            archived,
+            lambda: self._load_snapshot(archived),
+            wait=not self.rtc_obj.executor.in_worker())
+
+    def _load_snapshot(self, archived=False):
+        self.log.debug("Load all the ProjectAreas [archived=%s]", archived)
+        proj_areas = self.rtc_obj._get_paged_resources(
+            "ProjectArea", page_size="100", archived=archived) or []
+        return index_projectareas(proj_areas)
+
+    def getAll(self, archived=False):
+        """Get all the :class:`rtcclient.project_area.ProjectArea` objects
+
+        :param archived: (default is False) whether the project areas
+            are archived
+        :return: a :class:`list` that contains all the
+            :class:`rtcclient.project_area.ProjectArea` objects, or `None`
+            if there is no project area
+        :rtype: list
+        """
+
+        proj_areas = self._get_snapshot(archived=archived)[0]
+        return list(proj_areas) if proj_areas else None
+
+    def getByID(self, projectarea_id, archived=False):
+        """Get the :class:`rtcclient.project_area.ProjectArea` object by its
+        id
+
+        :param projectarea_id: the project area id
+        :param archived: (default is False) whether the project area
+            is archived
+        :return: the :class:`rtcclient.project_area.ProjectArea` object, or
+            `None` if not found
+        :rtype: rtcclient.project_area.ProjectArea
+        """
+
+        return self._get_snapshot(archived=archived)[1].get(projectarea_id)
+
+    def getByName(self, projectarea_name, archived=False):
+        """Get the :class:`rtcclient.project_area.ProjectArea` object by its
+        name
+
+        :param projectarea_name: the project area name
+        :param archived: (default is False) whether the project area
+            is archived
+        :return: the :class:`rtcclient.project_area.ProjectArea` object, or
+            `None` if not found
+        :rtype: rtcclient.project_area.ProjectArea
+        """
+
+        return self._get_snapshot(archived=archived)[2].get(projectarea_name)
+
+    def refresh(self):
+        """Drop the indexes so that the project areas are fetched from the
+        server again on the next lookup
+
+        """
+
+        self.log.debug("Refresh the ProjectAreas")
+        self._snapshots.invalidate()
@@ -5,6 +5,7 @@ import six
 from rtcclient import exception
 from rtcclient import urlquote
 from rtcclient.base import RTCBase
+from rtcclient.export import ColumnBuilder
 
 
 class Query(RTCBase):
@@ -33,7 +34,10 @@ class Query(RTCBase):
                        projectarea_id=None,
                        projectarea_name=None,
                        returned_properties=None,
-                       archived=False):
+                       archived=False,
+                       lazy=False,
+                       compact=False,
+                       keep_raw=False):
         """Query workitems with the query string in a certain
         :class:`rtcclient.project_area.ProjectArea`
 
@@ -48,6 +52,15 @@ class Query(RTCBase):
             Refer to :class:`rtcclient.client.RTCClient` for more explanations
         :param archived: (default is False) whether the
             :class:`rtcclient.workitem.Workitem` is archived
+        :param lazy: (default is False) If `True`, the linked fields
+            (e.g. ownedBy, severity) are only resolved when accessed
+        :param compact: (default is False) If `True`, the workitems are
+            returned as the compact and read-only
+            :class:`rtcclient.record.WorkitemRecord` objects, which take
+            much less memory for the bulk reads
+        :param keep_raw: (default is False) whether the compact records
+            retain the raw data, which saves the request when converting
+            them to the full workitems
         :return: a :class:`list` that contains the queried
             :class:`rtcclient.workitem.Workitem` objects
         :rtype: list
@@ -60,13 +73,200 @@ class Query(RTCBase):
                       query_str)
         query_str = urlquote(query_str)
         rp = returned_properties
+        builder = self.rtc_obj._get_workitem_builder(compact=compact,
+                                                     keep_raw=keep_raw)
 
         return (self.rtc_obj._get_paged_resources("Query",
                                                   projectarea_id=pa_id,
                                                   customized_attr=query_str,
                                                   page_size="100",
                                                   returned_properties=rp,
-                                                  archived=archived))
+                                                  archived=archived,
+                                                  lazy=lazy,
+                                                  resource_builder=builder))
+
+    def iterQueryWorkitems(self,
+                           query_str,
+                           projectarea_id=None,
+                           projectarea_name=None,
+                           returned_properties=None,
+                           archived=False,
+                           lazy=False,
+                           stream=False,
+                           compact=False,
+                           keep_raw=False):
+        """Iterate the workitems queried with the query string in a certain
+        :class:`rtcclient.project_area.ProjectArea` page by page
+
+        It works like :class:`rtcclient.query.Query.queryWorkitems`, except
+        that the workitems are yielded as soon as their page is fetched.
+        Closing the generator stops fetching the further pages.
+
+        If `stream` is set, each page is parsed while it is downloaded, and
+        the workitems are yielded one by one as soon as they are received.
+
+        :param query_str: a valid query string
+        :param projectarea_id: the :class:`rtcclient.project_area.ProjectArea`
+            id
+        :param projectarea_name: the
+            :class:`rtcclient.project_area.ProjectArea` name
+        :param returned_properties: the returned properties that you want.
+            Refer to :class:`rtcclient.client.RTCClient` for more explanations
+        :param archived: (default is False) whether the
+            :class:`rtcclient.workitem.Workitem` is archived
+        :param lazy: (default is False) If `True`, the linked fields
+            (e.g. ownedBy, severity) are only resolved when accessed
+        :param stream: (default is False) whether to parse the pages
+            incrementally with :mod:`lxml`
+        :param compact: (default is False) If `True`, the workitems are
+            returned as the compact and read-only
+            :class:`rtcclient.record.WorkitemRecord` objects, which take
+            much less memory for the bulk reads
+        :param keep_raw: (default is False) whether the compact records
+            retain the raw data, which saves the request when converting
+            them to the full workitems
+        :return: a generator that yields the queried
+            :class:`rtcclient.workitem.Workitem` objects
+        :rtype: generator
+        """
+
+        pa_id = (self.rtc_obj._pre_get_resource(
+            projectarea_id=projectarea_id, projectarea_name=projectarea_name))
+
+        self.log.info("Start to iterate workitems with query string: %s",
+                      query_str)
+        query_str = urlquote(query_str)
+        rp = returned_properties
+        builder = self.rtc_obj._get_workitem_builder(compact=compact,
+                                                     keep_raw=keep_raw)
+
+        return (self.rtc_obj._iter_paged_resources("Query",
+                                                   projectarea_id=pa_id,
+                                                   customized_attr=query_str,
+                                                   page_size="100",
+                                                   returned_properties=rp,
+                                                   archived=archived,
+                                                   lazy=lazy,
+                                                   stream=stream,
+                                                   resource_builder=builder))
+
+    def queryWorkitemsColumns(self,
+                              query_str,
+                              projectarea_id=None,
+                              projectarea_name=None,
+                              returned_properties=None,
+                              archived=False,
+                              output="columns",
+                              resolve_links=True):
+        """Query workitems with the query string in a certain
+        :class:`rtcclient.project_area.ProjectArea`, and return them as a
+        table of columns
+
+        The columns are built directly from the query results without
+        building any :class:`rtcclient.workitem.Workitem` objects, which
+        makes it feasible to export a large number of workitems. Refer to
+        :class:`rtcclient.export.ColumnBuilder` for the columns.
+
+        :param query_str: a valid query string
+        :param projectarea_id: the :class:`rtcclient.project_area.ProjectArea`
+            id
+        :param projectarea_name: the
+            :class:`rtcclient.project_area.ProjectArea` name
+        :param returned_properties: the returned properties that you want,
+            which also select the columns. Refer to
+            :class:`rtcclient.client.RTCClient` for more explanations
+        :param archived: (default is False) whether the
+            :class:`rtcclient.workitem.Workitem` is archived
+        :param output: (default is `columns`) `columns` for an
+            :class:`OrderedDict` of the per-field lists, `pandas` for the
+            :class:`pandas.DataFrame` or `arrow` for the
+            :class:`pyarrow.Table`, which requires the corresponding package
+        :param resolve_links: (default is True) whether the linked fields
+            (e.g. ownedBy, severity) are filled with the titles instead of
+            the rdf:resource urls
+        :return: the table of the queried workitems in the output format
+        """
+
+        builder = ColumnBuilder(self.rtc_obj,
+                                returned_properties=returned_properties,
+                                output=output,
+                                resolve_links=resolve_links)
+        rows = self._iter_query_rows(builder,
+                                     query_str,
+                                     projectarea_id=projectarea_id,
+                                     projectarea_name=projectarea_name,
+                                     returned_properties=returned_properties,
+                                     archived=archived)
+        return builder.collect(rows)
+
+    def iterQueryWorkitemsColumns(self,
+                                  query_str,
+                                  projectarea_id=None,
+                                  projectarea_name=None,
+                                  returned_properties=None,
+                                  archived=False,
+                                  output="columns",
+                                  resolve_links=True,
+                                  batch_size=1000):
+        """Query workitems with the query string in a certain
+        :class:`rtcclient.project_area.ProjectArea`, and iterate them as the
+        batches of columns
+
+        It works like :class:`rtcclient.query.Query.queryWorkitemsColumns`,
+        except that the batches are yielded as soon as enough workitems are
+        fetched. Without `returned_properties`, the later batches may
+        contain more columns than the earlier ones.
+
+        :param batch_size: (default is 1000) the maximum number of the
+            workitems in each batch
+        :return: a generator that yields the batches in the output format:
+            an :class:`OrderedDict` of the per-field lists, a
+            :class:`pandas.DataFrame` or a :class:`pyarrow.RecordBatch`
+        :rtype: generator
+        """
+
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            excp_msg = "Invalid batch size: %s" % batch_size
+            self.log.error(excp_msg)
+            raise exception.BadValue(excp_msg)
+
+        builder = ColumnBuilder(self.rtc_obj,
+                                returned_properties=returned_properties,
+                                output=output,
+                                resolve_links=resolve_links)
+        rows = self._iter_query_rows(builder,
+                                     query_str,
+                                     projectarea_id=projectarea_id,
+                                     projectarea_name=projectarea_name,
+                                     returned_properties=returned_properties,
+                                     archived=archived)
+        return builder.iterBatches(rows, batch_size=batch_size)
+
+    def _iter_query_rows(self,
+                         builder,
+                         query_str,
+                         projectarea_id=None,
+                         projectarea_name=None,
+                         returned_properties=None,
+                         archived=False):
+        pa_id = (self.rtc_obj._pre_get_resource(
+            projectarea_id=projectarea_id, projectarea_name=projectarea_name))
+
+        self.log.info("Start to export workitems with query string: %s",
+                      query_str)
+        query_str = urlquote(query_str)
+        rp = returned_properties
+
+        # the linked fields are resolved by the batches
+        return (self.rtc_obj._iter_paged_resources(
+            "Query",
+            projectarea_id=pa_id,
+            customized_attr=query_str,
+            page_size="100",
+            returned_properties=rp,
+            archived=archived,
+            lazy=True,
+            resource_builder=builder.buildRow))
 
     def getAllSavedQueries(self,
                            projectarea_id=None,
@@ -272,3 +472,31 @@ class Query(RTCBase):
             page_size="100",
             customized_attr=saved_query_id,
             returned_properties=rp))
+
+    def iterSavedQueryResults(self, saved_query_id, returned_properties=None):
+        """Iterate the workitems queried with the saved query id page by page
+
+        It works like :class:`rtcclient.query.Query.runSavedQueryByID`,
+        except that the workitems are yielded as soon as their page is
+        fetched. Closing the generator stops fetching the further pages.
+
+        :param saved_query_id: the saved query id
+        :param returned_properties: the returned properties that you want.
+            Refer to :class:`rtcclient.client.RTCClient` for more explanations
+        :return: a generator that yields the queried
+            :class:`rtcclient.workitem.Workitem` objects
+        :rtype: generator
+        """
+
+        if not isinstance(saved_query_id,
+                          six.string_types) or not saved_query_id:
+            excp_msg = "Please specify a valid saved query id"
+            self.log.error(excp_msg)
+            raise exception.BadValue(excp_msg)
+
+        rp = returned_properties
+        return (self.rtc_obj._iter_paged_resources(
+            "RunQuery",
+            page_size="100",
+            customized_attr=saved_query_id,
+            returned_properties=rp))
@@ -0,0 +1,224 @@
+import functools
+import logging
+import sys
+
+from rtcclient.base import parse_raw_item
+from rtcclient.workitem import Workitem
+
+# the longer values (e.g. descriptions) are rarely shared by the workitems
+_INTERN_MAX_LENGTH = 64
+# the subclasses of the most recently used schemas are kept
+_RECORD_CLASS_CACHE_SIZE = 256
+
+
+def _intern(value):
+    if isinstance(value, str) and len(value) <= _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+class WorkitemRecord(object):
+    """A compact and read-only representation of the workitem for the bulk
+    reads
+
+    Unlike :class:`rtcclient.workitem.Workitem`, the fields are stored in
+    the fixed slots instead of the per-instance dictionaries. The
+    workitems with the same fields (e.g. the workitems of the same type in
+    a project area) share a subclass that has a slot for each field, and
+    the short values (e.g. states, types and the linked urls) are interned
+    so that they are shared by all the records.
+
+    The records are built by :meth:`fromRaw`, and can be converted to the
+    full :class:`rtcclient.workitem.Workitem` objects with
+    :meth:`toWorkitem`.
+
+    :ivar url: the workitem url
+    :ivar identifier: the id of the workitem
+    :ivar raw_data: the raw data ( OrderedDict ) of the workitem, or `None`
+        if it is not retained
+    """
+
+    __slots__ = ("url", "identifier", "rtc_obj", "raw_data", "_links")
+    log = logging.getLogger("record.WorkitemRecord")
+
+    # the attribute names of the fields, and the mapping from them to the
+    # keys in the raw data, which are set by the schema subclasses
+    fields = ()
+    field_alias = dict()
+
+    @classmethod
+    def fromRaw(cls, url, rtc_obj, raw_data, keep_raw=False):
+        """Build the record from the raw data of the workitem
+
+        The linked fields (e.g. ownedBy, severity) are left unresolved,
+        which are resolved by :meth:`resolveLinks` or the first time they
+        are accessed.
+
+        :param url: the workitem url
+        :param rtc_obj: a reference to the
+            :class:`rtcclient.client.RTCClient` object
+        :param raw_data: the raw data ( OrderedDict ) of the workitem
+        :param keep_raw: (default is `False`) whether to retain the raw
+            data in the record
+        :return: the :class:`WorkitemRecord` object
+        """
+
+        values = dict()
+        links = list()
+        alias = list()
+        for item in raw_data.items():
+            processed = parse_raw_item(item)
+            if processed is None:
+                continue
+            key, attr, value, rdf_url = processed
+            if not attr.isidentifier():
+                continue
+            if attr in values:
+                # the later one wins like the Workitem
+                alias = [pair for pair in alias if pair[0] != attr]
+                links = [pair for pair in links if pair[0] != attr]
+            alias.append((attr, key))
+            values[attr] = _intern(value)
+            if rdf_url is not None:
+                links.append((attr, _intern(rdf_url)))
+
+        # the same fields share the subclass in whatever order
+        record_cls = _get_record_class(tuple(sorted(alias)))
+        record = record_cls.__new__(record_cls)
+        setter = object.__setattr__
+        setter(record, "url", url)
+        setter(record, "identifier", url.split("/")[-1])
+        setter(record, "rtc_obj", rtc_obj)
+        setter(record, "raw_data", raw_data if keep_raw else None)
+        setter(record, "_links", tuple(links) if links else None)
+        link_attrs = set(attr for attr, _ in links)
+        for attr, value in values.items():
+            if attr not in link_attrs:
+                setter(record, attr, value)
+        return record
+
+    def __str__(self):
+        return str(self.identifier)
+
+    def __repr__(self):
+        return "<WorkitemRecord %s>" % self
+
+    def __eq__(self, other):
+        return isinstance(other, WorkitemRecord) and other.url == self.url
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.url)
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __getattr__(self, name):
+        # only called when the slot is not set, e.g. the linked field which
+        # has not been resolved yet
+        rdf_url = self.getLinkURL(name)
+        if rdf_url is not None:
+            self.resolveLinks()
+            try:
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                return None
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (self.__class__.__name__, name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'%s' object is read-only" %
+                             self.__class__.__name__)
+
+    def getattr(self, attr):
+        try:
+            return getattr(self, attr)
+        except Exception:
+            return None
+
+    def getLinkURL(self, attr):
+        """Get the rdf:resource url of the linked field without resolving it
+
+        :param attr: the attribute name of the linked field
+            (e.g. ownedBy, severity)
+        :return: the rdf:resource url, or `None` if it is not a linked field
+        """
+
+        for link_attr, rdf_url in self._links or ():
+            if link_attr == attr:
+                return rdf_url
+        return None
+
+    @property
+    def _pending_links(self):
+        pending_links = dict()
+        for attr, rdf_url in self._links or ():
+            try:
+                object.__getattribute__(self, attr)
+            except AttributeError:
+                pending_links[attr] = rdf_url
+        return pending_links
+
+    def resolveLinks(self):
+        """Resolve all the pending linked fields (rdf:resource) of this
+        record with their titles, which are cached by the client
+        """
+
+        pending_links = self._pending_links
+        if not pending_links:
+            return
+        rdf_titles = self.rtc_obj._get_rdf_resource_titles(
+            pending_links.values())
+        self._set_link_titles(rdf_titles)
+
+    def _set_link_titles(self, rdf_titles):
+        for attr, rdf_url in self._pending_links.items():
+            if rdf_url in rdf_titles:
+                object.__setattr__(self, attr, _intern(rdf_titles[rdf_url]))
+
+    def toWorkitem(self, lazy=False):
+        """Convert the record to the full
+        :class:`rtcclient.workitem.Workitem` object
+
+        The workitem is built from the retained raw data, whose linked
+        fields are mostly found in the resource cache of the client.
+        Otherwise, the workitem is requested again.
+
+        :param lazy: (default is False) If `True`, the linked fields
+            (e.g. ownedBy, severity) are only resolved when accessed
+        :return: the :class:`rtcclient.workitem.Workitem` object
+        :rtype: rtcclient.workitem.Workitem
+        """
+
+        if self.raw_data is None:
+            self.log.debug("Request <Workitem %s> without the raw data", self)
+            return self.rtc_obj.getWorkitem(self.identifier, lazy=lazy)
+        return Workitem(self.url,
+                        self.rtc_obj,
+                        workitem_id=self.identifier,
+                        raw_data=self.raw_data,
+                        lazy=lazy)
+
+
+@functools.lru_cache(maxsize=_RECORD_CLASS_CACHE_SIZE)
+def _get_record_class(alias):
+    """Get the subclass of :class:`WorkitemRecord` for the schema
+
+    Only the subclasses of the most recently used schemas are kept, and
+    the evicted ones are released with their records.
+
+    :param alias: a sorted :class:`tuple` of the `(attribute name, key)`
+        of all the fields
+    """
+
+    fields = tuple(sys.intern(attr) for attr, _ in alias)
+    # e.g. dc:identifier is kept in the slot of the base class
+    slots = tuple(attr for attr in fields
+                  if attr not in WorkitemRecord.__slots__)
+    return type("WorkitemRecord", (WorkitemRecord,), {
+        "__slots__": slots,
+        "fields": fields,
+        "field_alias": dict(alias)
+    })
@@ -0,0 +1,240 @@
+import logging
+
+from rtcclient import exception
+from rtcclient.models import FiledAgainst, FoundIn, Comment, Action, State
+from rtcclient.models import IncludedInBuild, ChangeSet, Attachment
+from rtcclient.models import Severity, Priority, ItemType, SavedQuery
+from rtcclient.models import TeamArea, Member, Administrator, PlannedFor
+from rtcclient.project_area import ProjectArea
+from rtcclient.workitem import Workitem
+
+
+def parse_archived(value):
+    """Parse the value of `rtc_cm:archived` in the entries
+
+    :param value: the text of the element (e.g. "true" or "false")
+    :return: `True` or `False`
+    :rtype: bool
+    """
+
+    return value.strip().lower() == "true"
+
+
+class ResourceType(object):
+    """The description of a resource type in the OSLC collections
+
+    :param name: the resource name (e.g. Severity)
+    :param resource_cls: the class of the objects built from the entries
+    :param url_template: the path of the collection relative to
+        `<url>/oslc`, which is formatted with `projectarea_id`,
+        `workitem_id` and `customized_attr`
+    :param entry_tag: the tag of the entries in the collection
+    :param required: (optional) the names of the parameters that must be
+        specified to build the url
+    :param workitem_url: (default is `False`) whether the entries are
+        workitems, whose urls are normalized to `<url>/oslc/workitems/<id>`
+    :param queryable: (default is `False`) whether the collection accepts
+        the filters as `oslc_cm.query`
+    :param archived_parser: (optional) the callable to parse the
+        `rtc_cm:archived` of the entries
+    """
+
+    log = logging.getLogger("registry.ResourceType")
+
+    def __init__(self,
+                 name,
+                 resource_cls,
+                 url_template,
+                 entry_tag,
+                 required=(),
+                 workitem_url=False,
+                 queryable=False,
+                 archived_parser=parse_archived):
+        self.name = name
+        self.resource_cls = resource_cls
+        self.url_template = url_template
+        self.entry_tag = entry_tag
+        self.required = tuple(required)
+        self.workitem_url = workitem_url
+        self.queryable = queryable
+        self.archived_parser = archived_parser
+
+    def __repr__(self):
+        return "<ResourceType %s>" % self.name
+
+    def getPath(self,
+                projectarea_id=None,
+                workitem_id=None,
+                customized_attr=None):
+        """Get the path of the collection relative to `<url>/oslc`
+
+        :raises: :class:`rtcclient.exception.EmptyAttrib` if any required
+            parameter is not specified
+        :rtype: str
+        """
+
+        params = {
+            "projectarea_id": projectarea_id,
+            "workitem_id": workitem_id,
+            "customized_attr": customized_attr
+        }
+        for param in self.required:
+            if not params[param]:
+                excp_msg = _MISSING_MSGS[param]
+                self.log.error("%s is specified", excp_msg)
+                raise exception.EmptyAttrib(excp_msg)
+        return self.url_template.format(**params)
+
+
+_MISSING_MSGS = {
+    "projectarea_id": "No ProjectArea ID",
+    "workitem_id": "No Workitem ID",
+    "customized_attr": "No customized value"
+}
+
+RESOURCE_TYPES = dict()
+
+
+def register_resource_type(resource_type):
+    """Register the resource type, which replaces the registered one with
+    the same name
+
+    :param resource_type: the :class:`ResourceType` object
+    :return: the registered :class:`ResourceType` object
+    """
+
+    RESOURCE_TYPES[resource_type.name] = resource_type
+    return resource_type
+
+
+_PA = ("projectarea_id",)
+_WI = ("workitem_id",)
+_PA_CUST = ("projectarea_id", "customized_attr")
+_WI_CUST = ("workitem_id", "customized_attr")
+
+for _resource_type in [
+        ResourceType("TeamArea",
+                     TeamArea,
+                     "teamareas",
+                     "rtc_cm:Team",
+                     queryable=True),
+        ResourceType("ProjectArea",
+                     ProjectArea,
+                     "projectareas",
+                     "rtc_cm:Project",
+                     queryable=True),
+        ResourceType("FiledAgainst",
+                     FiledAgainst,
+                     "categories",
+                     "rtc_cm:Category",
+                     queryable=True),
+        ResourceType("FoundIn",
+                     FoundIn,
+                     "deliverables",
+                     "rtc_cm:Deliverable",
+                     queryable=True),
+        ResourceType("PlannedFor",
+                     PlannedFor,
+                     "iterations",
+                     "rtc_cm:Iteration",
+                     queryable=True),
+        ResourceType("ItemType",
+                     ItemType,
+                     "types/{projectarea_id}",
+                     "rtc_cm:Type",
+                     required=_PA,
+                     queryable=True),
+        ResourceType("Member",
+                     Member,
+                     "projectareas/{projectarea_id}/rtc_cm:members",
+                     "rtc_cm:User",
+                     required=_PA,
+                     queryable=True),
+        ResourceType("Administrator",
+                     Administrator,
+                     "projectareas/{projectarea_id}/rtc_cm:administrators",
+                     "rtc_cm:User",
+                     required=_PA,
+                     queryable=True),
+        ResourceType("Workitem",
+                     Workitem,
+                     "contexts/{projectarea_id}/workitems",
+                     "oslc_cm:ChangeRequest",
+                     required=_PA,
+                     workitem_url=True),
+        ResourceType("Severity",
+                     Severity,
+                     "enumerations/{projectarea_id}/severity",
+                     "rtc_cm:Literal",
+                     required=_PA),
+        ResourceType("Priority",
+                     Priority,
+                     "enumerations/{projectarea_id}/priority",
+                     "rtc_cm:Literal",
+                     required=_PA),
+        ResourceType("Comment",
+                     Comment,
+                     "workitems/{workitem_id}/rtc_cm:comments",
+                     "rtc_cm:Comment",
+                     required=_WI),
+        ResourceType("Subscriber",
+                     Member,
+                     "workitems/{workitem_id}/rtc_cm:subscribers",
+                     "rtc_cm:User",
+                     required=_WI),
+        ResourceType("Action",
+                     Action,
+                     "workflows/{projectarea_id}/actions/{customized_attr}",
+                     "rtc_cm:Action",
+                     required=_PA_CUST),
+        ResourceType("Query",
+                     Workitem, "contexts/{projectarea_id}/workitems"
+                     "?oslc_cm.query={customized_attr}",
+                     "oslc_cm:ChangeRequest",
+                     required=_PA_CUST,
+                     workitem_url=True),
+        ResourceType("State",
+                     State,
+                     "workflows/{projectarea_id}/states/{customized_attr}",
+                     "rtc_cm:Status",
+                     required=_PA_CUST),
+        ResourceType("SavedQuery",
+                     SavedQuery,
+                     "queries",
+                     "rtc_cm:Query",
+                     queryable=True),
+        ResourceType("RunQuery",
+                     Workitem,
+                     "queries/{customized_attr}/rtc_cm:results",
+                     "oslc_cm:ChangeRequest",
+                     required=("customized_attr",),
+                     workitem_url=True),
+        ResourceType("IncludedInBuild",
+                     IncludedInBuild,
+                     "workitems/{workitem_id}/{customized_attr}",
+                     "oslc_auto:AutomationResult",
+                     required=_WI_CUST),
+        ResourceType("Parent",
+                     Workitem,
+                     "workitems/{workitem_id}/{customized_attr}",
+                     "oslc_cm:ChangeRequest",
+                     required=_WI_CUST,
+                     workitem_url=True),
+        ResourceType("Children",
+                     Workitem,
+                     "workitems/{workitem_id}/{customized_attr}",
+                     "oslc_cm:ChangeRequest",
+                     required=_WI_CUST,
+                     workitem_url=True),
+        ResourceType("ChangeSet",
+                     ChangeSet,
+                     "workitems/{workitem_id}/{customized_attr}",
+                     "rtc_cm:Reference",
+                     required=_WI_CUST),
+        ResourceType("Attachment",
+                     Attachment,
+                     "workitems/{workitem_id}/{customized_attr}",
+                     "rtc_cm:Attachment",
+                     required=_WI_CUST),
+]:
+    register_resource_type(_resource_type)
@@ -1,3 +1,5 @@
+import copy
+import hashlib
 import logging
 import os
 from xml.sax.saxutils import escape
@@ -9,8 +11,13 @@ import xmltodict
 
 from rtcclient import exception
 from rtcclient.base import RTCBase
+from rtcclient.cache import TTLCache
 from rtcclient.utils import remove_empty_elements
 
+# the compiled templates are kept until evicted, and the template files
+# are checked for changes when they are used
+_TEMPLATE_CACHE_SIZE = 256
+
 
 class Templater(RTCBase):
     """A wrapped class used to generate and render templates
@@ -21,12 +28,22 @@ class Templater(RTCBase):
     :param searchpath: the folder to store your templates.
         If `None`, the default search path
         (/your/site-packages/rtcclient/templates) will be loaded automatically.
-
+    :param ttl: (default is 600) the seconds the to-be-copied workitems and
+        the templates derived from them stay valid. Set to `None` to keep
+        them until refreshed, or to `0` to always fetch the workitems from
+        the server
+
+    The templates are compiled once and cached together with their fields
+    in `template_cache`, keyed by the template names or the hashes of the
+    template sources. The to-be-copied workitems and the templates derived
+    from them are cached in `derived_cache`, keyed by the workitem ids, so
+    that copying the same workitem many times only fetches it once. They
+    are refreshed when the workitems are changed by this client.
     """
 
     log = logging.getLogger("template.Templater")
 
-    def __init__(self, rtc_obj, searchpath=None):
+    def __init__(self, rtc_obj, searchpath=None, ttl=600):
         self.rtc_obj = rtc_obj
         RTCBase.__init__(self, self.rtc_obj.url)
         if searchpath is None:
@@ -37,6 +54,11 @@ class Templater(RTCBase):
         self.loader = jinja2.FileSystemLoader(searchpath=self.searchpath)
         self.environment = jinja2.Environment(loader=self.loader,
                                               trim_blocks=True)
+        # the same options as jinja2.Template for the template sources
+        self.source_environment = jinja2.Environment()
+        self.template_cache = TTLCache(maxsize=_TEMPLATE_CACHE_SIZE, ttl=None)
+        self.derived_cache = TTLCache(
+            maxsize=_TEMPLATE_CACHE_SIZE if ttl != 0 else 0, ttl=ttl)
 
     def __str__(self):
         return "Templater for %s" % self.rtc_obj
@@ -82,13 +104,8 @@ class Templater(RTCBase):
         if kwargs.get("description", None) is not None:
             kwargs["description"] = escape(kwargs["description"])
 
-        try:
-            temp = self.environment.get_template(template)
-            return temp.render(**kwargs)
-        except AttributeError:
-            err_msg = "Invalid value for 'template'"
-            self.log.error(err_msg)
-            raise exception.BadValue(err_msg)
+        temp, _ = self._get_compiled_template(template)
+        return temp.render(**kwargs)
 
     def renderFromWorkitem(self,
                            copied_from,
@@ -137,13 +154,28 @@ class Templater(RTCBase):
         :rtype: string
         """
 
-        temp = jinja2.Template(
-            self.getTemplate(copied_from,
-                             template_name=None,
-                             template_folder=None,
-                             keep=keep,
-                             encoding=encoding))
+        temp_source = self.getTemplate(copied_from,
+                                       template_name=None,
+                                       template_folder=None,
+                                       keep=keep,
+                                       encoding=encoding)
+        return self.renderFromSource(temp_source, **kwargs)
+
+    def renderFromSource(self, template_source, **kwargs):
+        """Render the template source, which is usually generated by
+        :class:`rtcclient.template.Templater.getTemplate` from some
+        to-be-copied :class:`rtcclient.workitem.Workitem`
 
+        :param template_source: the template source (usually represents the
+            template content in string format)
+        :param kwargs: The `kwargs` dict is used to fill the template.
+            More details, please refer to `kwargs` in
+            :class:`rtcclient.template.Templater.renderFromWorkitem`
+        :return: the :class:`string` object
+        :rtype: string
+        """
+
+        temp, _ = self._get_compiled_source(template_source)
         rendered_data = temp.render(**kwargs)
         return remove_empty_elements(rendered_data)
 
@@ -158,14 +190,8 @@ class Templater(RTCBase):
         :rtype: set
         """
 
-        try:
-            temp_source = self.environment.loader.get_source(
-                self.environment, template)
-            return self.listFieldsFromSource(temp_source)
-        except AttributeError:
-            err_msg = "Invalid value for 'template'"
-            self.log.error(err_msg)
-            raise exception.BadValue(err_msg)
+        _, fields = self._get_compiled_template(template)
+        return set(fields)
 
     def listFieldsFromWorkitem(self, copied_from, keep=False):
         """List all the attributes to be rendered directly from some
@@ -206,8 +232,58 @@ class Templater(RTCBase):
         :rtype: set
         """
 
-        ast = self.environment.parse(template_source)
-        return jinja2.meta.find_undeclared_variables(ast)
+        _, fields = self._get_compiled_source(template_source)
+        return set(fields)
+
+    def _get_compiled_template(self, template):
+        """Get the compiled template file and its fields from the cache, or
+        compile it if it is not cached or has been changed
+
+        :return: a :class:`tuple` of the :class:`jinja2.Template` object and
+            the :class:`frozenset` of the fields
+        """
+
+        cache_key = ("template", template)
+        cached = self.template_cache.get(cache_key)
+        if cached is not None and (cached[2] is None or cached[2]()):
+            return cached[:2]
+
+        try:
+            source, filename, uptodate = self.environment.loader.get_source(
+                self.environment, template)
+        except AttributeError:
+            err_msg = "Invalid value for 'template'"
+            self.log.error(err_msg)
+            raise exception.BadValue(err_msg)
+
+        self.log.debug("Compile the template %s", template)
+        temp, fields = _compile(self.environment,
+                                source,
+                                name=template,
+                                filename=filename,
+                                uptodate=uptodate)
+        self.template_cache.set(cache_key, (temp, fields, uptodate))
+        return temp, fields
+
+    def _get_compiled_source(self, template_source):
+        """Get the compiled template source and its fields from the cache,
+        or compile it if it is not cached
+
+        :return: a :class:`tuple` of the :class:`jinja2.Template` object and
+            the :class:`frozenset` of the fields
+        """
+
+        source_bytes = template_source
+        if isinstance(template_source, six.text_type):
+            source_bytes = template_source.encode("utf-8")
+        cache_key = ("source", hashlib.sha1(source_bytes).hexdigest())
+        cached = self.template_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        temp, fields = _compile(self.source_environment, template_source)
+        self.template_cache.set(cache_key, (temp, fields))
+        return temp, fields
 
     def getTemplate(self,
                     copied_from,
@@ -248,6 +324,80 @@ class Templater(RTCBase):
               specified
         """
 
+        copied_from = self._validate_copied_from(copied_from)
+        derived = self._get_derived(copied_from)
+        template_source = derived["templates"].get((keep, encoding))
+        if template_source is None:
+            template_source = self._derive_template(
+                copied_from,
+                copy.deepcopy(derived["workitem"]),
+                keep=keep,
+                encoding=encoding)
+            derived["templates"][(keep, encoding)] = template_source
+        else:
+            self.log.debug(
+                "Use the cached template from <Workitem %s> with "
+                "[keep]=%s", copied_from, keep)
+
+        if template_name is None:
+            return template_source
+
+        if template_folder is None:
+            template_folder = self.searchpath
+        template_file_path = os.path.join(template_folder, template_name)
+        self.log.info("Writing the template to file %s", template_file_path)
+        with open(template_file_path, "w") as output:
+            output.write(template_source)
+
+    def getWorkitemRaw(self, copied_from):
+        """Get the raw data of the to-be-copied
+        :class:`rtcclient.workitem.Workitem`, which is fetched once and
+        cached in `derived_cache` until it expires or is refreshed
+
+        :param copied_from: the to-be-copied
+            :class:`rtcclient.workitem.Workitem` id (integer or
+            equivalent string)
+        :return: a copy of the raw data ( OrderedDict ) of the whole
+            response, whose only key is `oslc_cm:ChangeRequest`
+        """
+
+        copied_from = self._validate_copied_from(copied_from)
+        # the cached one is kept unchanged
+        return copy.deepcopy(self._get_derived(copied_from)["workitem"])
+
+    def refresh(self, copied_from=None):
+        """Drop the cached to-be-copied :class:`rtcclient.workitem.Workitem`
+        and the templates derived from it, so that it is fetched from the
+        server again on the next use
+
+        :param copied_from: the to-be-copied
+            :class:`rtcclient.workitem.Workitem` id (integer or
+            equivalent string). If `None`, all the workitems are dropped
+        """
+
+        if copied_from is not None:
+            copied_from = self._validate_copied_from(copied_from)
+        self.log.debug("Refresh the templates from <Workitem %s>",
+                       "*" if copied_from is None else copied_from)
+        self.derived_cache.invalidate(copied_from)
+
+    def _get_derived(self, copied_from):
+        return self.derived_cache.load(
+            copied_from, lambda: {
+                "workitem": self._fetch_workitem(copied_from),
+                "templates": dict()
+            })
+
+    def _fetch_workitem(self, copied_from):
+        workitem_url = "/".join([self.url, "oslc/workitems/%s" % copied_from])
+        resp = self.get(workitem_url,
+                        verify=False,
+                        proxies=self.rtc_obj.proxies,
+                        headers=self.rtc_obj.headers,
+                        cookies=self.rtc_obj.cookies)
+        return self.rtc_obj.parser.parse(resp.content)
+
+    def _validate_copied_from(self, copied_from):
         try:
             if isinstance(copied_from, bool) or isinstance(copied_from, float):
                 raise ValueError()
@@ -259,29 +409,16 @@ class Templater(RTCBase):
             err_msg = "Please input a valid workitem id you want to copy from"
             self.log.error(err_msg)
             raise exception.BadValue(err_msg)
+        return copied_from
 
+    def _derive_template(self,
+                         copied_from,
+                         raw_data,
+                         keep=False,
+                         encoding="UTF-8"):
         self.log.info("Fetch the template from <Workitem %s> with [keep]=%s",
                       copied_from, keep)
 
-        if template_folder is None:
-            template_folder = self.searchpath
-
-        # identify whether output to a file
-        if template_name is not None:
-            template_file_path = os.path.join(template_folder, template_name)
-            output = open(template_file_path, "w")
-        else:
-            template_file_path = None
-            output = None
-
-        workitem_url = "/".join([self.url, "oslc/workitems/%s" % copied_from])
-        resp = self.get(workitem_url,
-                        verify=False,
-                        proxies=self.rtc_obj.proxies,
-                        headers=self.rtc_obj.headers,
-                        cookies=self.rtc_obj.cookies)
-        raw_data = xmltodict.parse(resp.content)
-
         # pre-adjust the template:
         # remove some attribute to avoid being overwritten, which will only be
         # generated when the workitem is created
@@ -318,13 +455,7 @@ class Templater(RTCBase):
         wk_raw_data["dc:title"] = "{{ title }}"
 
         if keep:
-            if template_file_path:
-                self.log.info("Writing the template to file %s",
-                              template_file_path)
-            return xmltodict.unparse(raw_data,
-                                     output=output,
-                                     encoding=encoding,
-                                     pretty=True)
+            return xmltodict.unparse(raw_data, encoding=encoding, pretty=True)
 
         replace_fields = [("rtc_cm:teamArea", "{{ teamArea }}"),
                           ("rtc_cm:ownedBy", "{{ ownedBy }}"),
@@ -343,10 +474,7 @@ class Templater(RTCBase):
                 self.log.warning("Cannot replace field [%s]", field[0])
                 continue
 
-        if template_file_path:
-            self.log.info("Writing the template to file %s", template_file_path)
-
-        return xmltodict.unparse(raw_data, output=output, encoding=encoding)
+        return xmltodict.unparse(raw_data, encoding=encoding)
 
     def _remove_long_fields(self, wk_raw_data):
         """Remove long fields: These fields are can only customized after
@@ -436,3 +564,20 @@ class Templater(RTCBase):
         self.log.info(
             "Successfully fetch all the templates from "
             "workitems: %s", workitems)
+
+
+def _compile(environment, source, name=None, filename=None, uptodate=None):
+    """Compile the template source once, and find its fields from the same
+    parsed tree
+
+    :return: a :class:`tuple` of the :class:`jinja2.Template` object and
+        the :class:`frozenset` of the undeclared variables
+    """
+
+    ast = environment.parse(source, name, filename)
+    fields = frozenset(jinja2.meta.find_undeclared_variables(ast))
+    code = environment.compile(ast, name, filename)
+    temp = environment.template_class.from_code(environment, code,
+                                                environment.make_globals(None),
+                                                uptodate)
+    return temp, fields
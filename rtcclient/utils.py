@@ -1,10 +1,10 @@
+import datetime
 import functools
 import logging
-from xml.parsers.expat import ExpatError
 
 import six
-import xmltodict
 from lxml import etree
+from requests.exceptions import HTTPError
 
 from rtcclient.exception import RTCException, BadValue
 
@@ -15,36 +15,91 @@ def setup_basic_logging():
                         "%(message)s")
 
 
+# the RTC server responds with its login form when the session expires,
+# which posts to j_security_check or reports the failed authentication
+_LOGIN_FORM_MARKERS = (b"j_security_check", b"authfailed")
+_LOGIN_FORM_PREFIX_LEN = 8192
+
+
+def _is_login_request(url):
+    """Identify whether the request belongs to the authentication flow"""
+
+    return "/authenticated/" in url
+
+
+def is_token_expired(resp, stream=False):
+    """Identify whether the response indicates an expired session token
+
+    The response body is never parsed: the RTC server either marks the
+    response with the authentication header, or responds with its HTML
+    login form instead of the requested document. Other HTML responses
+    (e.g. the reply of the attachment upload service) are not expired.
+
+    :param resp: the :class:`requests.Response` object
+    :param stream: (default is `False`) whether the body of the response
+        is streamed. If `True`, the body is left unread, and only the
+        authentication header is checked
+    :return: `True` or `False`
+    :rtype: bool
+    """
+
+    headers = getattr(resp, "headers", None) or {}
+    auth_msg = headers.get("X-com-ibm-team-repository-web-auth-msg")
+    if auth_msg == "authrequired":
+        return True
+    if stream:
+        # reading the body would download the whole response
+        return False
+
+    content_type = headers.get("Content-Type")
+    if content_type and "html" not in content_type.lower():
+        return False
+
+    content = resp.content
+    if isinstance(content, six.text_type):
+        content = content[:_LOGIN_FORM_PREFIX_LEN].encode("utf-8", "ignore")
+    if not isinstance(content, six.binary_type):
+        return False
+    content = content[:_LOGIN_FORM_PREFIX_LEN].lower()
+    return any(marker in content for marker in _LOGIN_FORM_MARKERS)
+
+
 def token_expire_handler(func):
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         rtc_obj = args[0].get_rtc_obj()
 
-        if not hasattr(rtc_obj, "cookies") or rtc_obj.cookies is None:
+        if (not hasattr(rtc_obj, "cookies") or rtc_obj.cookies is None or
+                _is_login_request(args[1])):
             # still in the initialization or relogin
             # directly call the method
             return func(*args, **kwargs)
-        else:
-            # check whether token expires
-            try:
-                resp = func(*args, **kwargs)
-                xmltodict.parse(resp.content)
+
+        # check whether token expires
+        expired_cookies = kwargs.get("cookies")
+        stream = kwargs.get("stream", False)
+        try:
+            resp = func(*args, **kwargs)
+            if not is_token_expired(resp, stream=stream):
                 return resp
-            except ExpatError as excp:
-                if "invalid token" in str(excp):
-                    # expires
-                    try:
-                        rtc_obj.relogin()
-                    except RTCException:
-                        raise RTCException("Relogin Failed: "
-                                           "Invalid username or password")
-                    kwargs["cookies"] = rtc_obj.cookies
-                    return func(*args, **kwargs)
-                else:
-                    # not expires
-                    # raise the actual exception
-                    raise ExpatError(excp)
+            if stream:
+                # release the connection of the unread response
+                resp.close()
+        except HTTPError as excp:
+            if excp.response is None or excp.response.status_code != 401:
+                # not expires
+                # raise the actual exception
+                raise
+
+        # expires
+        try:
+            rtc_obj._renew_cookies(expired_cookies)
+        except RTCException:
+            raise RTCException("Relogin Failed: "
+                               "Invalid username or password")
+        kwargs["cookies"] = rtc_obj.cookies
+        return func(*args, **kwargs)
 
     return wrapper
 
@@ -68,6 +123,48 @@ def capitalize(keyword):
         raise BadValue("Input value %s is not string type" % keyword)
 
 
+# the format of the timestamps (e.g. dc:modified) of RTC
+_RTC_TIME_FORMATS = ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_rtc_time(value):
+    """Parse the RTC timestamp (e.g. "2010-02-16T16:04:00.244Z")
+
+    :param value: the timestamp string, or a :class:`datetime.datetime`
+        object, which is converted to UTC if it is timezone-aware
+    :return: the naive :class:`datetime.datetime` object in UTC
+    :rtype: datetime.datetime
+    """
+
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(
+                tzinfo=None)
+        return value
+
+    if isinstance(value, six.string_types):
+        for time_format in _RTC_TIME_FORMATS:
+            try:
+                return datetime.datetime.strptime(value.strip(), time_format)
+            except ValueError:
+                continue
+    raise BadValue("Invalid RTC timestamp: %s" % value)
+
+
+def format_rtc_time(value):
+    """Format the time as the RTC timestamp in milliseconds
+
+    :param value: the :class:`datetime.datetime` object or the timestamp
+        string
+    :return: the timestamp string (e.g. "2010-02-16T16:04:00.244Z")
+    :rtype: str
+    """
+
+    value = parse_rtc_time(value)
+    return "%s.%03dZ" % (value.strftime("%Y-%m-%dT%H:%M:%S"),
+                         value.microsecond // 1000)
+
+
 def remove_empty_elements(docs):
     root = etree.fromstring(bytes(docs, 'utf-8'))
     for element in root.xpath("//*[not(node())]"):
@@ -21,21 +21,48 @@ class Workitem(FieldBase):
     :param workitem_id: (default is `None`) the id of the workitem, which
         will be retrieved if not specified
     :param raw_data: the raw data ( OrderedDict ) of the request response
+    :param lazy: (default is `False`) If `True`, the linked fields (e.g.
+        ownedBy, severity) are not resolved during the initialization
     """
 
     log = logging.getLogger("workitem.Workitem")
 
     OSLC_CR_RDF = "application/rdf+xml"
 
-    def __init__(self, url, rtc_obj, workitem_id=None, raw_data=None):
+    COMMENT_TEMPLATE = '''
+<rdf:RDF
+    xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+    xmlns:rtc_ext="http://jazz.net/xmlns/prod/jazz/rtc/ext/1.0/"
+    xmlns:rtc_cm="http://jazz.net/xmlns/prod/jazz/rtc/cm/1.0/"
+    xmlns:oslc_cm="http://open-services.net/ns/cm#"
+    xmlns:dcterms="http://purl.org/dc/terms/"
+    xmlns:oslc_cmx="http://open-services.net/ns/cm-x#"
+    xmlns:oslc="http://open-services.net/ns/core#">
+  <rdf:Description rdf:about="{0}">
+    <rdf:type rdf:resource="http://open-services.net/ns/core#Comment"/>
+    <dcterms:description rdf:parseType="Literal">{1}</dcterms:description>
+  </rdf:Description>
+</rdf:RDF>
+'''
+
+    def __init__(self,
+                 url,
+                 rtc_obj,
+                 workitem_id=None,
+                 raw_data=None,
+                 lazy=False):
         self.identifier = workitem_id
-        FieldBase.__init__(self, url, rtc_obj, raw_data)
+        FieldBase.__init__(self, url, rtc_obj, raw_data, lazy=lazy)
         if self.identifier is None:
             self.identifier = self.url.split("/")[-1]
 
     def __str__(self):
         return str(self.identifier)
 
+    def _refresh_copies(self):
+        # the templates copied from this workitem are derived again
+        self.rtc_obj.templater.refresh(self.identifier)
+
     def getComments(self):
         """Get all :class:`rtcclient.models.Comment` objects in this workitem
 
@@ -84,22 +111,6 @@ class Workitem(FieldBase):
         :rtype: rtcclient.models.Comment
         """
 
-        origin_comment = '''
-<rdf:RDF
-    xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
-    xmlns:rtc_ext="http://jazz.net/xmlns/prod/jazz/rtc/ext/1.0/"
-    xmlns:rtc_cm="http://jazz.net/xmlns/prod/jazz/rtc/cm/1.0/"
-    xmlns:oslc_cm="http://open-services.net/ns/cm#"
-    xmlns:dcterms="http://purl.org/dc/terms/"
-    xmlns:oslc_cmx="http://open-services.net/ns/cm-x#"
-    xmlns:oslc="http://open-services.net/ns/core#">
-  <rdf:Description rdf:about="{0}">
-    <rdf:type rdf:resource="http://open-services.net/ns/core#Comment"/>
-    <dcterms:description rdf:parseType="Literal">{1}</dcterms:description>
-  </rdf:Description>
-</rdf:RDF>
-'''
-
         comments_url = "/".join([self.url, "rtc_cm:comments"])
         headers = copy.deepcopy(self.rtc_obj.headers)
         resp = self.get(comments_url,
@@ -108,12 +119,12 @@ class Workitem(FieldBase):
                         headers=headers,
                         cookies=self.rtc_obj.cookies)
 
-        raw_data = xmltodict.parse(resp.content)
+        raw_data = self.rtc_obj.parser.parse(resp.content)
 
         total_cnt = raw_data["oslc_cm:Collection"]["@oslc_cm:totalCount"]
         comment_url = "/".join([comments_url, total_cnt])
 
-        comment_msg = origin_comment.format(comment_url, msg)
+        comment_msg = self.COMMENT_TEMPLATE.format(comment_url, msg)
 
         headers["Content-Type"] = self.OSLC_CR_RDF
         headers["Accept"] = self.OSLC_CR_RDF
@@ -127,10 +138,11 @@ class Workitem(FieldBase):
                          cookies=self.rtc_obj.cookies,
                          proxies=self.rtc_obj.proxies,
                          data=comment_msg)
+        self._refresh_copies()
         self.log.info("Successfully add comment: [%s] for <Workitem %s>", msg,
                       self)
 
-        raw_data = xmltodict.parse(resp.content)
+        raw_data = self.rtc_obj.parser.parse(resp.content)
         return Comment(comment_url,
                        self.rtc_obj,
                        raw_data=raw_data["rdf:RDF"]["rdf:Description"])
@@ -240,6 +252,7 @@ class Workitem(FieldBase):
                  headers=headers,
                  cookies=self.rtc_obj.cookies,
                  data=xmltodict.unparse(raw_data))
+        self._refresh_copies()
 
     def _perform_subscribe(self):
         subscribers_url = "".join(
@@ -254,7 +267,7 @@ class Workitem(FieldBase):
                         headers=headers,
                         cookies=self.rtc_obj.cookies)
         headers["If-Match"] = resp.headers.get("etag")
-        raw_data = xmltodict.parse(resp.content)
+        raw_data = self.rtc_obj.parser.parse(resp.content)
         return headers, raw_data
 
     def _add_subscriber(self, email, raw_data):
@@ -408,11 +421,13 @@ class Workitem(FieldBase):
 
         cust_attr = (self.raw_data.get("rtc_cm:state").get(
             "@rdf:resource").split("/")[-2])
+        limit = 1 if action_name else None
         return self.rtc_obj._get_paged_resources("Action",
                                                  projectarea_id=self.contextId,
                                                  customized_attr=cust_attr,
                                                  page_size="100",
-                                                 filter_rule=filter_rule)
+                                                 filter_rule=filter_rule,
+                                                 limit=limit)
 
     def getStates(self):
         """Get all :class:`rtcclient.models.State` objects of this workitem
@@ -466,7 +481,8 @@ class Workitem(FieldBase):
                                                     workitem_id=self.identifier,
                                                     customized_attr=parent_tag,
                                                     page_size="5",
-                                                    returned_properties=rp))
+                                                    returned_properties=rp,
+                                                    limit=1))
 
         # No more than one parent
         if parent:
@@ -550,6 +566,8 @@ class Workitem(FieldBase):
                  headers=headers,
                  cookies=self.rtc_obj.cookies,
                  data=json.dumps(parent_original))
+        self._refresh_copies()
+
         self.log.info(
             "Successfully add a parent <Workitem %s> to current "
             "<Workitem %s>", parent_id, self)
@@ -625,6 +643,7 @@ class Workitem(FieldBase):
                  cookies=self.rtc_obj.cookies,
                  proxies=self.rtc_obj.proxies,
                  data=json.dumps(children_original))
+        self._refresh_copies()
 
     def _addChild(self, child_id, children_original):
         child_tag = ("rtc_cm:com.ibm.team.workitem.linktype."
@@ -678,6 +697,8 @@ class Workitem(FieldBase):
                  headers=headers,
                  cookies=self.rtc_obj.cookies,
                  data=json.dumps(parent_original))
+        self._refresh_copies()
+
         self.log.info(
             "Successfully remove the parent workitem of current "
             "<Workitem %s>", self)
@@ -748,6 +769,7 @@ class Workitem(FieldBase):
                  cookies=self.rtc_obj.cookies,
                  proxies=self.rtc_obj.proxies,
                  data=json.dumps(children_original))
+        self._refresh_copies()
 
     def addAttachment(self, filepath):
         """Upload attachment to a workitem
@@ -783,7 +805,7 @@ class Workitem(FieldBase):
                          proxies=self.rtc_obj.proxies,
                          params=params,
                          files=files)
-        raw_data = xmltodict.parse(resp.content)
+        raw_data = self.rtc_obj.parser.parse(resp.content)
         json_body = json.loads(raw_data["html"]["body"]["textarea"])
         attachment_info = json_body["files"][0]
         return self._add_attachment_link(attachment_info)
@@ -805,7 +827,8 @@ class Workitem(FieldBase):
                          headers=self.rtc_obj.headers,
                          cookies=self.rtc_obj.cookies,
                          proxies=self.rtc_obj.proxies)
-        raw_data = xmltodict.parse(resp.content)
+        self._refresh_copies()
+        raw_data = self.rtc_obj.parser.parse(resp.content)
 
         return Attachment(attachment_info["url"],
                           self.rtc_obj,
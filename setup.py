@@ -43,6 +43,11 @@ setup(
     keywords=["rtcclient", "Rational Team Concert", "RTC"],
     install_requires=REQUIRES,
     tests_require=TESTS_REQUIRES,
+    extras_require={
+        "async": ["aiohttp>=3.6"],
+        "pandas": ["pandas"],
+        "arrow": ["pyarrow"]
+    },
     packages=find_packages(exclude=['tests.*', 'tests']),
     include_package_data=True,
     long_description=readme(),
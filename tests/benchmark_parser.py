@@ -0,0 +1,82 @@
+"""Compare the speed of the XML parser backends on the fixtures
+
+It is not collected by pytest. Run it from the root of the repository::
+
+    python tests/benchmark_parser.py [--number 200] [--entries 100]
+
+Besides every fixture, the workitems of `workitems.xml` are repeated to
+build an `oslc_cm:Collection` page of `--entries` workitems, which is the
+typical page of the queries.
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rtcclient.parser import PARSERS  # noqa: E402
+
+_FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "fixtures")
+_ENTRY_PATTERN = re.compile(
+    br"<oslc_cm:ChangeRequest .*?</oslc_cm:ChangeRequest>", re.DOTALL)
+
+
+def read_fixture(file_name):
+    with open(os.path.join(_FIXTURES_PATH, file_name), mode="rb") as fh:
+        return fh.read()
+
+
+def build_page(entries):
+    content = read_fixture("workitems.xml")
+    workitems = _ENTRY_PATTERN.findall(content)
+    start = content.index(workitems[0])
+    end = content.rindex(workitems[-1]) + len(workitems[-1])
+    repeated = [workitems[idx % len(workitems)] for idx in range(entries)]
+    return b"".join([content[:start], b"\n".join(repeated), content[end:]])
+
+
+def get_documents(entries):
+    documents = [(file_name, read_fixture(file_name))
+                 for file_name in sorted(os.listdir(_FIXTURES_PATH))
+                 if file_name.endswith(".xml")]
+    documents.append(("workitems x %d" % entries, build_page(entries)))
+    return documents
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    arg_parser.add_argument("--number",
+                            type=int,
+                            default=200,
+                            help="the times to parse each document")
+    arg_parser.add_argument("--entries",
+                            type=int,
+                            default=100,
+                            help="the workitems in the generated page")
+    args = arg_parser.parse_args()
+
+    parsers = [(name, PARSERS[name]()) for name in sorted(PARSERS)]
+    print("%-28s %10s" % ("document", "size") +
+          "".join(" %12s" % name for name, _ in parsers) + " %8s" % "speedup")
+    totals = dict((name, 0.0) for name, _ in parsers)
+    for doc_name, content in get_documents(args.entries):
+        costs = dict()
+        for name, parser in parsers:
+            seconds = timeit.timeit(lambda: parser.parse(content),
+                                    number=args.number)
+            costs[name] = seconds / args.number * 1000
+            totals[name] += costs[name]
+        print("%-28s %10d" % (doc_name, len(content)) +
+              "".join(" %10.3fms" % costs[name] for name, _ in parsers) +
+              " %7.2fx" % (costs["xmltodict"] / costs["lxml"]))
+    print("%-28s %10s" % ("total", "") +
+          "".join(" %10.3fms" % totals[name] for name, _ in parsers) +
+          " %7.2fx" % (totals["xmltodict"] / totals["lxml"]))
+
+
+if __name__ == "__main__":
+    main()
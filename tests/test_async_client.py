@@ -0,0 +1,310 @@
+import asyncio
+
+import pytest
+import requests
+
+import utils_test
+from rtcclient.exception import BadValue, EmptyAttrib, NotFound, RTCException
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from rtcclient.async_client import AsyncRTCClient, _Response  # noqa: E402
+
+_XML_HEADERS = {"Content-Type": "text/xml"}
+
+
+def _title_xml(title):
+    return ("<rtc_cm:Literal xmlns:rtc_cm='rtc_cm' xmlns:dc='dc'>"
+            "<dc:title>%s</dc:title></rtc_cm:Literal>" % title).encode()
+
+
+@pytest.fixture(scope="function")
+def async_client(mocker):
+    client = AsyncRTCClient(url="http://test.url:9443/jazz",
+                            username="tester1@email.com",
+                            password="password",
+                            searchpath=utils_test._search_path,
+                            max_concurrency=2)
+    client.cookies = {"JSESSIONID": "cookie-id"}
+    return client
+
+
+def _run(async_client, coro):
+
+    async def run_and_close():
+        try:
+            return await coro
+        finally:
+            await async_client.close()
+
+    return asyncio.run(run_and_close())
+
+
+def _mock_fetch(mocker, async_client, handler):
+    requested = list()
+
+    async def fake_fetch(method, url, **kwargs):
+        requested.append((method, url))
+        # give the other coroutines a chance to run
+        await asyncio.sleep(0)
+        return handler(method, url)
+
+    mocker.patch.object(async_client, "_fetch", side_effect=fake_fetch)
+    return requested
+
+
+def _workitem_handler(method, url):
+    if url.endswith("oslc/workitems/161"):
+        return _Response(url, 200, _XML_HEADERS,
+                         utils_test.workitem1_raw.encode())
+    return _Response(url, 200, _XML_HEADERS, _title_xml("title"))
+
+
+def test_get_workitem(mocker, async_client):
+    requested = _mock_fetch(mocker, async_client, _workitem_handler)
+
+    async def get_workitems():
+        return await asyncio.gather(async_client.getWorkitem(161),
+                                    async_client.getWorkitem("161"))
+
+    workitem1, workitem2 = _run(async_client, get_workitems())
+    assert workitem1.identifier == "161"
+    assert workitem1 == workitem2
+    assert workitem1.title == "input title here for 161"
+    assert workitem1.creator == "tester1@email.com"
+    assert workitem1.severity == "title"
+    assert not workitem1._pending_links
+
+    # each linked resource is only requested once
+    linked_urls = [
+        url for _, url in requested if not url.endswith("workitems/161")
+    ]
+    assert len(linked_urls) == len(set(linked_urls))
+    assert async_client.resource_cache.stats()["size"] == len(linked_urls)
+
+    for invalid_id in [None, True, "abc", 1.5]:
+        with pytest.raises(BadValue):
+            _run(async_client, async_client.getWorkitem(invalid_id))
+
+
+def test_sync_methods(mocker, async_client):
+    _mock_fetch(mocker, async_client, _workitem_handler)
+    workitem = _run(async_client, async_client.getWorkitem(161))
+    # the workitem is bound to the sync client sharing the session cookies
+    assert workitem.rtc_obj is async_client.sync_client
+    assert workitem.rtc_obj.cookies == {"JSESSIONID": "cookie-id"}
+    assert workitem.rtc_obj.resource_cache is async_client.resource_cache
+
+    mocked_get = mocker.patch("requests.Session.get")
+    mock_resp = mocker.MagicMock(spec=requests.Response)
+    mock_resp.status_code = 200
+    mock_resp.content = utils_test.read_fixture("comments.xml")
+    mocked_get.return_value = mock_resp
+    comments = workitem.getComments()
+    assert [comment.description for comment in comments] == [
+        "comment test", "add comment test2"
+    ]
+    assert mocked_get.call_args[1]["cookies"] == {"JSESSIONID": "cookie-id"}
+
+    with pytest.raises(RTCException):
+        async_client.get("http://test.url:9443/jazz/oslc/workitems/161")
+
+
+def test_get_workitem_not_found(mocker, async_client):
+    _mock_fetch(mocker, async_client,
+                lambda method, url: _Response(url, 404, {}, b"not found"))
+    with pytest.raises(NotFound):
+        _run(async_client, async_client.getWorkitem(161))
+
+
+def test_bounded_concurrency(mocker, async_client):
+    in_flight = [0]
+    max_in_flight = [0]
+
+    async def fake_fetch(method, url, **kwargs):
+        in_flight[0] += 1
+        max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return _workitem_handler(method, url)
+
+    mocker.patch.object(async_client, "_fetch", side_effect=fake_fetch)
+
+    async def get_workitems():
+        return await asyncio.gather(
+            *[async_client.getWorkitem(161) for _ in range(6)])
+
+    workitems = _run(async_client, get_workitems())
+    assert len(workitems) == 6
+    assert max_in_flight[0] == 2
+
+
+def test_concurrent_relogin(mocker, async_client):
+    login_html = (b"<!DOCTYPE html><html><form action=\"j_security_check\">"
+                  b"</form></html>")
+    expired_cookies = async_client.cookies
+
+    def handler(method, url):
+        if async_client.cookies is expired_cookies:
+            return _Response(url, 200, {"Content-Type": "text/html"},
+                             login_html)
+        return _workitem_handler(method, url)
+
+    _mock_fetch(mocker, async_client, handler)
+
+    async def fake_get_cookies():
+        await asyncio.sleep(0.01)
+        return {"JSESSIONID": "new-cookie-id"}
+
+    mocked_get_cookies = mocker.patch.object(async_client,
+                                             "_get_cookies",
+                                             side_effect=fake_get_cookies)
+
+    async def get_workitems():
+        return await asyncio.gather(
+            *[async_client.getWorkitem(161) for _ in range(5)])
+
+    workitems = _run(async_client, get_workitems())
+    assert [wi.title for wi in workitems] == ["input title here for 161"] * 5
+    # the coroutines share a single re-authentication
+    assert mocked_get_cookies.call_count == 1
+    assert async_client.cookies == {"JSESSIONID": "new-cookie-id"}
+
+    # relogin failure
+    mocked_get_cookies.side_effect = RTCException("Authentication Failed")
+    async_client.cookies = expired_cookies
+    with pytest.raises(NotFound):
+        _run(async_client, async_client.getWorkitem(161))
+
+
+def test_query_workitems(mocker, async_client):
+    workitems_xml = utils_test.read_fixture("workitems.xml").encode()
+    projectareas_xml = utils_test.read_fixture("projectareas.xml").encode()
+
+    def handler(method, url):
+        if "oslc_cm.query=" in url:
+            return _Response(url, 200, _XML_HEADERS, workitems_xml)
+        if "/oslc/projectareas" in url:
+            return _Response(url, 200, _XML_HEADERS, projectareas_xml)
+        return _Response(url, 200, _XML_HEADERS, _title_xml("title"))
+
+    requested = _mock_fetch(mocker, async_client, handler)
+
+    workitems = _run(
+        async_client,
+        async_client.queryWorkitems("dc:title=\"test\"",
+                                    projectarea_id="_CuZu0HUwEeKicpXBddtqNA"))
+    assert [wi.identifier for wi in workitems] == ["161"]
+    assert workitems[0].severity == "title"
+    assert workitems[0].rtc_obj is async_client.sync_client
+
+    workitems = _run(
+        async_client,
+        async_client.queryWorkitems("dc:title=\"test\"",
+                                    projectarea_name="ProjectArea2"))
+    assert [wi.identifier for wi in workitems] == ["161"]
+
+    with pytest.raises(NotFound):
+        _run(
+            async_client,
+            async_client.queryWorkitems("dc:title=\"test\"",
+                                        projectarea_name="fake_name"))
+
+    async def query_concurrently():
+        return await asyncio.gather(*[
+            async_client.queryWorkitems("dc:title=\"test\"",
+                                        projectarea_name="ProjectArea2")
+            for _ in range(3)
+        ])
+
+    async_client.refreshProjectAreas()
+    assert len(_run(async_client, query_concurrently())) == 3
+    # the project areas are scanned once, and once again after refreshed
+    pa_urls = [url for _, url in requested if "/oslc/projectareas?" in url]
+    assert len(pa_urls) == 2
+
+
+def test_add_comment(mocker, async_client):
+    comments_xml = utils_test.read_fixture("comments.xml").encode()
+    comment_rdf = ("""<rdf:RDF
+        xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+        xmlns:dcterms="http://purl.org/dc/terms/">
+      <rdf:Description rdf:about="comment_url">
+        <dcterms:description>new comment</dcterms:description>
+      </rdf:Description>
+    </rdf:RDF>""").encode()
+
+    def handler(method, url):
+        if method == "GET":
+            return _Response(url, 200, {"etag": "etag-value"}, comments_xml)
+        return _Response(url, 201, {}, comment_rdf)
+
+    requested = _mock_fetch(mocker, async_client, handler)
+    comment = _run(async_client, async_client.addComment(161,
+                                                         msg="new comment"))
+    assert comment.description == "new comment"
+    assert requested[-1] == ("POST", "/".join([
+        "http://test.url:9443/jazz/oslc/workitems/161", "rtc_cm:comments",
+        "oslc:comment"
+    ]))
+    assert async_client._fetch.call_args[1]["headers"]["If-Match"] == \
+        "etag-value"
+
+
+def test_create_workitem(mocker, async_client):
+    fixtures = {
+        "/oslc/types/": "itemtypes.xml",
+        "/severity": "severities.xml",
+        "/priority": "priorities.xml",
+        "/oslc/teamareas": "teamareas.xml",
+        "/oslc/categories": "filedagainsts.xml",
+        "/oslc/iterations": "plannedfors.xml"
+    }
+
+    def handler(method, url):
+        if method == "POST":
+            return _Response(url, 201, _XML_HEADERS,
+                             utils_test.workitem1_raw.encode())
+        for url_part, fixture in fixtures.items():
+            if url_part in url:
+                return _Response(url, 200, _XML_HEADERS,
+                                 utils_test.read_fixture(fixture).encode())
+        return _Response(url, 200, _XML_HEADERS, _title_xml("title"))
+
+    requested = _mock_fetch(mocker, async_client, handler)
+    pa_id = "_CuZu0HUwEeKicpXBddtqNA"
+
+    # missing parameters
+    with pytest.raises(EmptyAttrib):
+        _run(
+            async_client,
+            async_client.createWorkitem("Defect",
+                                        "new title",
+                                        projectarea_id=pa_id,
+                                        template="issue_example.template"))
+
+    workitem = _run(
+        async_client,
+        async_client.createWorkitem("Defect",
+                                    "new title",
+                                    description="new description",
+                                    projectarea_id=pa_id,
+                                    template="issue_example.template",
+                                    severity="Normal",
+                                    priority="High",
+                                    teamArea="Team1",
+                                    ownedBy="tester1@email.com",
+                                    plannedFor="Release 1.0",
+                                    filedAgainst="Category 1"))
+    assert workitem.identifier == "161"
+    wi_url_post = "/".join(
+        ["http://test.url:9443/jazz/oslc/contexts", pa_id, "workitems/defect"])
+    assert ("POST", wi_url_post) in requested
+    wi_raw = [
+        call[1]["data"]
+        for call in async_client._fetch.call_args_list
+        if call[0][0] == "POST"
+    ][0]
+    assert "new title" in wi_raw
+    assert "/severity/severity.literal.l2" in wi_raw
+    assert "/jts/users/tester1%40email.com" in wi_raw
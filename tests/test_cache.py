@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+
+from rtcclient.cache import TTLCache
+
+
+class TestTTLCache:
+
+    def test_get_set(self):
+        cache = TTLCache(maxsize=10, ttl=None)
+        assert cache.get("key1") is None
+        assert cache.get("key1", "default") == "default"
+        cache.set("key1", "value1")
+        cache.set("key2", None)
+        assert cache.get("key1") == "value1"
+        assert "key2" in cache
+        assert len(cache) == 2
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 2,
+            "size": 2,
+            "maxsize": 10,
+            "ttl": None
+        }
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=None)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        # key1 becomes the most recently used one
+        assert cache.get("key1") == "value1"
+        cache.set("key3", "value3")
+        assert "key1" in cache
+        assert "key2" not in cache
+        assert "key3" in cache
+
+    def test_ttl(self, mocker):
+        mocked_time = mocker.patch("time.monotonic")
+        mocked_time.return_value = 100
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("key1", "value1")
+        mocked_time.return_value = 159
+        assert cache.get("key1") == "value1"
+        mocked_time.return_value = 160
+        assert cache.get("key1") is None
+        assert len(cache) == 0
+
+    def test_invalidate(self):
+        cache = TTLCache(maxsize=10)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.invalidate("key1")
+        assert "key1" not in cache
+        assert "key2" in cache
+        cache.invalidate()
+        assert len(cache) == 0
+
+    def test_disabled(self):
+        cache = TTLCache(maxsize=0)
+        cache.set("key1", "value1")
+        assert cache.get("key1") is None
+        assert len(cache) == 0
+
+    def test_load(self):
+        cache = TTLCache(maxsize=10, ttl=None)
+        started = threading.Event()
+        release = threading.Event()
+        loaded = list()
+
+        def slow_loader():
+            started.set()
+            assert release.wait(5)
+            loaded.append("slow")
+            return "value1"
+
+        thread = threading.Thread(target=cache.load,
+                                  args=("key1", slow_loader))
+        thread.start()
+        assert started.wait(5)
+        # the other thread is loading the same key
+        assert cache.load("key1", lambda: "value2", wait=False) == "value2"
+        waiter_results = list()
+        waiter = threading.Thread(target=lambda: waiter_results.append(
+            cache.load("key1", lambda: loaded.append("waiter"))))
+        waiter.start()
+        release.set()
+        thread.join()
+        waiter.join()
+        assert waiter_results == ["value1"]
+        assert loaded == ["slow"]
+        assert cache.load("key1", lambda: "value3") == "value1"
+
+        def failed_loader():
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError):
+            cache.load("key2", failed_loader)
+        assert cache.load("key2", lambda: "value2") == "value2"
@@ -1,17 +1,23 @@
-from rtcclient import RTCClient
+import datetime
+import re
+import threading
+
+from rtcclient import RTCClient, urlparse, urlquote
 import requests
 import pytest
 import utils_test
 from rtcclient.project_area import ProjectArea
 from rtcclient.models import Severity, Priority, FoundIn, FiledAgainst
-from rtcclient.models import TeamArea, Member, PlannedFor
+from rtcclient.models import TeamArea, Member, PlannedFor, EnumerationRegistry
+from rtcclient.record import WorkitemRecord
 from rtcclient.workitem import Workitem
 from rtcclient.exception import BadValue, NotFound, RTCException, EmptyAttrib
+from rtcclient.utils import format_rtc_time, parse_rtc_time
 
 
 def test_headers(mocker):
-    mocked_get = mocker.patch("requests.get")
-    mocked_post = mocker.patch("requests.post")
+    mocked_get = mocker.patch("requests.Session.get")
+    mocked_post = mocker.patch("requests.Session.post")
 
     mock_rsp = mocker.MagicMock(spec=requests.Response)
     mock_rsp.status_code = 200
@@ -38,6 +44,635 @@ def test_headers(mocker):
     assert client.cookies == expected_cookies
 
 
+def test_session(rtcclient):
+    adapter = rtcclient.session.get_adapter("https://test.url:9443/jazz")
+    assert adapter is rtcclient.session.get_adapter("http://test.url:9443")
+    assert adapter._pool_connections == 10
+    assert adapter._pool_maxsize == 10
+    assert rtcclient.session.headers["Connection"] == "keep-alive"
+
+    # all the objects share the same session of the client
+    assert rtcclient._get_session() is rtcclient.session
+    assert rtcclient.query._get_session() is rtcclient.session
+    assert rtcclient.templater._get_session() is rtcclient.session
+    assert rtcclient.getPoolStats() == {}
+
+
+def test_session_options(mocker):
+    mocker.patch("rtcclient.client.RTCClient._get_cookies")
+    mocked_close = mocker.patch("requests.Session.close")
+    with RTCClient(url="http://test.url:9443/jazz",
+                   username="user",
+                   password="password",
+                   pool_connections=2,
+                   pool_maxsize=32,
+                   max_retries=3,
+                   keep_alive=False,
+                   max_workers=3,
+                   template_ttl=None) as client:
+        assert client.executor.max_workers == 3
+        assert client.templater.derived_cache.ttl is None
+        adapter = client.session.get_adapter("https://test.url:9443")
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+        assert client.session.headers["Connection"] == "close"
+    mocked_close.assert_called_once_with()
+
+
+def test_token_expire_relogin(rtcclient, mocker):
+    mocked_get = mocker.patch("requests.Session.get")
+    mocked_relogin = mocker.patch("rtcclient.client.RTCClient.relogin")
+
+    expired_rsp = mocker.MagicMock(spec=requests.Response)
+    expired_rsp.status_code = 200
+    expired_rsp.headers = {"Content-Type": "text/html; charset=UTF-8"}
+    expired_rsp.content = (b"\n<!DOCTYPE html>\n<html><body><form "
+                           b"action=\"j_security_check\"></form></body>")
+
+    valid_rsp = mocker.MagicMock(spec=requests.Response)
+    valid_rsp.status_code = 200
+    valid_rsp.headers = {"Content-Type": "text/xml"}
+    valid_rsp.content = utils_test.read_fixture("projectareas.xml")
+
+    mocked_get.side_effect = [expired_rsp, valid_rsp]
+    resp = rtcclient.get(rtcclient.url, cookies=rtcclient.cookies)
+    assert resp is valid_rsp
+    mocked_relogin.assert_called_once_with()
+
+    # the cookie has been renewed by another request
+    mocked_get.side_effect = [expired_rsp, valid_rsp]
+    resp = rtcclient.get(rtcclient.url, cookies={"set-cookie": "old"})
+    assert resp is valid_rsp
+    assert mocked_relogin.call_count == 1
+
+    # the valid XML response is never treated as expired
+    mocked_get.side_effect = None
+    mocked_get.return_value = valid_rsp
+    resp = rtcclient.get(rtcclient.url, cookies=rtcclient.cookies)
+    assert resp is valid_rsp
+    assert mocked_relogin.call_count == 1
+
+    # neither is the HTML response without the login form
+    html_rsp = mocker.MagicMock(spec=requests.Response)
+    html_rsp.status_code = 200
+    html_rsp.headers = {"Content-Type": "text/html; charset=UTF-8"}
+    html_rsp.content = b"<html><body><textarea>{}</textarea></body></html>"
+    mocked_get.return_value = html_rsp
+    resp = rtcclient.get(rtcclient.url, cookies=rtcclient.cookies)
+    assert resp is html_rsp
+    assert mocked_relogin.call_count == 1
+
+
+def test_token_expire_header(rtcclient, mocker):
+    mocked_get = mocker.patch("requests.Session.get")
+    mocked_relogin = mocker.patch("rtcclient.client.RTCClient.relogin")
+
+    expired_rsp = mocker.MagicMock(spec=requests.Response)
+    expired_rsp.status_code = 200
+    expired_rsp.headers = {
+        "X-com-ibm-team-repository-web-auth-msg": "authrequired"
+    }
+    valid_rsp = mocker.MagicMock(spec=requests.Response)
+    valid_rsp.status_code = 200
+    valid_rsp.headers = {}
+
+    mocked_get.side_effect = [expired_rsp, valid_rsp]
+    assert rtcclient.get(rtcclient.url,
+                         cookies=rtcclient.cookies) is valid_rsp
+    mocked_relogin.assert_called_once_with()
+
+
+def test_token_expire_streamed(rtcclient, mocker):
+    mocked_get = mocker.patch("requests.Session.get")
+    mocked_relogin = mocker.patch("rtcclient.client.RTCClient.relogin")
+
+    expired_rsp = mocker.MagicMock(spec=requests.Response)
+    expired_rsp.status_code = 200
+    expired_rsp.headers = {
+        "Content-Type": "text/html; charset=UTF-8",
+        "X-com-ibm-team-repository-web-auth-msg": "authrequired"
+    }
+    valid_rsp = mocker.MagicMock(spec=requests.Response)
+    valid_rsp.status_code = 200
+    valid_rsp.headers = {"Content-Type": "text/html; charset=UTF-8"}
+    # the streamed body is never read
+    for rsp in (expired_rsp, valid_rsp):
+        type(rsp).content = mocker.PropertyMock(
+            side_effect=AssertionError("the body is read"))
+
+    mocked_get.side_effect = [expired_rsp, valid_rsp]
+    assert rtcclient.get(rtcclient.url,
+                         cookies=rtcclient.cookies,
+                         stream=True) is valid_rsp
+    mocked_relogin.assert_called_once_with()
+    expired_rsp.close.assert_called_once_with()
+
+    mocked_get.side_effect = None
+    mocked_get.return_value = valid_rsp
+    assert rtcclient.get(rtcclient.url,
+                         cookies=rtcclient.cookies,
+                         stream=True) is valid_rsp
+    assert mocked_relogin.call_count == 1
+
+
+def _severity_page(start_index, page_size, total_count, next_url=None):
+    entries = "".join([
+        "<rtc_cm:Literal rdf:resource=\"http://test.url:9443/jazz/oslc/"
+        "enumerations/pa/severity/s%d\"><dc:title>S%d</dc:title>"
+        "</rtc_cm:Literal>" % (idx, idx)
+        for idx in range(start_index,
+                         min(start_index + page_size, total_count))
+    ])
+    next_attr = (' oslc_cm:next="%s"' % next_url.replace("&", "&amp;")
+                 if next_url else "")
+    return ('<oslc_cm:Collection xmlns:oslc_cm="oslc_cm" xmlns:dc="dc" '
+            'xmlns:rdf="rdf" xmlns:rtc_cm="rtc_cm" '
+            'oslc_cm:totalCount="%d"%s>%s</oslc_cm:Collection>' %
+            (total_count, next_attr, entries))
+
+
+def _chunked(content, chunk_size=64):
+    content = content.encode("utf-8")
+    return [
+        content[idx:idx + chunk_size]
+        for idx in range(0, len(content), chunk_size)
+    ]
+
+
+def _mock_severity_pages(mocker, page_size, total_count):
+    page_url = ("http://test.url:9443/jazz/oslc/enumerations/pa/severity?"
+                "oslc_cm.pageSize=%d&_resultToken=tk&_startIndex=%d")
+
+    def get_page(url, **kwargs):
+        if "_resultToken" in url:
+            start_index = int(url.split("_startIndex=")[-1])
+        else:
+            start_index = 0
+        next_index = start_index + page_size
+        next_url = (page_url % (page_size, next_index)
+                    if next_index < total_count else None)
+        page_rsp = mocker.MagicMock(spec=requests.Response)
+        page_rsp.status_code = 200
+        page_rsp.content = _severity_page(start_index, page_size,
+                                          total_count, next_url)
+        page_rsp.iter_content.return_value = iter(_chunked(page_rsp.content))
+        return page_rsp
+
+    mocked_get = mocker.patch("requests.Session.get")
+    mocked_get.side_effect = get_page
+    return mocked_get
+
+
+def test_get_paged_resources_pipelined(rtcclient, mocker):
+    mocked_get = _mock_severity_pages(mocker, page_size=2, total_count=7)
+    severities = rtcclient._get_paged_resources("Severity",
+                                                projectarea_id="pa",
+                                                page_size="2")
+    assert [str(severity) for severity in severities] == [
+        "S0", "S1", "S2", "S3", "S4", "S5", "S6"
+    ]
+    assert mocked_get.call_count == 4
+
+
+def test_get_paged_resources_concurrent(rtcclient, mocker):
+    rtcclient.page_concurrency = 3
+    mocked_get = _mock_severity_pages(mocker, page_size=2, total_count=9)
+    severities = rtcclient._get_paged_resources("Severity",
+                                                projectarea_id="pa",
+                                                page_size="2")
+    assert [str(severity) for severity in severities] == [
+        "S%d" % idx for idx in range(9)
+    ]
+    requested_urls = [call[0][0] for call in mocked_get.call_args_list]
+    assert len(requested_urls) == 5
+    assert len(set(requested_urls)) == 5
+    for start_index in [2, 4, 6, 8]:
+        assert any(
+            url.endswith("_resultToken=tk&_startIndex=%d" % start_index)
+            for url in requested_urls)
+
+
+def test_iter_paged_resources_close(rtcclient, mocker):
+    mocked_get = _mock_severity_pages(mocker, page_size=2, total_count=10)
+    severities = rtcclient._iter_paged_resources("Severity",
+                                                 projectarea_id="pa",
+                                                 page_size="2")
+    assert mocked_get.call_count == 0
+
+    # the first results only cost the first page and the prefetched one
+    assert str(next(severities)) == "S0"
+    assert str(next(severities)) == "S1"
+    assert mocked_get.call_count <= 2
+    severities.close()
+    rtcclient.executor.shutdown()
+    assert mocked_get.call_count <= 2
+
+
+def test_iter_paged_resources_in_worker(rtcclient, mocker):
+    mocked_get = _mock_severity_pages(mocker, page_size=2, total_count=5)
+
+    def iter_severities():
+        severities = rtcclient._iter_paged_resources("Severity",
+                                                     projectarea_id="pa",
+                                                     page_size="2")
+        call_counts = list()
+        for _ in severities:
+            call_counts.append(mocked_get.call_count)
+        return call_counts
+
+    # the next page is not requested inline before the current one is
+    # yielded
+    for page_concurrency in (1, 3):
+        rtcclient.page_concurrency = page_concurrency
+        mocked_get.reset_mock()
+        call_counts = rtcclient.executor.submit(iter_severities).result()
+        assert call_counts == [1, 1, 2, 2, 3]
+
+
+def test_get_paged_resources_limit(rtcclient, mocker):
+    mocked_get = _mock_severity_pages(mocker, page_size=2, total_count=10)
+    mocked_handle = mocker.spy(rtcclient, "_handle_resource_entry")
+    severities = rtcclient._get_paged_resources("Severity",
+                                                projectarea_id="pa",
+                                                page_size="2",
+                                                limit=1)
+    assert [str(severity) for severity in severities] == ["S0"]
+    assert mocked_get.call_count == 1
+    assert mocked_handle.call_count == 1
+
+    severities = rtcclient._get_paged_resources(
+        "Severity",
+        projectarea_id="pa",
+        page_size="2",
+        filter_rule=[("dc:title", None, "S2")],
+        limit=1)
+    assert [str(severity) for severity in severities] == ["S2"]
+    assert mocked_handle.call_count == 1 + 3
+    # the third page is not prefetched, since the limit may be reached in
+    # the second page
+    assert mocked_get.call_count == 1 + 2
+
+
+def test_iter_paged_resources_stream(rtcclient, mocker):
+    mocked_get = _mock_severity_pages(mocker, page_size=2, total_count=7)
+    page_rsps = list()
+    get_page = mocked_get.side_effect
+    mocked_get.side_effect = lambda url, **kwargs: page_rsps.append(
+        get_page(url, **kwargs)) or page_rsps[-1]
+
+    severities = rtcclient._iter_paged_resources("Severity",
+                                                 projectarea_id="pa",
+                                                 page_size="2",
+                                                 stream=True)
+    assert mocked_get.call_count == 0
+    assert [str(severity) for severity in severities] == [
+        "S%d" % idx for idx in range(7)
+    ]
+    # the pages are requested one after another
+    assert mocked_get.call_count == 4
+    for call in mocked_get.call_args_list:
+        assert call[1]["stream"] is True
+    for page_rsp in page_rsps:
+        page_rsp.close.assert_called_once_with()
+
+    del page_rsps[:]
+    severities = rtcclient._iter_paged_resources(
+        "Severity",
+        projectarea_id="pa",
+        page_size="2",
+        filter_rule=[("dc:title", None, "S2")],
+        limit=1,
+        stream=True)
+    assert [str(severity) for severity in severities] == ["S2"]
+    assert len(page_rsps) == 2
+    page_rsps[-1].close.assert_called_once_with()
+
+
+def test_iter_paged_resources_stream_incremental(rtcclient, mocker):
+    chunks = _chunked(_severity_page(0, 5, 5), chunk_size=32)
+    fed_chunks = list()
+
+    def iter_content(chunk_size=1):
+        for chunk in chunks:
+            fed_chunks.append(chunk)
+            yield chunk
+
+    page_rsp = mocker.MagicMock(spec=requests.Response)
+    page_rsp.status_code = 200
+    page_rsp.iter_content.side_effect = iter_content
+    mocked_get = mocker.patch("requests.Session.get")
+    mocked_get.return_value = page_rsp
+
+    severities = rtcclient._iter_paged_resources("Severity",
+                                                 projectarea_id="pa",
+                                                 page_size="5",
+                                                 stream=True)
+    # the first entry is yielded before the whole page is received
+    assert str(next(severities)) == "S0"
+    assert len(fed_chunks) < len(chunks)
+    page_rsp.close.assert_not_called()
+
+    severities.close()
+    page_rsp.close.assert_called_once_with()
+    assert len(fed_chunks) < len(chunks)
+
+
+def _mock_teamareas(mocker, filterable=True):
+    def get_teamareas(url, **kwargs):
+        resp = mocker.MagicMock(spec=requests.Response)
+        if "oslc_cm.query=" in url and not filterable:
+            resp.status_code = 400
+            resp.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                response=resp)
+        else:
+            resp.status_code = 200
+            resp.content = utils_test.read_fixture("teamareas.xml")
+        return resp
+
+    mocked_get = mocker.patch("requests.Session.get")
+    mocked_get.side_effect = get_teamareas
+    return mocked_get
+
+
+def test_filter_rule_pushdown(rtcclient, mocker):
+    mocked_get = _mock_teamareas(mocker)
+    teamareas = rtcclient._get_paged_resources(
+        "TeamArea", filter_rule=[("dc:title", None, "Team\"1")])
+    # the server is trusted to match, and the results are checked again
+    assert teamareas is None
+    assert mocked_get.call_count == 1
+    assert mocked_get.call_args[0][0].endswith(
+        "&oslc_cm.query=" + urlquote('dc:title="Team\\"1"'))
+
+    pa_url = ("http://test.url:9443/jazz/oslc/projectareas/"
+              "_CuZu0HUwEeKicpXBddtqNA")
+    teamareas = rtcclient._get_paged_resources(
+        "TeamArea",
+        filter_rule=[("dc:title", None, "Team1"),
+                     ("rtc_cm:projectArea", "@rdf:resource", pa_url)],
+        lazy=True)
+    assert [str(teamarea) for teamarea in teamareas] == ["Team1"]
+    assert mocked_get.call_args[0][0].endswith(
+        "&oslc_cm.query=" +
+        urlquote('dc:title="Team1" and rtc_cm:projectArea=<%s>' % pa_url))
+
+    # not supported by the collection
+    _mock_severity_pages(mocker, page_size=2, total_count=3)
+    severities = rtcclient._get_paged_resources(
+        "Severity",
+        projectarea_id="pa",
+        page_size="2",
+        filter_rule=[("dc:title", None, "S1")])
+    assert [str(severity) for severity in severities] == ["S1"]
+    for call in requests.Session.get.call_args_list:
+        assert "oslc_cm.query" not in call[0][0]
+
+
+def test_filter_rule_pushdown_fallback(rtcclient, mocker):
+    mocked_get = _mock_teamareas(mocker, filterable=False)
+    teamareas = rtcclient._get_paged_resources(
+        "TeamArea", filter_rule=[("dc:title", None, "Team2")], lazy=True)
+    assert [str(teamarea) for teamarea in teamareas] == ["Team2"]
+    assert mocked_get.call_count == 2
+    assert "oslc_cm.query" not in mocked_get.call_args[0][0]
+
+    # the server is not asked to filter them any more
+    teamareas = rtcclient._get_paged_resources(
+        "TeamArea", filter_rule=[("dc:title", None, "Team1")], lazy=True)
+    assert [str(teamarea) for teamarea in teamareas] == ["Team1"]
+    assert mocked_get.call_count == 3
+
+
+def _mock_timed_workitems(mocker, modified_times):
+    entry = ("<oslc_cm:ChangeRequest rdf:resource=\"http://test.url:9443/"
+             "jazz/resource/itemName/com.ibm.team.workitem.WorkItem/%d\">"
+             "<dc:identifier>%d</dc:identifier>"
+             "<dc:created>%s</dc:created><dc:modified>%s</dc:modified>"
+             "</oslc_cm:ChangeRequest>")
+
+    def get_workitems(url, **kwargs):
+        query_str = urlparse.unquote(
+            url.split("oslc_cm.query=")[1].split("&")[0])
+        matched = list()
+        for idx, modified in enumerate(modified_times):
+            # the workitems are never modified after created
+            clauses = re.findall(r'dc:(?:created|modified)(>|<=)"([^"]+)"',
+                                 query_str)
+            if all((modified > value) if op == ">" else (modified <= value)
+                   for op, value in clauses):
+                matched.append(entry % (idx, idx, modified, modified))
+        page_size = int(url.split("oslc_cm.pageSize=")[1].split("&")[0])
+        resp = mocker.MagicMock(spec=requests.Response)
+        resp.status_code = 200
+        resp.content = ('<oslc_cm:Collection xmlns:oslc_cm="oslc_cm" '
+                        'xmlns:dc="dc" xmlns:rdf="rdf" '
+                        'oslc_cm:totalCount="%d">%s</oslc_cm:Collection>' %
+                        (len(matched), "".join(matched[:page_size])))
+        return resp
+
+    mocker.patch("rtcclient.client.RTCClient.checkProjectAreaID",
+                 return_value=True)
+    mocked_get = mocker.patch("requests.Session.get")
+    mocked_get.side_effect = get_workitems
+    return mocked_get
+
+
+def test_sync_workitems(rtcclient, mocker):
+    mocker.patch("rtcclient.client._MAX_QUERY_RESULTS", 3)
+    modified_times = [
+        "2010-02-16T16:04:00.%03dZ" % idx for idx in range(0, 14, 2)
+    ] + ["2015-01-01T00:00:00.000Z"]
+    mocked_get = _mock_timed_workitems(mocker, modified_times)
+
+    workitems, watermark = rtcclient.syncWorkitems(projectarea_id="pa",
+                                                   lazy=True)
+    assert sorted(int(str(workitem)) for workitem in workitems) == list(
+        range(len(modified_times)))
+    assert watermark == "2015-01-01T00:00:00.000Z"
+    # the period is split until each window has less than 3 workitems
+    requested_urls = [call[0][0] for call in mocked_get.call_args_list]
+    assert len(requested_urls) > 2
+    assert all("oslc_cm.query=" in url for url in requested_urls)
+
+    workitems, watermark = rtcclient.syncWorkitems(
+        watermark="2010-02-16T16:04:00.008Z",
+        projectarea_id="pa",
+        returned_properties="dc:title",
+        compact=True)
+    assert [str(workitem) for workitem in workitems] == ["5", "6", "7"]
+    assert watermark == "2015-01-01T00:00:00.000Z"
+    assert "dc%3Amodified" in mocked_get.call_args[0][0]
+
+    mocked_get.reset_mock()
+    workitems, watermark = rtcclient.syncWorkitems(
+        watermark=datetime.datetime(2015, 1, 1), projectarea_id="pa")
+    assert workitems == []
+    assert watermark == "2015-01-01T00:00:00.000Z"
+    # only the total count is requested
+    assert mocked_get.call_count == 1
+
+
+def test_get_workitems_partitioned(rtcclient, mocker):
+    mocker.patch("rtcclient.client._MAX_QUERY_RESULTS", 3)
+    created_times = [
+        "2012-0%d-01T00:00:00.000Z" % month for month in range(9, 0, -1)
+    ]
+    mocked_get = _mock_timed_workitems(mocker, created_times)
+
+    workitems = rtcclient.getWorkitems(projectarea_id="pa",
+                                       lazy=True,
+                                       partitioned=True)
+    # merged without duplicates
+    assert sorted(int(str(workitem)) for workitem in workitems) == list(
+        range(len(created_times)))
+    # the earlier windows come first
+    assert str(workitems[-1]) == "0"
+    for call in mocked_get.call_args_list:
+        assert "dc%3Acreated%3E" in call[0][0]
+
+    mocked_get.reset_mock()
+    workitems = rtcclient.getWorkitems(projectarea_id="pa",
+                                       lazy=True,
+                                       compact=True,
+                                       partitioned=True)
+    assert len(workitems) == len(created_times)
+    assert len(set(workitems)) == len(created_times)
+
+
+def test_get_workitems_partitioned_open_ended(rtcclient, mocker):
+    mocker.patch("rtcclient.client._MAX_QUERY_RESULTS", 3)
+    # the latest workitem is created after the current time of the client
+    created_times = ["2999-01-01T00:00:00.000Z"] + [
+        "2012-0%d-01T00:00:00.000Z" % month for month in range(4, 0, -1)
+    ]
+    _mock_timed_workitems(mocker, created_times)
+
+    query_strs = rtcclient._get_window_queries("pa", "dc:created")
+    # only the latest window is not bounded above
+    assert len(query_strs) > 1
+    assert all("dc:created<=" in query_str for query_str in query_strs[:-1])
+    assert "dc:created<=" not in query_strs[-1]
+
+    workitems = rtcclient.getWorkitems(projectarea_id="pa",
+                                       lazy=True,
+                                       partitioned=True)
+    assert sorted(int(str(workitem)) for workitem in workitems) == list(
+        range(len(created_times)))
+
+
+def test_get_workitems_projectareas(rtcclient, mocker):
+    entry = ("<oslc_cm:ChangeRequest rdf:resource=\"http://test.url:9443/"
+             "jazz/resource/itemName/com.ibm.team.workitem.WorkItem/%s\">"
+             "<dc:identifier>%s</dc:identifier></oslc_cm:ChangeRequest>")
+    pa_ids = ["pa1", "pa2", "pa3"]
+    released = threading.Event()
+
+    def get_workitems(url, **kwargs):
+        pa_id = url.split("oslc/contexts/")[1].split("/")[0]
+        if pa_id == "pa1":
+            # pa1 is completed only after pa3 is started
+            assert released.wait(5)
+        elif pa_id == "pa3":
+            released.set()
+        resp = mocker.MagicMock(spec=requests.Response)
+        resp.status_code = 200
+        resp.content = ('<oslc_cm:Collection xmlns:oslc_cm="oslc_cm" '
+                        'xmlns:dc="dc" xmlns:rdf="rdf" '
+                        'oslc_cm:totalCount="2">%s</oslc_cm:Collection>' %
+                        "".join(entry % (pa_id + suffix, pa_id + suffix)
+                                for suffix in ("a", "b")))
+        return resp
+
+    mocker.patch("rtcclient.client.RTCClient.getProjectAreaIDs",
+                 return_value=pa_ids)
+    mocked_get = mocker.patch("requests.Session.get")
+    mocked_get.side_effect = get_workitems
+
+    workitems = rtcclient.getWorkitems(lazy=True)
+    # merged in the order of the project areas
+    assert [str(workitem) for workitem in workitems] == [
+        "pa1a", "pa1b", "pa2a", "pa2b", "pa3a", "pa3b"
+    ]
+
+    workitems = rtcclient.getWorkitems(lazy=True,
+                                       compact=True,
+                                       by_projectarea=True)
+    assert list(workitems.keys()) == pa_ids
+    assert [str(workitem) for workitem in workitems["pa2"]] == [
+        "pa2a", "pa2b"
+    ]
+
+    released.clear()
+    completed = [
+        pa_id for pa_id, _ in rtcclient.iterProjectAreaWorkitems(
+            lazy=True, max_workers=2)
+    ]
+    # pa3 is started once pa2 is completed
+    assert completed == ["pa2", "pa1", "pa3"] or completed == [
+        "pa2", "pa3", "pa1"
+    ]
+
+    released.set()
+    completed = [
+        pa_id for pa_id, _ in rtcclient.iterProjectAreaWorkitems(
+            lazy=True, max_workers=1)
+    ]
+    assert completed == pa_ids
+
+    with pytest.raises(BadValue):
+        rtcclient.getWorkitems(max_workers=0)
+
+
+def test_rtc_time():
+    assert parse_rtc_time("2010-02-16T16:04:00.244Z") == datetime.datetime(
+        2010, 2, 16, 16, 4, 0, 244000)
+    assert parse_rtc_time("2010-02-16T16:04:00Z") == datetime.datetime(
+        2010, 2, 16, 16, 4, 0)
+    assert format_rtc_time(datetime.datetime(
+        2010, 2, 16, 16, 4, 0, 244999)) == "2010-02-16T16:04:00.244Z"
+    aware = datetime.datetime(2010,
+                              2,
+                              17,
+                              1,
+                              4,
+                              tzinfo=datetime.timezone(
+                                  datetime.timedelta(hours=9)))
+    assert format_rtc_time(aware) == "2010-02-16T16:04:00.000Z"
+    with pytest.raises(BadValue):
+        parse_rtc_time("yesterday")
+
+
+def test_iter_workitems(rtcclient, mocker):
+    mocker.patch("rtcclient.client.RTCClient.checkProjectAreaID",
+                 return_value=True)
+    mocked_get = mocker.patch("requests.Session.get")
+    mock_resp = mocker.MagicMock(spec=requests.Response)
+    mock_resp.status_code = 200
+    mock_resp.content = utils_test.read_fixture("workitems.xml")
+    mocked_get.return_value = mock_resp
+
+    workitem1 = Workitem("http://test.url:9443/jazz/oslc/workitems/161",
+                         rtcclient,
+                         workitem_id=161,
+                         raw_data=utils_test.workitem1)
+    workitems = rtcclient.iterWorkitems(
+        projectarea_id="_CuZu0HUwEeKicpXBddtqNA")
+    assert list(workitems) == [workitem1]
+
+    mock_resp.iter_content.return_value = iter(_chunked(mock_resp.content))
+    workitems = list(
+        rtcclient.iterWorkitems(projectarea_id="_CuZu0HUwEeKicpXBddtqNA",
+                                stream=True))
+    assert workitems == [workitem1]
+    assert workitems[0].raw_data == utils_test.workitem1
+
+    mocker.patch("rtcclient.client.RTCClient.checkProjectAreaID",
+                 return_value=False)
+    with pytest.raises(BadValue):
+        list(rtcclient.iterWorkitems(projectarea_id="fake_id"))
+
+
 class TestRTCClient:
 
     @pytest.fixture(autouse=True)
@@ -47,7 +682,7 @@ class TestRTCClient:
 
     @pytest.fixture
     def mock_get_pas(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("projectareas.xml")
@@ -75,6 +710,7 @@ class TestRTCClient:
         mock_get_no_pas = mocker.patch(mock_cmd)
         mock_get_no_pas.return_value = None
         myrtcclient._get_paged_resources = mock_get_no_pas
+        myrtcclient.refreshProjectAreas()
 
         projectareas = myrtcclient.getProjectAreas(archived=False)
         assert projectareas is None
@@ -99,6 +735,7 @@ class TestRTCClient:
         mock_get_no_pas = mocker.patch(mock_cmd)
         mock_get_no_pas.return_value = None
         myrtcclient._get_paged_resources = mock_get_no_pas
+        myrtcclient.refreshProjectAreas()
 
         projectareas = myrtcclient.getProjectAreas(archived=True)
         assert projectareas is None
@@ -301,7 +938,7 @@ class TestRTCClient:
 
     @pytest.fixture
     def mock_get_tas(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("teamareas.xml")
@@ -353,6 +990,30 @@ class TestRTCClient:
             teamareas = myrtcclient.getTeamAreas(projectarea_id=pa_id)
             assert teamareas == [ta1, ta2]
 
+    def test_get_teamarea_filtered(self, myrtcclient, mock_get_tas):
+        teamarea = myrtcclient.getTeamArea("Team2")
+        assert str(teamarea) == "Team2"
+        ta_urls = [
+            call[0][0]
+            for call in mock_get_tas.call_args_list
+            if "/oslc/teamareas?" in call[0][0]
+        ]
+        # only the matched team areas are requested
+        assert len(ta_urls) == 1
+        assert ta_urls[0].endswith("&oslc_cm.query=" +
+                                   urlquote('dc:title="Team2"'))
+
+        # the looked up team area is kept
+        call_count = mock_get_tas.call_count
+        myrtcclient.getTeamArea("Team2")
+        assert mock_get_tas.call_count == call_count
+
+        # the whole collection is used once fetched
+        assert len(myrtcclient.getTeamAreas()) == 2
+        call_count = mock_get_tas.call_count
+        assert str(myrtcclient.getTeamArea("Team1")) == "Team1"
+        assert mock_get_tas.call_count == call_count
+
     def test_get_teamareas_archived(self, myrtcclient, mock_get_tas, mocker):
         teamareas = myrtcclient.getTeamAreas(archived=True)
 
@@ -490,7 +1151,7 @@ class TestRTCClient:
 
     @pytest.fixture
     def mock_get_plannedfors(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("plannedfors.xml")
@@ -692,7 +1353,7 @@ class TestRTCClient:
 
     @pytest.fixture
     def mock_get_severities(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("severities.xml")
@@ -812,9 +1473,99 @@ class TestRTCClient:
                 with pytest.raises(NotFound):
                     myrtcclient.getSeverity(severity_name, projectarea_id=pa_id)
 
+    def test_get_severity_cached(self, myrtcclient, mock_get_severities,
+                                 mocker):
+        mocker.patch("rtcclient.client.RTCClient.checkProjectAreaID",
+                     return_value=True)
+        pa_id = "_CuZu0HUwEeKicpXBddtqNA"
+        severity_url = "/".join([
+            "http://test.url:9443/jazz/oslc", "enumerations", pa_id,
+            "severity/severity.literal.l2"
+        ])
+
+        severity = myrtcclient.getSeverity("Normal", projectarea_id=pa_id)
+        assert severity.url == severity_url
+        assert myrtcclient.getSeverity("Unclassified",
+                                       projectarea_id=pa_id).title == \
+            "Unclassified"
+        assert len(myrtcclient.getSeverities(projectarea_id=pa_id)) == 2
+        with pytest.raises(NotFound):
+            myrtcclient.getSeverity("fake_name", projectarea_id=pa_id)
+        # the collection is only fetched once
+        assert mock_get_severities.call_count == 1
+        assert myrtcclient.enumeration_registry.getByURL(
+            "Severity", severity_url, projectarea_id=pa_id) is severity
+        # the linked fields referring to it need no request
+        assert myrtcclient._get_rdf_resource_titles([severity_url]) == {
+            severity_url: "Normal"
+        }
+        assert mock_get_severities.call_count == 1
+
+        myrtcclient.refreshEnumerations("Severity", projectarea_id=pa_id)
+        myrtcclient.getSeverity("Normal", projectarea_id=pa_id)
+        assert mock_get_severities.call_count == 2
+
+        myrtcclient.enumeration_registry = EnumerationRegistry(myrtcclient,
+                                                               ttl=0)
+        myrtcclient.getSeverity("Normal", projectarea_id=pa_id)
+        myrtcclient.getSeverity("Normal", projectarea_id=pa_id)
+        assert mock_get_severities.call_count == 4
+
+    def test_enumerations_loaded_separately(self, myrtcclient, mocker):
+        registry = EnumerationRegistry(myrtcclient)
+        executor = myrtcclient.executor
+        loaded = list()
+
+        def get_paged_resources(resource_name, projectarea_id=None,
+                                **kwargs):
+            if resource_name == "Severity" and not executor.in_worker():
+                # the pages are queued behind the workers looking up both
+                # the same and the other collections
+                futures = [
+                    executor.submit(registry.getAll, name, projectarea_id)
+                    for name in ("Severity", "Priority")
+                ]
+                for future in futures:
+                    future.result(timeout=5)
+            loaded.append((resource_name, projectarea_id))
+            return [
+                mocker.MagicMock(title=resource_name,
+                                 url="%s/%s" % (projectarea_id,
+                                                resource_name))
+            ]
+
+        mocker.patch.object(myrtcclient,
+                            "_get_paged_resources",
+                            side_effect=get_paged_resources)
+        severities = registry.getAll("Severity", projectarea_id="pa1")
+        assert severities[0].title == "Severity"
+        assert sorted(loaded) == [("Priority", "pa1"), ("Severity", "pa1"),
+                                  ("Severity", "pa1")]
+        assert registry.getByTitle("Priority", "Priority",
+                                   projectarea_id="pa1").url == "pa1/Priority"
+        assert len(loaded) == 3
+
+    def test_enumeration_titles_missing(self, myrtcclient, mocker):
+        registry = myrtcclient.enumeration_registry
+        teamarea = mocker.MagicMock(title="Team3", url="pa/Team3")
+        mocker.patch.object(myrtcclient, "_is_filterable", return_value=True)
+        mocked_paged = mocker.patch.object(myrtcclient,
+                                           "_get_paged_resources",
+                                           side_effect=[None, [teamarea]])
+
+        # the missing title is looked up again, since it may be created
+        assert registry.getByTitle("TeamArea", "Team3",
+                                   projectarea_id="pa") is None
+        assert registry.getByTitle("TeamArea", "Team3",
+                                   projectarea_id="pa") is teamarea
+        # the found one is kept
+        assert registry.getByTitle("TeamArea", "Team3",
+                                   projectarea_id="pa") is teamarea
+        assert mocked_paged.call_count == 2
+
     @pytest.fixture
     def mock_get_priorities(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("priorities.xml")
@@ -934,7 +1685,7 @@ class TestRTCClient:
 
     @pytest.fixture
     def mock_get_foundins(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("foundins.xml")
@@ -1126,7 +1877,7 @@ class TestRTCClient:
 
     @pytest.fixture
     def mock_get_filedagainsts(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("filedagainsts.xml")
@@ -1318,7 +2069,7 @@ class TestRTCClient:
                 assert fa == fa1
 
     def test_get_workitem(self, mocker, myrtcclient):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.workitem1_raw
@@ -1374,13 +2125,155 @@ class TestRTCClient:
 
     @pytest.fixture
     def mock_get_workitems(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("workitems.xml")
         mocked_get.return_value = mock_resp
         return mocked_get
 
+    def test_get_workitems_compact(self, myrtcclient, mock_get_workitems,
+                                   mocker):
+        mocker.patch("rtcclient.client.RTCClient.checkProjectAreaID",
+                     return_value=True)
+        workitems = myrtcclient.getWorkitems(
+            projectarea_id="_CuZu0HUwEeKicpXBddtqNA", compact=True)
+        assert len(workitems) == 1
+        record = workitems[0]
+        assert isinstance(record, WorkitemRecord)
+        assert record.raw_data is None
+        assert record.title == "input title here for 161"
+        # the linked fields are resolved by the whole page
+        assert "severity" not in record._pending_links
+        workitem1 = myrtcclient.getWorkitems(
+            projectarea_id="_CuZu0HUwEeKicpXBddtqNA")[0]
+        assert record.severity == workitem1.severity
+
+        queried_wis = myrtcclient.queryWorkitems(
+            query_str="valid_query_str",
+            projectarea_id="_CuZu0HUwEeKicpXBddtqNA",
+            compact=True,
+            keep_raw=True)
+        assert queried_wis == workitems
+        assert queried_wis[0].raw_data == utils_test.workitem1
+
+    def test_get_workitem_lazy(self, myrtcclient, mocker):
+        mocked_get = mocker.patch("requests.Session.get")
+        mock_resp = mocker.MagicMock(spec=requests.Response)
+        mock_resp.status_code = 200
+        mock_resp.content = utils_test.workitem1_raw
+        mocked_get.return_value = mock_resp
+
+        workitem1 = myrtcclient.getWorkitem(161, lazy=True)
+        # no linked fields are requested during the construction
+        assert mocked_get.call_count == 1
+        assert workitem1.title == "input title here for 161"
+        assert workitem1.creator == "tester1@email.com"
+        assert mocked_get.call_count == 1
+
+        severity_url = ("http://test.url:9443/jazz/oslc/enumerations/"
+                        "_CuZu0HUwEeKicpXBddtqNA/severity/severity.literal.l3")
+        assert workitem1.getLinkURL("severity") == severity_url
+        assert workitem1.getLinkURL("title") is None
+
+        mock_resp.content = utils_test.read_fixture("severities.xml")
+        # only the accessed field is requested
+        assert workitem1.severity == ["Unclassified", "Normal"]
+        assert mocked_get.call_count == 2
+        assert mocked_get.call_args[0][0] == severity_url
+        assert workitem1["severity"] == ["Unclassified", "Normal"]
+        assert mocked_get.call_count == 2
+        assert workitem1.getLinkURL("severity") == severity_url
+
+        # the title is cached by the client
+        workitem2 = Workitem("http://test.url:9443/jazz/oslc/workitems/161",
+                             myrtcclient,
+                             raw_data=utils_test.workitem1,
+                             lazy=True)
+        assert workitem2.getattr("severity") == ["Unclassified", "Normal"]
+        assert mocked_get.call_count == 2
+
+        assert workitem2.getattr("fake_attr") is None
+        with pytest.raises(AttributeError):
+            workitem2.fake_attr
+
+    def test_get_workitems_lazy(self, myrtcclient, mock_get_workitems,
+                                mocker):
+        mocker.patch("rtcclient.client.RTCClient.checkProjectAreaID",
+                     return_value=True)
+        mock_get_workitems.reset_mock()
+        workitems = myrtcclient.getWorkitems(
+            projectarea_id="_CuZu0HUwEeKicpXBddtqNA", lazy=True)
+        # only the page is requested
+        assert mock_get_workitems.call_count == 1
+        titles = [workitem.title for workitem in workitems]
+        assert titles == ["input title here for 161"]
+        assert "severity" in workitems[0]._pending_links
+
+    def test_get_workitems_by_ids(self, myrtcclient, mock_get_workitems,
+                                  mocker):
+        mocker.patch("rtcclient.client.RTCClient.checkProjectAreaID",
+                     return_value=True)
+        workitem1 = Workitem("http://test.url:9443/jazz/oslc/workitems/161",
+                             myrtcclient,
+                             workitem_id=161,
+                             raw_data=utils_test.workitem1)
+        workitem2 = Workitem("http://test.url:9443/jazz/oslc/workitems/6329",
+                             myrtcclient,
+                             workitem_id=6329,
+                             raw_data=utils_test.workitem2)
+
+        # a single query for all the ids
+        mock_get_workitems.reset_mock()
+        results = myrtcclient.getWorkitemsByIDs(
+            ["6329", 161, 404, None, 161],
+            projectarea_id="_CuZu0HUwEeKicpXBddtqNA")
+        assert results[:2] == [workitem2, workitem1]
+        assert isinstance(results[2], NotFound)
+        assert isinstance(results[3], BadValue)
+        assert results[4] is results[1]
+        query_urls = [
+            call[0][0]
+            for call in mock_get_workitems.call_args_list
+            if "oslc_cm.query=" in call[0][0]
+        ]
+        assert len(query_urls) == 1
+        assert urlquote("dc:identifier in [6329,161,404]") in query_urls[0]
+
+        # the query is split to fit in the url
+        mocker.patch("rtcclient.client._MAX_QUERY_LENGTH", 10)
+        mock_get_workitems.reset_mock()
+        results = myrtcclient.getWorkitemsByIDs(
+            [161, 6329], projectarea_id="_CuZu0HUwEeKicpXBddtqNA")
+        assert results == [workitem1, workitem2]
+        query_urls = [
+            call[0][0]
+            for call in mock_get_workitems.call_args_list
+            if "oslc_cm.query=" in call[0][0]
+        ]
+        assert len(query_urls) == 2
+
+    def test_get_workitems_by_ids_separately(self, myrtcclient, mocker):
+        # the linked fields are not resolved from the server
+        workitem1 = Workitem("http://test.url:9443/jazz/oslc/workitems/161",
+                             myrtcclient,
+                             workitem_id=161,
+                             raw_data=utils_test.workitem1,
+                             lazy=True)
+
+        def get_workitem(workitem_id, returned_properties=None, lazy=False):
+            if workitem_id == 161:
+                return workitem1
+            raise NotFound("Not found <Workitem %s>" % workitem_id)
+
+        mocked_get = mocker.patch("rtcclient.client.RTCClient.getWorkitem",
+                                  side_effect=get_workitem)
+        results = myrtcclient.getWorkitemsByIDs([161, "404", True])
+        assert results[0] == workitem1
+        assert isinstance(results[1], NotFound)
+        assert isinstance(results[2], BadValue)
+        assert mocked_get.call_count == 2
+
     def test_get_workitems_unarchived(self, myrtcclient, mock_get_workitems,
                                       mocker):
         # test for invalid projectarea id
@@ -1447,6 +2340,62 @@ class TestRTCClient:
                                                  archived=True)
             assert workitems is None
 
+    def test_get_workitems_resolve_links(self, myrtcclient, mocker):
+        mocker.patch("rtcclient.client.RTCClient.checkProjectAreaID",
+                     return_value=True)
+        collection_rsp = mocker.MagicMock(spec=requests.Response)
+        collection_rsp.status_code = 200
+        collection_rsp.content = utils_test.read_fixture("workitems.xml")
+
+        def get_resource(url, **kwargs):
+            if "/contexts/" in url:
+                return collection_rsp
+            link_rsp = mocker.MagicMock(spec=requests.Response)
+            link_rsp.status_code = 200
+            link_rsp.content = ("<rtc_cm:Literal xmlns:rtc_cm=\"rtc\" "
+                                "xmlns:dc=\"dc\"><dc:title>%s</dc:title>"
+                                "</rtc_cm:Literal>" % url.split("/")[-1])
+            return link_rsp
+
+        mocked_get = mocker.patch("requests.Session.get")
+        mocked_get.side_effect = get_resource
+
+        workitems = myrtcclient.getWorkitems(
+            projectarea_id="_CuZu0HUwEeKicpXBddtqNA", archived=True)
+        assert len(workitems) == 1
+        workitem = workitems[0]
+        assert workitem.state == "default_workflow.state.s1"
+        assert workitem.ownedBy == "tester1@email.com"
+        assert not workitem._pending_links
+
+        # each linked resource is only requested once
+        link_urls = [
+            call[0][0]
+            for call in mocked_get.call_args_list
+            if "/contexts/" not in call[0][0]
+        ]
+        assert link_urls
+        assert len(link_urls) == len(set(link_urls))
+
+        # the resolved titles are cached by the client
+        cache_stats = myrtcclient.getResourceCacheStats()
+        assert cache_stats["size"] == len(link_urls)
+        mocked_get.reset_mock()
+        myrtcclient.getWorkitems(projectarea_id="_CuZu0HUwEeKicpXBddtqNA",
+                                 archived=True)
+        assert mocked_get.call_count == 1
+        assert myrtcclient.getResourceCacheStats()["hits"] == len(link_urls)
+
+        myrtcclient.invalidateResourceCache(link_urls[0])
+        mocked_get.reset_mock()
+        myrtcclient.getWorkitems(projectarea_id="_CuZu0HUwEeKicpXBddtqNA",
+                                 archived=True)
+        assert mocked_get.call_count == 2
+        assert mocked_get.call_args[0][0] == link_urls[0]
+
+        myrtcclient.invalidateResourceCache()
+        assert myrtcclient.getResourceCacheStats()["size"] == 0
+
     def test_list_fields(self, myrtcclient):
         fields = myrtcclient.listFields(utils_test.template_name)
         fields_set = set([
@@ -1456,7 +2405,7 @@ class TestRTCClient:
         assert fields == fields_set
 
     def test_list_fields_from_workitem(self, myrtcclient, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.workitem1_raw
@@ -1475,6 +2424,118 @@ class TestRTCClient:
         # TODO
         pass
 
+    def test_create_workitems(self, myrtcclient, mocker):
+        projectarea = mocker.MagicMock(id="pa_id")
+        projectarea.getItemType.side_effect = lambda item_type: (
+            mocker.MagicMock(identifier=item_type.lower()))
+        mocker.patch("rtcclient.client.RTCClient.getProjectAreaByID",
+                     return_value=projectarea)
+        mocked_list = mocker.patch("rtcclient.client.RTCClient.listFields",
+                                   return_value=set(
+                                       ["title", "description", "severity"]))
+        mocked_severity = mocker.patch(
+            "rtcclient.client.RTCClient.getSeverity",
+            side_effect=lambda name, projectarea_id: mocker.MagicMock(
+                url="http://severity/%s" % name))
+        mocker.patch(
+            "rtcclient.template.Templater.render",
+            side_effect=lambda template, **kwargs: "%(title)s %(severity)s" %
+            kwargs)
+
+        def create_workitem(url_post, workitem_raw):
+            if workitem_raw.startswith("bad"):
+                raise RTCException("failed to post")
+            return Workitem(url_post + "/" + workitem_raw.split()[0],
+                            myrtcclient,
+                            workitem_id=workitem_raw.split()[0],
+                            raw_data={"dc:title": workitem_raw})
+
+        mocked_create = mocker.patch(
+            "rtcclient.client.RTCClient._createWorkitem",
+            side_effect=create_workitem)
+
+        records = [("Task", "t%d" % idx, "desc", {
+            "severity": "Major" if idx % 2 else "Minor"
+        }) for idx in range(6)]
+        records.append(("Defect", "bad", None, {"severity": "Major"}))
+        records.append(("Task", "missing"))
+        records.append(("Task",))
+        results = myrtcclient.createWorkitems(records,
+                                              projectarea_id="pa_id",
+                                              template="task.template",
+                                              max_workers=2)
+        assert len(results) == len(records)
+        assert [str(result) for result in results[:6]] == [
+            "t%d" % idx for idx in range(6)
+        ]
+        assert results[0].title == "t0 http://severity/Minor"
+        assert mocked_create.call_args_list[0][0][0].endswith(
+            "/oslc/contexts/pa_id/workitems/task")
+        assert isinstance(results[6], RTCException)
+        assert isinstance(results[7], EmptyAttrib)
+        assert isinstance(results[8], BadValue)
+        # the shared metadata is only looked up once
+        assert mocked_list.call_count == 1
+        assert mocked_severity.call_count == 2
+        assert projectarea.getItemType.call_count == 2
+        assert mocked_create.call_count == 7
+
+        with pytest.raises(EmptyAttrib):
+            myrtcclient.createWorkitems(records, projectarea_id="pa_id")
+        with pytest.raises(BadValue):
+            myrtcclient.createWorkitems(records,
+                                        projectarea_id="pa_id",
+                                        template="task.template",
+                                        max_workers=0)
+
+    def test_copy_workitem_once(self, myrtcclient, mocker):
+        mocked_get = mocker.patch("requests.Session.get")
+        mock_resp = mocker.MagicMock(spec=requests.Response)
+        mock_resp.status_code = 200
+        mock_resp.content = utils_test.workitem1_raw
+        mocked_get.return_value = mock_resp
+        projectarea = mocker.MagicMock(id="pa_id")
+        projectarea.getItemType.return_value = mocker.MagicMock(
+            identifier="task")
+        mocker.patch("rtcclient.client.RTCClient.getProjectAreaByID",
+                     return_value=projectarea)
+        mocked_create = mocker.patch(
+            "rtcclient.client.RTCClient._createWorkitem")
+        # the fixture has no namespace declarations
+        mocker.patch("rtcclient.template.remove_empty_elements",
+                     side_effect=lambda docs: docs)
+
+        for idx in range(3):
+            myrtcclient.copyWorkitem(161, prefix="copy%d: " % idx)
+        myrtcclient.createWorkitem("Task",
+                                   "new title",
+                                   projectarea_id="pa_id",
+                                   copied_from=161,
+                                   keep=True)
+        myrtcclient.createWorkitems([("Task", "new title")],
+                                    projectarea_id="pa_id",
+                                    copied_from="161",
+                                    keep=True)
+        assert mocked_create.call_count == 5
+        assert "copy2: " in mocked_create.call_args_list[2][0][1]
+        # the workitem is only fetched once
+        workitem_urls = [
+            call[0][0] for call in mocked_get.call_args_list
+            if call[0][0].endswith("oslc/workitems/161")
+        ]
+        assert len(workitem_urls) == 1
+
+        myrtcclient.refreshTemplates(161)
+        myrtcclient.copyWorkitem(161)
+        workitem_urls = [
+            call[0][0] for call in mocked_get.call_args_list
+            if call[0][0].endswith("oslc/workitems/161")
+        ]
+        assert len(workitem_urls) == 2
+
+        with pytest.raises(BadValue):
+            myrtcclient.copyWorkitem("fake_id")
+
     def test_copy_workitem(self, myrtcclient):
         # TODO
         pass
@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from rtcclient.executor import Executor
+
+
+class TestExecutor:
+
+    def test_map(self):
+        executor = Executor(max_workers=4)
+        assert executor.map(lambda x, y: x * y, [1, 2, 3], [4, 5, 6]) == [
+            4, 10, 18
+        ]
+        assert executor.map(str, []) == []
+        executor.shutdown()
+
+    def test_map_exception(self):
+        executor = Executor(max_workers=2)
+
+        def divide(x):
+            return 1 / x
+
+        with pytest.raises(ZeroDivisionError):
+            executor.map(divide, [1, 0, 2])
+        executor.shutdown()
+
+    def test_nested_submissions(self):
+        # every worker waits for the nested tasks
+        executor = Executor(max_workers=2)
+        caller_threads = set()
+
+        def inner(x):
+            caller_threads.add(threading.current_thread().name)
+            return x + 1
+
+        def outer(x):
+            future = executor.submit(inner, x)
+            return sum(executor.map(inner, [x, x])) + future.result()
+
+        assert executor.map(outer, range(8)) == [3 * x + 3 for x in range(8)]
+        assert all(name.startswith("rtcclient") for name in caller_threads)
+        assert len(caller_threads) <= 2
+        executor.shutdown()
+
+    def test_imap_unordered(self):
+        executor = Executor(max_workers=4)
+        released = threading.Event()
+
+        def wait_released(x):
+            if x == 0:
+                assert released.wait(5)
+            elif x == 2:
+                released.set()
+            return x * 2
+
+        # 2 is started once 1 is completed
+        completed = [(item, future.result())
+                     for item, future in executor.imap_unordered(
+                         wait_released, range(3), limit=2)]
+        assert completed[0] == (1, 2)
+        assert sorted(completed) == [(0, 0), (1, 2), (2, 4)]
+
+        # processed one by one in the calling thread
+        caller_threads = set()
+
+        def record_thread(x):
+            caller_threads.add(threading.current_thread())
+            return 1 / x
+
+        completed = list(executor.imap_unordered(record_thread, [1, 0, 2],
+                                                 limit=1))
+        assert [item for item, _ in completed] == [1, 0, 2]
+        with pytest.raises(ZeroDivisionError):
+            completed[1][1].result()
+        assert caller_threads == set([threading.current_thread()])
+        assert list(executor.imap_unordered(str, [])) == []
+        with pytest.raises(ValueError):
+            list(executor.imap_unordered(str, [1], limit=0))
+        executor.shutdown()
+
+    def test_shutdown(self):
+        executor = Executor(max_workers=1)
+        assert executor.submit(len, "abc").result() == 3
+        executor.shutdown()
+        assert executor._pool is None
+        # the workers are started again
+        assert executor.submit(len, "abcd").result() == 4
+        executor.shutdown()
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError):
+            Executor(max_workers=0)
@@ -0,0 +1,146 @@
+from collections import OrderedDict
+
+import pytest
+
+import utils_test
+from rtcclient import export
+from rtcclient.exception import BadValue, RTCException
+from rtcclient.executor import Executor
+from rtcclient.export import ColumnBuilder, parse_properties
+
+_WORKITEM_URL = "http://test.url:9443/jazz/oslc/workitems/161"
+_SEVERITY_URL = ("http://test.url:9443/jazz/oslc/enumerations/"
+                 "_CuZu0HUwEeKicpXBddtqNA/severity/severity.literal.l3")
+
+
+def test_parse_properties():
+    assert parse_properties(None) is None
+    assert parse_properties("dc:title, rtc_cm:state,,dc:title") == [
+        "dc:title", "rtc_cm:state"
+    ]
+    with pytest.raises(BadValue):
+        parse_properties(["dc:title"])
+
+
+class TestColumnBuilder:
+
+    def test_build_columns(self, rtcclient, mocker):
+        mocked_titles = mocker.patch(
+            "rtcclient.client.RTCClient._get_rdf_resource_titles",
+            side_effect=lambda urls: dict((url, "title") for url in urls))
+        builder = ColumnBuilder(
+            rtcclient,
+            returned_properties="dc:title,oslc_cm:severity,rtc_cm:ownedBy,"
+            "rtc_cm:fake")
+        assert builder.columns == [
+            "identifier", "title", "severity", "ownedBy", "fake"
+        ]
+
+        row = builder.buildRow(_WORKITEM_URL, rtcclient, utils_test.workitem1)
+        assert row == ({
+            "identifier": "161",
+            "title": "input title here for 161",
+            "severity": _SEVERITY_URL,
+            "ownedBy": "tester3@email.com"
+        }, ["severity"])
+
+        batches = list(builder.iterBatches([row], batch_size=10))
+        assert batches == [{
+            "identifier": ["161"],
+            "title": ["input title here for 161"],
+            "severity": ["title"],
+            "ownedBy": ["tester3@email.com"],
+            "fake": [None]
+        }]
+        assert list(batches[0].keys()) == builder.columns
+        mocked_titles.assert_called_once_with(set([_SEVERITY_URL]))
+
+    def test_collect(self, rtcclient):
+        builder = ColumnBuilder(rtcclient, resolve_links=False)
+        raw_data = utils_test.workitem1.copy()
+        raw_data.pop("dc:title")
+        rows = [
+            builder.buildRow(_WORKITEM_URL, rtcclient, raw_data),
+            builder.buildRow(_WORKITEM_URL, rtcclient, utils_test.workitem1)
+        ]
+        columns = builder.collect(iter(rows), batch_size=1)
+        assert columns["identifier"] == ["161", "161"]
+        # the later column is filled for the earlier batch
+        assert columns["title"] == [None, "input title here for 161"]
+        assert columns["severity"] == [_SEVERITY_URL] * 2
+
+        assert builder.collect([]) == dict(
+            (column, []) for column in builder.columns)
+
+    def test_build_rows_concurrently(self, rtcclient):
+        entries = [
+            OrderedDict([("dc:identifier", str(idx)),
+                         ("rtc_cm:field%s" % (idx % 7), "value%s" % idx),
+                         ("dc:title", "title%s" % idx)])
+            for idx in range(100)
+        ]
+        urls = [_WORKITEM_URL[:-3] + entry["dc:identifier"]
+                for entry in entries]
+        expected = ["identifier", "field0", "title"] + [
+            "field%s" % idx for idx in range(1, 7)
+        ]
+
+        executor = Executor(max_workers=8)
+        try:
+            for _ in range(5):
+                builder = ColumnBuilder(rtcclient, resolve_links=False)
+                rows = executor.map(
+                    lambda url, entry: builder.buildRow(url, rtcclient,
+                                                        entry),
+                    urls, entries)
+                assert builder.columns == ["identifier"]
+
+                columns = builder.collect(rows, batch_size=30)
+                assert list(columns.keys()) == expected
+                assert builder.columns == expected
+                assert columns["identifier"] == [
+                    str(idx) for idx in range(100)
+                ]
+                assert columns["title"] == [
+                    "title%s" % idx for idx in range(100)
+                ]
+                for idx in range(7):
+                    assert columns["field%s" % idx] == [
+                        "value%s" % row if row % 7 == idx else None
+                        for row in range(100)
+                    ]
+        finally:
+            executor.shutdown()
+
+    def test_output(self, rtcclient, mocker):
+        with pytest.raises(BadValue):
+            ColumnBuilder(rtcclient, output="csv")
+
+        mocker.patch.object(export, "pandas", None)
+        with pytest.raises(RTCException):
+            ColumnBuilder(rtcclient, output="pandas")
+        mocker.patch.object(export, "pyarrow", None)
+        with pytest.raises(RTCException):
+            ColumnBuilder(rtcclient, output="arrow")
+
+    def test_output_pandas(self, rtcclient):
+        pytest.importorskip("pandas")
+        builder = ColumnBuilder(rtcclient,
+                                returned_properties="dc:title",
+                                output="pandas")
+        row = builder.buildRow(_WORKITEM_URL, rtcclient, utils_test.workitem1)
+        frame = builder.collect([row])
+        assert list(frame.columns) == ["identifier", "title"]
+        assert frame["title"].tolist() == ["input title here for 161"]
+
+    def test_output_arrow(self, rtcclient):
+        pytest.importorskip("pyarrow")
+        builder = ColumnBuilder(rtcclient,
+                                returned_properties="dc:title",
+                                output="arrow")
+        row = builder.buildRow(_WORKITEM_URL, rtcclient, utils_test.workitem1)
+        batch = builder.toBatch([row])
+        assert batch.num_rows == 1
+        table = builder.collect([row])
+        assert table.column_names == ["identifier", "title"]
+        assert table.to_pydict()["title"] == ["input title here for 161"]
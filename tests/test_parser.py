@@ -0,0 +1,113 @@
+import os
+
+import pytest
+import requests
+import xmltodict
+from lxml import etree
+
+import utils_test
+from rtcclient.exception import BadValue
+from rtcclient.models import TeamArea
+from rtcclient.parser import CollectionStream, LxmlParser, XmltodictParser
+from rtcclient.parser import get_parser
+
+_FIXTURES = sorted(
+    file_name for file_name in os.listdir(utils_test._search_path)
+    if file_name.endswith((".xml", ".template")))
+
+
+class TestLxmlParser:
+
+    @pytest.mark.parametrize("file_name", _FIXTURES)
+    def test_parse_fixtures(self, file_name):
+        content = utils_test.read_fixture(file_name)
+        assert LxmlParser().parse(content) == xmltodict.parse(content)
+        assert LxmlParser().parse(
+            content.encode("utf-8")) == xmltodict.parse(content)
+
+    def test_parse(self):
+        content = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="rdf" xmlns:dc="dc">
+  <!-- ignored -->
+  <dc:title rdf:parseType="Literal">title &amp; more</dc:title>
+  <dc:subject/>
+  <dc:subject>b</dc:subject>
+  <rtc_cm:mixed xmlns="default">text<empty/> tail </rtc_cm:mixed>
+  <dc:empty attr=""></dc:empty>
+</rdf:RDF>"""
+        parsed = LxmlParser().parse(content)
+        assert parsed == xmltodict.parse(content)
+        assert parsed["rdf:RDF"]["dc:title"] == {
+            "@rdf:parseType": "Literal",
+            "#text": "title & more"
+        }
+        assert parsed["rdf:RDF"]["dc:subject"] == [None, "b"]
+
+    def test_parse_invalid(self):
+        for content in [b"<a><b>1</b>", b"<a>&undefined;</a>", b""]:
+            with pytest.raises(etree.XMLSyntaxError):
+                LxmlParser().parse(content)
+
+
+class TestCollectionStream:
+
+    @pytest.mark.parametrize("chunk_size", [1, 100, 100000])
+    def test_iter_entries(self, chunk_size):
+        content = utils_test.read_fixture("workitems.xml").encode("utf-8")
+        chunks = [
+            content[idx:idx + chunk_size]
+            for idx in range(0, len(content), chunk_size)
+        ]
+        collection = xmltodict.parse(content)["oslc_cm:Collection"]
+
+        entries = CollectionStream(iter(chunks), "oslc_cm:ChangeRequest")
+        assert list(entries) == collection["oslc_cm:ChangeRequest"]
+        assert entries.collection["@oslc_cm:totalCount"] == "2"
+        assert "oslc_cm:ChangeRequest" not in entries.collection
+
+    def test_iter_single_entry(self):
+        content = (b'<oslc_cm:Collection xmlns:oslc_cm="oslc_cm" '
+                   b'xmlns:dc="dc" oslc_cm:next="next_url">'
+                   b'<dc:title>c</dc:title><oslc_cm:ChangeRequest>'
+                   b'<dc:title>a</dc:title></oslc_cm:ChangeRequest>'
+                   b'</oslc_cm:Collection>')
+        entries = CollectionStream([content], "oslc_cm:ChangeRequest")
+        assert list(entries) == [{"dc:title": "a"}]
+        assert entries.collection["@oslc_cm:next"] == "next_url"
+        assert entries.collection["dc:title"] == "c"
+
+    def test_iter_invalid(self):
+        for content in [b"<a><b>1</b>", b""]:
+            with pytest.raises(etree.XMLSyntaxError):
+                list(CollectionStream([content], "b"))
+
+
+def test_get_parser():
+    assert isinstance(get_parser(), XmltodictParser)
+    assert isinstance(get_parser("xmltodict"), XmltodictParser)
+    assert isinstance(get_parser("lxml"), LxmlParser)
+    parser = LxmlParser()
+    assert get_parser(parser) is parser
+
+    for invalid_parser in ["fake_parser", object()]:
+        with pytest.raises(BadValue):
+            get_parser(invalid_parser)
+
+
+def test_client_parser(rtcclient, mocker):
+    rtcclient.parser = get_parser("lxml")
+    mocked_get = mocker.patch("requests.Session.get")
+    mock_resp = mocker.MagicMock(spec=requests.Response)
+    mock_resp.status_code = 200
+    mock_resp.content = utils_test.read_fixture("teamareas.xml")
+    mocked_get.return_value = mock_resp
+
+    ta1 = TeamArea(
+        "http://test.url:9443/jazz/oslc/teamareas/_ECYfMHUwEeKicpXBddtqNA",
+        rtcclient, utils_test.ta1)
+    ta2 = TeamArea(
+        "http://test.url:9443/jazz/oslc/teamareas/_XazXEPbZEeGWkpg5MjeYZQ",
+        rtcclient, utils_test.ta2)
+    teamareas = rtcclient.getTeamAreas()
+    assert teamareas == [ta1, ta2]
+    assert teamareas[0].raw_data == utils_test.ta1
@@ -1,7 +1,7 @@
 import requests
 import pytest
 import utils_test
-from rtcclient.project_area import ProjectArea
+from rtcclient.project_area import ProjectArea, ProjectAreaRegistry
 from rtcclient.models import Member, ItemType, Administrator, Role
 from rtcclient.exception import BadValue, NotFound, EmptyAttrib
 
@@ -31,7 +31,7 @@ class TestProjectArea:
 
     @pytest.fixture
     def mock_get_roles(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("roles.xml")
@@ -97,7 +97,7 @@ class TestProjectArea:
 
     @pytest.fixture
     def mock_get_members(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("members.xml")
@@ -173,7 +173,7 @@ class TestProjectArea:
 
     @pytest.fixture
     def mock_get_itemtypes(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("itemtypes.xml")
@@ -253,7 +253,7 @@ class TestProjectArea:
 
     @pytest.fixture
     def mock_get_admins(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("administrators.xml")
@@ -301,3 +301,65 @@ class TestProjectArea:
         for admin_name in admin_fake_names:
             with pytest.raises(NotFound):
                 mypa.getAdministrator(admin_name)
+
+
+class TestProjectAreaRegistry:
+
+    @pytest.fixture
+    def mock_get_pas(self, mocker):
+        mocked_get = mocker.patch("requests.Session.get")
+        mock_resp = mocker.MagicMock(spec=requests.Response)
+        mock_resp.status_code = 200
+        mock_resp.content = utils_test.read_fixture("projectareas.xml")
+        mocked_get.return_value = mock_resp
+        return mocked_get
+
+    def test_lookup(self, rtcclient, mock_get_pas):
+        pa_id = "_CuZu0HUwEeKicpXBddtqNA"
+        assert rtcclient.checkProjectAreaID(pa_id) is True
+        assert rtcclient.getProjectAreaByID(pa_id).title == "ProjectArea2"
+        assert rtcclient.getProjectAreaID("ProjectArea2") == pa_id
+        assert rtcclient.checkProjectAreaID("fake_id") is False
+        with pytest.raises(NotFound):
+            rtcclient.getProjectArea("ProjectArea1")
+        # all the lookups share a single scan
+        assert mock_get_pas.call_count == 1
+
+        # the archived project areas are indexed separately
+        assert rtcclient.getProjectAreaID("ProjectArea1",
+                                          archived=True) != pa_id
+        assert mock_get_pas.call_count == 2
+
+        rtcclient.refreshProjectAreas()
+        assert rtcclient.checkProjectAreaID(pa_id) is True
+        assert mock_get_pas.call_count == 3
+
+        # the returned properties are always requested from the server
+        rtcclient.getProjectAreaByID(pa_id, returned_properties="dc:title")
+        assert mock_get_pas.call_count == 4
+
+    def test_load_in_workers(self, rtcclient, mock_get_pas, mocker):
+        pa_id = "_CuZu0HUwEeKicpXBddtqNA"
+        get_paged_resources = rtcclient._get_paged_resources
+        worker_results = list()
+
+        def load_with_workers(*args, **kwargs):
+            if not rtcclient.executor.in_worker():
+                # the pages are queued behind a worker looking up the same
+                # project areas
+                future = rtcclient.executor.submit(
+                    rtcclient.checkProjectAreaID, pa_id)
+                worker_results.append(future.result(timeout=5))
+            return get_paged_resources(*args, **kwargs)
+
+        mocker.patch.object(rtcclient,
+                            "_get_paged_resources",
+                            side_effect=load_with_workers)
+        assert rtcclient.checkProjectAreaID(pa_id) is True
+        assert worker_results == [True]
+
+    def test_no_cache(self, rtcclient, mock_get_pas):
+        rtcclient.projectarea_registry = ProjectAreaRegistry(rtcclient, ttl=0)
+        for _ in range(2):
+            assert rtcclient.getProjectAreaID("ProjectArea2")
+        assert mock_get_pas.call_count == 2
@@ -24,7 +24,7 @@ class TestQuery:
 
     @pytest.fixture
     def mock_query(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("workitems.xml")
@@ -101,7 +101,7 @@ class TestQuery:
 
     @pytest.fixture
     def mock_getsavedqueries(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("savedqueries.xml")
@@ -287,7 +287,7 @@ class TestQuery:
 
     @pytest.fixture
     def mock_get_workitems(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("workitems.xml")
@@ -383,3 +383,86 @@ class TestQuery:
         for invalid_id in invalid_ids:
             with pytest.raises(exception.BadValue):
                 myquery.runSavedQueryByID(invalid_id)
+
+    def test_iter_query_workitems(self, myrtcclient, mocker, mock_query):
+        myquery = myrtcclient.query
+
+        # projectarea is not specified
+        with pytest.raises(EmptyAttrib):
+            myquery.iterQueryWorkitems(query_str="fake_test")
+
+        mocked_check_pa_id = mocker.patch("rtcclient.client.RTCClient."
+                                          "checkProjectAreaID")
+        mocked_check_pa_id.return_value = True
+
+        workitem1 = Workitem("http://test.url:9443/jazz/oslc/workitems/161",
+                             myrtcclient,
+                             workitem_id=161,
+                             raw_data=utils_test.workitem1)
+
+        mock_query.reset_mock()
+        queried_wis = myquery.iterQueryWorkitems(
+            query_str="valid_query_str",
+            projectarea_id="_CuZu0HUwEeKicpXBddtqNA")
+        # nothing is requested until the generator is consumed
+        assert mock_query.call_count == 0
+        assert list(queried_wis) == [workitem1]
+
+        queried_wis = myrtcclient.iterQueryWorkitems(
+            query_str="valid_query_str",
+            projectarea_id="valid_id",
+            archived=True)
+        assert list(queried_wis) == []
+
+    def test_query_workitems_columns(self, myrtcclient, mocker, mock_query):
+        myquery = myrtcclient.query
+        mocker.patch("rtcclient.client.RTCClient.checkProjectAreaID",
+                     return_value=True)
+        mocked_init = mocker.patch("rtcclient.workitem.Workitem.__init__")
+
+        columns = myquery.queryWorkitemsColumns(
+            query_str="valid_query_str",
+            projectarea_id="_CuZu0HUwEeKicpXBddtqNA",
+            returned_properties="dc:title,rtc_cm:ownedBy")
+        assert columns == {
+            "identifier": ["161"],
+            "title": ["input title here for 161"],
+            "ownedBy": ["tester3@email.com"]
+        }
+        assert "oslc_cm.properties=" in mock_query.call_args[0][0]
+        # no workitems are built
+        assert mocked_init.call_count == 0
+
+        batches = myrtcclient.iterQueryWorkitemsColumns(
+            query_str="valid_query_str",
+            projectarea_id="_CuZu0HUwEeKicpXBddtqNA",
+            archived=None,
+            resolve_links=False,
+            batch_size=1)
+        batches = list(batches)
+        assert [batch["identifier"] for batch in batches] == [["161"],
+                                                              ["6329"]]
+        assert batches[0]["title"] == ["input title here for 161"]
+
+        with pytest.raises(BadValue):
+            myquery.iterQueryWorkitemsColumns(
+                query_str="valid_query_str",
+                projectarea_id="_CuZu0HUwEeKicpXBddtqNA",
+                batch_size=0)
+
+    def test_iter_saved_query_results(self, myrtcclient, mock_get_workitems):
+        myquery = myrtcclient.query
+
+        workitem1 = Workitem("http://test.url:9443/jazz/oslc/workitems/161",
+                             myrtcclient,
+                             workitem_id=161,
+                             raw_data=utils_test.workitem1)
+
+        query_workitems = myquery.iterSavedQueryResults("_1CR5MMfiEd6yW")
+        assert list(query_workitems) == [workitem1]
+        query_workitems = myrtcclient.iterSavedQueryResults("_1CR5MMfiEd6yW")
+        assert list(query_workitems) == [workitem1]
+
+        for invalid_id in [None, "", True, False]:
+            with pytest.raises(exception.BadValue):
+                myquery.iterSavedQueryResults(invalid_id)
@@ -0,0 +1,102 @@
+from collections import OrderedDict
+
+import pytest
+import requests
+
+import utils_test
+from rtcclient.record import (WorkitemRecord, _RECORD_CLASS_CACHE_SIZE,
+                              _get_record_class)
+from rtcclient.workitem import Workitem
+
+_WORKITEM_URL = "http://test.url:9443/jazz/oslc/workitems/161"
+
+
+@pytest.fixture
+def mock_get_workitems(mocker):
+    mocked_get = mocker.patch("requests.Session.get")
+    mock_resp = mocker.MagicMock(spec=requests.Response)
+    mock_resp.status_code = 200
+    mock_resp.content = utils_test.read_fixture("workitems.xml")
+    mocked_get.return_value = mock_resp
+    return mocked_get
+
+
+class TestWorkitemRecord:
+
+    def test_from_raw(self, rtcclient, mock_get_workitems):
+        record = WorkitemRecord.fromRaw(_WORKITEM_URL, rtcclient,
+                                        utils_test.workitem1)
+        assert not hasattr(record, "__dict__")
+        assert record.raw_data is None
+        assert str(record) == "161"
+        assert record.title == "input title here for 161"
+        assert record.creator == "tester1@email.com"
+        # no linked resources are requested until accessed
+        assert mock_get_workitems.call_count == 0
+
+        workitem = Workitem(_WORKITEM_URL,
+                            rtcclient,
+                            raw_data=utils_test.workitem1)
+        assert record.getLinkURL("severity") == workitem.getLinkURL(
+            "severity")
+
+        for attr in record.fields:
+            assert getattr(record, attr) == getattr(workitem, attr)
+        assert record.field_alias == workitem.field_alias
+
+        with pytest.raises(AttributeError):
+            record.title = "new title"
+        with pytest.raises(AttributeError):
+            record.fake_attr
+
+    def test_schema(self, rtcclient):
+        record1 = WorkitemRecord.fromRaw(_WORKITEM_URL, rtcclient,
+                                         utils_test.workitem1)
+        record2 = WorkitemRecord.fromRaw(_WORKITEM_URL, rtcclient,
+                                         utils_test.workitem1)
+        assert type(record1) is type(record2)
+        assert record1 == record2
+        # the short values are shared by the records
+        assert record1.created is record2.created
+
+        raw_data = utils_test.workitem1.copy()
+        raw_data.pop("dc:title")
+        record3 = WorkitemRecord.fromRaw(_WORKITEM_URL, rtcclient, raw_data)
+        assert type(record3) is not type(record1)
+        assert "title" not in record3.fields
+
+        # the same fields in another order share the schema
+        raw_data = OrderedDict(reversed(list(utils_test.workitem1.items())))
+        record4 = WorkitemRecord.fromRaw(_WORKITEM_URL, rtcclient, raw_data)
+        assert type(record4) is type(record1)
+
+    def test_schema_bounded(self, rtcclient):
+        for idx in range(_RECORD_CLASS_CACHE_SIZE + 10):
+            raw_data = OrderedDict([("dc:identifier", str(idx)),
+                                    ("rtc_cm:field%s" % idx, "value")])
+            assert WorkitemRecord.fromRaw(_WORKITEM_URL, rtcclient,
+                                          raw_data).fields == (
+                                              "field%s" % idx, "identifier")
+        assert (_get_record_class.cache_info().currsize ==
+                _RECORD_CLASS_CACHE_SIZE)
+
+    def test_to_workitem(self, rtcclient, mock_get_workitems, mocker):
+        workitem = Workitem(_WORKITEM_URL,
+                            rtcclient,
+                            raw_data=utils_test.workitem1)
+
+        record = WorkitemRecord.fromRaw(_WORKITEM_URL,
+                                        rtcclient,
+                                        utils_test.workitem1,
+                                        keep_raw=True)
+        assert record.raw_data is utils_test.workitem1
+        mock_get_workitems.reset_mock()
+        assert record.toWorkitem(lazy=True) == workitem
+        assert mock_get_workitems.call_count == 0
+
+        mocked_get_workitem = mocker.patch(
+            "rtcclient.client.RTCClient.getWorkitem", return_value=workitem)
+        record = WorkitemRecord.fromRaw(_WORKITEM_URL, rtcclient,
+                                        utils_test.workitem1)
+        assert record.toWorkitem() is workitem
+        mocked_get_workitem.assert_called_once_with("161", lazy=False)
@@ -0,0 +1,61 @@
+import pytest
+
+from rtcclient.exception import BadValue, EmptyAttrib
+from rtcclient.models import Member
+from rtcclient.registry import RESOURCE_TYPES, ResourceType
+from rtcclient.registry import parse_archived, register_resource_type
+from rtcclient.workitem import Workitem
+
+
+class TestResourceType:
+
+    def test_parse_archived(self):
+        assert parse_archived("true") is True
+        assert parse_archived(" True ") is True
+        assert parse_archived("false") is False
+        # never evaluated
+        assert parse_archived("__import__('os')") is False
+
+    def test_get_path(self):
+        assert RESOURCE_TYPES["ItemType"].getPath(
+            projectarea_id="pa") == "types/pa"
+        assert RESOURCE_TYPES["Query"].getPath(
+            projectarea_id="pa",
+            customized_attr="dc%3Atitle") == ("contexts/pa/workitems"
+                                              "?oslc_cm.query=dc%3Atitle")
+
+        with pytest.raises(EmptyAttrib):
+            RESOURCE_TYPES["Severity"].getPath()
+        with pytest.raises(EmptyAttrib):
+            RESOURCE_TYPES["Comment"].getPath(projectarea_id="pa")
+        with pytest.raises(EmptyAttrib):
+            RESOURCE_TYPES["Action"].getPath(projectarea_id="pa")
+
+    def test_resource_classes(self):
+        assert RESOURCE_TYPES["Subscriber"].resource_cls is Member
+        for resource_name in [
+                "Workitem", "Query", "RunQuery", "Parent", "Children"
+        ]:
+            resource_type = RESOURCE_TYPES[resource_name]
+            assert resource_type.resource_cls is Workitem
+            assert resource_type.workitem_url
+
+
+def test_register_resource_type(rtcclient, mocker):
+    with pytest.raises(BadValue):
+        rtcclient._get_paged_resources_url("Subscribers", workitem_id="161")
+
+    # restore the registry afterwards
+    mocker.patch.dict(RESOURCE_TYPES)
+    register_resource_type(
+        ResourceType("Subscribers",
+                     Member,
+                     "workitems/{workitem_id}/rtc_cm:subscribers",
+                     "rtc_cm:User",
+                     required=("workitem_id",)))
+    resource_url, entry_tag = rtcclient._get_paged_resources_url(
+        "Subscribers", workitem_id="161", page_size="10")
+    assert resource_url == ("http://test.url:9443/jazz/oslc/workitems/161/"
+                            "rtc_cm:subscribers?oslc_cm.pageSize=10"
+                            "&_startIndex=0")
+    assert entry_tag == "rtc_cm:User"
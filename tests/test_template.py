@@ -1,7 +1,11 @@
+import os
+
 import requests
 import pytest
 import utils_test
 from rtcclient.exception import BadValue
+from rtcclient.template import Templater
+from rtcclient.workitem import Workitem
 from jinja2 import exceptions as jinja2_excp
 import xmltodict
 
@@ -52,6 +56,53 @@ class TestTemplater:
             with pytest.raises(BadValue):
                 mytemplater.render(invalid_name)
 
+    def test_render_from_source(self, mytemplater):
+        temp_source = ("<root xmlns:dc=\"dc\">"
+                       "<dc:title>{{ title }}</dc:title>"
+                       "<dc:subject>{{ subject }}</dc:subject></root>")
+        assert mytemplater.listFieldsFromSource(temp_source) == set(
+            ["title", "subject"])
+        rendered = mytemplater.renderFromSource(temp_source, title="new title")
+        assert b"<dc:title>new title</dc:title>" in rendered
+        # the empty elements are removed
+        assert b"dc:subject" not in rendered
+
+    def test_template_cache(self, myrtcclient, tmp_path, mocker):
+        template_path = tmp_path / "task.template"
+        template_path.write_text(u"<title>{{ title }}</title>")
+        templater = Templater(myrtcclient, searchpath=str(tmp_path))
+        mocked_source = mocker.spy(templater.loader, "get_source")
+
+        assert templater.listFields("task.template") == set(["title"])
+        fields = templater.listFields("task.template")
+        # the cached fields are not changed by the callers
+        fields.add("fake_field")
+        for title in ["a", "b"]:
+            assert templater.render("task.template",
+                                    title=title,
+                                    description=None) == (
+                                        "<title>%s</title>" % title)
+        assert templater.listFields("task.template") == set(["title"])
+        assert mocked_source.call_count == 1
+
+        # the changed template file is compiled again
+        template_path.write_text(u"<title>{{ title }}{{ owner }}</title>")
+        stat = os.stat(str(template_path))
+        os.utime(str(template_path), (stat.st_atime, stat.st_mtime + 10))
+        assert templater.listFields("task.template") == set(
+            ["title", "owner"])
+        assert mocked_source.call_count == 2
+
+        # the template sources are cached by their hashes
+        mocked_compile = mocker.spy(templater.source_environment, "compile")
+        temp_source = u"<title>{{ title }}</title>"
+        assert templater.listFieldsFromSource(temp_source) == set(["title"])
+        for title in ["a", "b"]:
+            assert templater.renderFromSource(
+                temp_source, title=title) == b"<title>%s</title>" % (
+                    title.encode("utf-8"))
+        assert mocked_compile.call_count == 1
+
     def test_get_template(self, mytemplater, mocker):
         # invalid template names
         invalid_names = [None, True, False, "", u"", 123.4]
@@ -64,7 +115,7 @@ class TestTemplater:
                                         encoding="UTF-8")
 
         # valid template name
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.workitem1_raw
@@ -80,6 +131,63 @@ class TestTemplater:
             assert (list(xmltodict.parse(template_161).items()).sort() == list(
                 utils_test.template_ordereddict.items()).sort())
 
+    def test_derived_cache(self, mytemplater, mocker):
+        mocked_get = mocker.patch("requests.Session.get")
+        mock_resp = mocker.MagicMock(spec=requests.Response)
+        mock_resp.status_code = 200
+        mock_resp.content = utils_test.workitem1_raw
+        mocked_get.return_value = mock_resp
+
+        template_161 = mytemplater.getTemplate(161)
+        assert mytemplater.getTemplate("161") == template_161
+        assert mytemplater.listFieldsFromWorkitem(161) == set([
+            "severity", "title", "teamArea", "description", "filedAgainst",
+            "priority", "ownedBy", "plannedFor"
+        ])
+        assert "{{ ownedBy }}" not in mytemplater.getTemplate(161, keep=True)
+        raw_data = mytemplater.getWorkitemRaw(161)
+        raw_data["oslc_cm:ChangeRequest"].pop("dc:title")
+        # the workitem is only fetched once, and kept unchanged
+        assert mocked_get.call_count == 1
+        assert "dc:title" in mytemplater.getWorkitemRaw(
+            161)["oslc_cm:ChangeRequest"]
+
+        mytemplater.refresh("161")
+        assert mytemplater.getTemplate(161) == template_161
+        assert mocked_get.call_count == 2
+
+        # the changed workitem is fetched again
+        mocked_put = mocker.patch("requests.Session.put")
+        mocked_put.return_value.status_code = 200
+        workitem = Workitem("http://test.url:9443/jazz/oslc/workitems/161",
+                            mytemplater.rtc_obj,
+                            workitem_id=161,
+                            raw_data=utils_test.workitem1,
+                            lazy=True)
+        workitem.removeParent()
+        assert mytemplater.getTemplate(161) == template_161
+        assert mocked_get.call_count == 3
+
+    def test_derived_cache_ttl(self, myrtcclient, mocker):
+        mocked_get = mocker.patch("requests.Session.get")
+        mock_resp = mocker.MagicMock(spec=requests.Response)
+        mock_resp.status_code = 200
+        mock_resp.content = utils_test.workitem1_raw
+        mocked_get.return_value = mock_resp
+
+        templater = Templater(myrtcclient, ttl=0)
+        templater.getTemplate(161)
+        templater.getWorkitemRaw(161)
+        assert mocked_get.call_count == 2
+
+        templater = Templater(myrtcclient, ttl=None)
+        templater.getTemplate(161)
+        templater.getWorkitemRaw(161)
+        assert mocked_get.call_count == 3
+        templater.refresh()
+        templater.getTemplate(161)
+        assert mocked_get.call_count == 4
+
     def test_get_templates_exception(self, mytemplater):
         # invalid workitem ids
         invalid_names = [
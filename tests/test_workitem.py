@@ -23,7 +23,7 @@ class TestWorkitem:
 
     @pytest.fixture
     def mock_get_comments(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("comments.xml")
@@ -100,7 +100,7 @@ class TestWorkitem:
 
     @pytest.fixture
     def mock_get_subscribers(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         # mock_resp.content = utils_test.read_fixture("subscribers.xml")
@@ -113,7 +113,7 @@ class TestWorkitem:
 
     @pytest.fixture
     def mock_get_actions(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("actions.xml")
@@ -193,7 +193,7 @@ class TestWorkitem:
 
     @pytest.fixture
     def mock_get_states(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("states.xml")
@@ -230,7 +230,7 @@ class TestWorkitem:
 
     @pytest.fixture
     def mock_get_iib(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("includedinbuilds.xml")
@@ -295,7 +295,7 @@ class TestWorkitem:
 
     @pytest.fixture
     def mock_get_children(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("children.xml")
@@ -320,7 +320,7 @@ class TestWorkitem:
 
     @pytest.fixture
     def mock_get_parent(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("parent.xml")
@@ -338,7 +338,7 @@ class TestWorkitem:
 
     @pytest.fixture
     def mock_get_changesets(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("changesets.xml")
@@ -377,13 +377,54 @@ class TestWorkitem:
         changesets = workitem1.getChangeSets()
         assert changesets == [changeset1, changeset2, changeset3]
 
-    def test_add_attachment(self, myrtcclient, mocker, workitem1):
-        # TODO: add attachment test
-        pass
+    def test_add_attachment(self, myrtcclient, mocker, workitem1, tmp_path):
+        filepath = tmp_path / "test.txt"
+        filepath.write_bytes(b"attached")
+        mocker.patch("rtcclient.client.RTCClient.getFiledAgainst",
+                     return_value=mocker.MagicMock(
+                         url="http://test.url:9443/jazz/resource/itemOid/"
+                         "com.ibm.team.workitem.Category/_category"))
+        mocked_relogin = mocker.patch("rtcclient.client.RTCClient.relogin")
+        attachment_url = ("http://test.url:9443/jazz/resource/itemOid/"
+                          "com.ibm.team.workitem.Attachment/_attachment")
+
+        # the upload service replies with the HTML document
+        upload_rsp = mocker.MagicMock(spec=requests.Response)
+        upload_rsp.status_code = 200
+        upload_rsp.headers = {"Content-Type": "text/html; charset=UTF-8"}
+        upload_rsp.content = (
+            '<html><body><textarea>{"files": [{"url": "%s", "id": 12, '
+            '"name": "test.txt"}]}</textarea></body></html>' %
+            attachment_url).encode("utf-8")
+        link_rsp = mocker.MagicMock(spec=requests.Response)
+        link_rsp.status_code = 201
+        link_rsp.headers = {"Content-Type": "application/xml"}
+        link_rsp.content = ('<rtc_cm:Attachment xmlns:rtc_cm="rtc_cm" '
+                            'xmlns:dc="dc"><dc:identifier>12</dc:identifier>'
+                            '<dc:title>test.txt</dc:title>'
+                            '</rtc_cm:Attachment>')
+
+        def post(url, *args, **kwargs):
+            if "IAttachmentRestService" in url:
+                return upload_rsp
+            return link_rsp
+
+        mocked_post = mocker.patch("requests.Session.post", side_effect=post)
+
+        attachment = workitem1.addAttachment(str(filepath))
+        assert attachment.url == attachment_url
+        # the file is only uploaded once without relogin
+        upload_urls = [
+            call[0][0] for call in mocked_post.call_args_list
+            if "IAttachmentRestService" in call[0][0]
+        ]
+        assert len(upload_urls) == 1
+        assert mocked_post.call_count == 2
+        mocked_relogin.assert_not_called()
 
     @pytest.fixture
     def mock_get_attachments(self, mocker):
-        mocked_get = mocker.patch("requests.get")
+        mocked_get = mocker.patch("requests.Session.get")
         mock_resp = mocker.MagicMock(spec=requests.Response)
         mock_resp.status_code = 200
         mock_resp.content = utils_test.read_fixture("attachment.xml")